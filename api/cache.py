@@ -0,0 +1,252 @@
+"""
+In-process response cache for the Ballet API.
+
+Catalog data only changes when the scrapers store performances, so list and
+search responses are kept in memory and served again until they expire or
+the data changes. Entries are keyed by route and normalized query arguments
+and evicted in least-recently-used order. Compressed forms of a body are
+stored with it, so each is computed once per entry.
+
+Changes are detected through the per-collection version stamps that
+store_performances bumps in the database. The stamps are read at most once
+every version_check_interval seconds, and the whole cache is dropped as soon
+as one of them moves.
+"""
+
+import os
+import time
+import logging
+import functools
+import threading
+from collections import OrderedDict
+from flask import request, current_app
+
+from api.streaming import wants_stream
+from api.compression import negotiate_encoding, compress, set_encoded_body
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+# Maximum number of cached responses (0 disables the cache)
+RESPONSE_CACHE_SIZE = int(os.getenv('RESPONSE_CACHE_SIZE', 512))
+
+# Minimum delay between two reads of the data version stamps, in seconds
+RESPONSE_CACHE_VERSION_CHECK_INTERVAL = float(os.getenv('RESPONSE_CACHE_VERSION_CHECK_INTERVAL', 1))
+
+class ResponseCache:
+    """
+    Size-bounded LRU cache of successful Flask responses.
+    
+    Every entry has its own time to live, chosen per route with the cached
+    decorator.
+    """
+    
+    def __init__(self, version_source=None, max_entries=RESPONSE_CACHE_SIZE,
+                 version_check_interval=RESPONSE_CACHE_VERSION_CHECK_INTERVAL):
+        """
+        Create an empty cache.
+        
+        Args:
+            version_source (callable, optional): Returns a comparable stamp of
+                the current data, e.g. a tuple of collection versions
+            max_entries (int, optional): Maximum number of cached responses
+            version_check_interval (float, optional): Minimum delay between two
+                calls to version_source, in seconds
+        """
+        self.version_source = version_source
+        self.max_entries = max_entries
+        self.version_check_interval = version_check_interval
+        
+        # Key -> (expiry time, body, status code, mimetype, content coding -> compressed body)
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self._version = None
+        self._version_checked_at = None
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+    
+    def get(self, key):
+        """
+        Get a cached entry.
+        
+        Args:
+            key (tuple): Cache key
+        
+        Returns:
+            tuple: (body, status code, mimetype, content coding -> compressed
+                   body), or None on a miss
+        """
+        self._check_version()
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] <= now:
+                self._entries.pop(key, None)
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1:]
+    
+    def put(self, key, body, status, mimetype, ttl):
+        """
+        Store an entry, evicting the least recently used ones if needed.
+        
+        Args:
+            key (tuple): Cache key
+            body (bytes): Response body
+            status (int): Response status code
+            mimetype (str): Response mimetype
+            ttl (float): Time to live, in seconds
+        """
+        if self.max_entries <= 0 or ttl <= 0:
+            return
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl, body, status, mimetype, {})
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+    
+    def put_encoded(self, key, encoding, data):
+        """
+        Store the compressed form of a cached body.
+        
+        Args:
+            key (tuple): Cache key
+            encoding (str): Content coding
+            data (bytes): Compressed body
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                entry[4][encoding] = data
+    
+    def invalidate(self):
+        """
+        Drop every cached response.
+        
+        Called automatically when the data version changes; can also be called
+        directly after writing through a path that does not bump the version.
+        """
+        with self._lock:
+            self._entries.clear()
+            self.invalidations += 1
+    
+    def clear(self):
+        """
+        Drop every cached response and reset the counters and version stamp.
+        """
+        with self._lock:
+            self._entries.clear()
+            self._version = None
+            self._version_checked_at = None
+            self.hits = 0
+            self.misses = 0
+            self.invalidations = 0
+    
+    def get_version(self):
+        """
+        Get the data version the cache currently trusts.
+        
+        Returns:
+            The last value read from version_source, or None if it is unknown
+        """
+        self._check_version()
+        with self._lock:
+            return self._version
+    
+    def stats(self):
+        """
+        Get the cache counters.
+        
+        Returns:
+            dict: 'entries', 'hits', 'misses' and 'invalidations'
+        """
+        with self._lock:
+            return {
+                'entries': len(self._entries),
+                'hits': self.hits,
+                'misses': self.misses,
+                'invalidations': self.invalidations
+            }
+    
+    def _check_version(self):
+        """
+        Invalidate the cache if the data version moved since the last check.
+        """
+        if self.version_source is None:
+            return
+        
+        now = time.monotonic()
+        with self._lock:
+            if self._version_checked_at is not None and now - self._version_checked_at < self.version_check_interval:
+                return
+            self._version_checked_at = now
+        
+        try:
+            version = self.version_source()
+        except Exception as e:
+            # Never serve possibly stale data when the stamp cannot be read
+            logger.warning(f"Error reading data version, dropping response cache: {str(e)}")
+            with self._lock:
+                self._version = None
+                self._version_checked_at = None
+            self.invalidate()
+            return
+        
+        with self._lock:
+            changed = self._version is not None and version != self._version
+            self._version = version
+        if changed:
+            self.invalidate()
+    
+    def cached(self, ttl, vary=None):
+        """
+        Decorate a Flask view so its successful responses are cached.
+        
+        The cache key is the request path and its sorted query arguments,
+        plus the value of vary for responses that also depend on something
+        outside the request.
+        
+        Args:
+            ttl (float): Time to live of the route's responses, in seconds
+            vary (callable, optional): Returns a hashable value added to the
+                cache key of the current request
+        
+        Returns:
+            callable: The decorator
+        """
+        def decorator(view):
+            @functools.wraps(view)
+            def wrapper(*args, **kwargs):
+                # Streamed responses are never stored
+                if wants_stream():
+                    return view(*args, **kwargs)
+                
+                key = (request.path, tuple(sorted(request.args.items(multi=True))))
+                if vary is not None:
+                    key += (vary(),)
+                entry = self.get(key)
+                if entry is not None:
+                    body, status, mimetype, encoded = entry
+                    response = current_app.response_class(body, status=status, mimetype=mimetype)
+                else:
+                    response = current_app.make_response(view(*args, **kwargs))
+                    # Partial responses are marked no-store and not kept either
+                    if response.status_code != 200 or response.is_streamed or response.cache_control.no_store:
+                        return response
+                    body, mimetype, encoded = response.get_data(), response.mimetype, {}
+                    self.put(key, body, response.status_code, mimetype, ttl)
+                
+                # Compress once per entry and reuse the result
+                encoding = negotiate_encoding(len(body), mimetype)
+                if encoding is not None:
+                    data = encoded.get(encoding)
+                    if data is None:
+                        data = compress(body, encoding)
+                        self.put_encoded(key, encoding, data)
+                    set_encoded_body(response, data, encoding)
+                return response
+            return wrapper
+        return decorator
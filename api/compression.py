@@ -0,0 +1,154 @@
+"""
+Response compression for the Ballet API.
+
+JSON responses larger than COMPRESSION_MIN_SIZE bytes are compressed with
+brotli or gzip, whichever the client prefers among those available. Brotli
+is used only when the brotli package is installed.
+
+Compressed responses get the content coding appended to their ETag, so a
+compressed and an uncompressed body never share a strong validator.
+"""
+
+import os
+import gzip
+import logging
+from flask import request
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+# Responses smaller than this many bytes are sent uncompressed
+COMPRESSION_MIN_SIZE = int(os.getenv('COMPRESSION_MIN_SIZE', 1024))
+
+# Compression levels
+GZIP_LEVEL = int(os.getenv('GZIP_LEVEL', 6))
+BROTLI_QUALITY = int(os.getenv('BROTLI_QUALITY', 5))
+
+# Media types worth compressing
+COMPRESSIBLE_MIMETYPES = {'application/json', 'application/x-ndjson', 'text/html', 'text/plain'}
+
+# Available content codings, most preferred first
+ENCODINGS = ('br', 'gzip') if brotli is not None else ('gzip',)
+
+def compress(data, encoding):
+    """
+    Compress a response body.
+    
+    Args:
+        data (bytes): Body to compress
+        encoding (str): Content coding, one of ENCODINGS
+    
+    Returns:
+        bytes: Compressed body
+    """
+    if encoding == 'br':
+        return brotli.compress(data, quality=BROTLI_QUALITY)
+    return gzip.compress(data, compresslevel=GZIP_LEVEL)
+
+def negotiate_encoding(size, mimetype):
+    """
+    Choose the content coding for a body sent in reply to the current request.
+    
+    Args:
+        size (int): Body size in bytes
+        mimetype (str): Body media type
+    
+    Returns:
+        str: Content coding, or None to send the body uncompressed
+    """
+    if size < COMPRESSION_MIN_SIZE or mimetype not in COMPRESSIBLE_MIMETYPES:
+        return None
+    
+    # Highest client quality wins, ties go to the order of ENCODINGS
+    best, best_quality = None, 0
+    for encoding in ENCODINGS:
+        quality = request.accept_encodings[encoding]
+        if quality > best_quality:
+            best, best_quality = encoding, quality
+    return best
+
+def encoded_etag(etag, encoding):
+    """
+    Get the ETag of an encoded representation.
+    
+    Args:
+        etag (str): Unquoted ETag of the uncompressed body
+        encoding (str): Content coding
+    
+    Returns:
+        str: Unquoted ETag
+    """
+    return f'{etag}-{encoding}'
+
+def strip_encoding(etag):
+    """
+    Get the ETag of the uncompressed body from the ETag of any representation.
+    
+    Both codings are recognized even when brotli is not installed, since a
+    client may have received the brotli variant from another server.
+    
+    Args:
+        etag (str): Unquoted ETag, possibly with a content coding appended
+    
+    Returns:
+        str: Unquoted ETag without the content coding
+    """
+    for encoding in ('br', 'gzip'):
+        if etag.endswith(f'-{encoding}'):
+            return etag[:-len(encoding) - 1]
+    return etag
+
+def set_encoded_body(response, data, encoding):
+    """
+    Replace a response body with its compressed form.
+    
+    Args:
+        response (Response): Response to update
+        data (bytes): Compressed body
+        encoding (str): Content coding of data
+    """
+    response.set_data(data)
+    response.headers['Content-Encoding'] = encoding
+    response.vary.add('Accept-Encoding')
+
+def compress_response(response):
+    """
+    Compress a response if the client accepts it; registered with after_request.
+    
+    Bodies that were already encoded, e.g. from the response cache, are left
+    alone. Every encoded response gets its content coding appended to its ETag.
+    
+    Args:
+        response (Response): Outgoing response
+    
+    Returns:
+        Response: The same response
+    """
+    if response.mimetype in COMPRESSIBLE_MIMETYPES:
+        response.vary.add('Accept-Encoding')
+    
+    encoding = response.headers.get('Content-Encoding')
+    if encoding is None and response.status_code == 200 and not response.direct_passthrough and not response.is_streamed:
+        encoding = negotiate_encoding(response.content_length or 0, response.mimetype)
+        if encoding is not None:
+            set_encoded_body(response, compress(response.get_data(), encoding), encoding)
+    
+    etag = response.get_etag()[0]
+    if encoding in ENCODINGS and etag and not etag.endswith(f'-{encoding}'):
+        response.set_etag(encoded_etag(etag, encoding))
+    return response
+
+def init_compression(app):
+    """
+    Enable response compression for a Flask app.
+    
+    Args:
+        app (Flask): Application
+    """
+    app.after_request(compress_response)
+    logger.info(f"Response compression enabled ({', '.join(ENCODINGS)})")
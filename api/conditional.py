@@ -0,0 +1,176 @@
+"""
+Conditional GET support for the Ballet API.
+
+Responses carry a strong ETag built from the data version and the request
+(path and query arguments), and a Last-Modified date taken from the newest
+last_updated timestamp in the catalog. Requests whose If-None-Match or
+If-Modified-Since validators still hold are answered with 304 Not Modified
+before the view runs, so no document is read or serialized.
+"""
+
+import json
+import hashlib
+import logging
+import threading
+import functools
+from datetime import datetime, timezone
+from flask import request, current_app
+
+from api.streaming import wants_stream
+from api.compression import strip_encoding
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+# Format of the last_updated field written by the scrapers (local time)
+LAST_UPDATED_FORMAT = '%Y-%m-%d %H:%M:%S'
+
+def parse_last_updated(value):
+    """
+    Parse a last_updated timestamp.
+    
+    Args:
+        value (str): Timestamp in LAST_UPDATED_FORMAT, in the server's local time
+    
+    Returns:
+        datetime: Timezone-aware UTC datetime, or None if the value is not a timestamp
+    """
+    if isinstance(value, datetime):
+        parsed = value
+    else:
+        try:
+            parsed = datetime.strptime(value, LAST_UPDATED_FORMAT)
+        except (TypeError, ValueError):
+            return None
+    # Naive datetimes are interpreted as local time
+    return parsed.astimezone(timezone.utc)
+
+def make_etag(version, path, args, representation='json'):
+    """
+    Build the entity tag of a response.
+    
+    Args:
+        version: Data version the response was built from
+        path (str): Request path
+        args (list): (name, value) pairs of the query arguments
+        representation (str, optional): Name of the response format
+    
+    Returns:
+        str: Unquoted entity tag
+    """
+    payload = json.dumps([version, path, sorted(args), representation], default=str)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()[:32]
+
+class ConditionalGet:
+    """
+    Add ETag and Last-Modified validators to Flask views and answer
+    conditional requests with 304 Not Modified.
+    """
+    
+    def __init__(self, version_source, last_modified_source):
+        """
+        Create the helper.
+        
+        Args:
+            version_source (callable): Returns the current data version, or
+                None if it is unknown
+            last_modified_source (callable): Returns the newest modification
+                time of the data as an aware datetime, or None
+        """
+        self.version_source = version_source
+        self.last_modified_source = last_modified_source
+        
+        # Last-Modified only changes with the data version, so it is
+        # recomputed once per version
+        self._last_modified = (object(), None)
+        self._lock = threading.Lock()
+    
+    def get_last_modified(self, version):
+        """
+        Get the modification time of the data for a version.
+        
+        Args:
+            version: Data version
+        
+        Returns:
+            datetime: Aware UTC datetime truncated to seconds, or None
+        """
+        with self._lock:
+            cached_version, last_modified = self._last_modified
+        if cached_version == version:
+            return last_modified
+        
+        try:
+            last_modified = self.last_modified_source()
+        except Exception as e:
+            logger.warning(f"Error reading last modification time: {str(e)}")
+            return None
+        if last_modified is not None:
+            # HTTP dates have a one second resolution
+            last_modified = last_modified.replace(microsecond=0)
+        with self._lock:
+            self._last_modified = (version, last_modified)
+        return last_modified
+    
+    def clear(self):
+        """
+        Forget the memoized modification time.
+        """
+        with self._lock:
+            self._last_modified = (object(), None)
+    
+    def conditional(self, view):
+        """
+        Decorate a Flask view with conditional GET handling.
+        
+        Args:
+            view (callable): Flask view
+        
+        Returns:
+            callable: The wrapped view
+        """
+        @functools.wraps(view)
+        def wrapper(*args, **kwargs):
+            version = self.version_source()
+            if version is None:
+                return view(*args, **kwargs)
+            
+            representation = 'ndjson' if wants_stream() else 'json'
+            etag = make_etag(version, request.path, list(request.args.items(multi=True)), representation)
+            last_modified = self.get_last_modified(version)
+            
+            # If-None-Match takes precedence over If-Modified-Since
+            matched_etag = None
+            if request.if_none_match:
+                # Compressed responses carry an ETag with the content coding
+                # appended; the 304 echoes the variant the client holds
+                if request.if_none_match.star_tag:
+                    matched_etag = etag
+                else:
+                    matched_etag = next((
+                        tag for tag in sorted(request.if_none_match.as_set(include_weak=True))
+                        if strip_encoding(tag) == etag
+                    ), None)
+                not_modified = matched_etag is not None
+            else:
+                not_modified = (
+                    last_modified is not None
+                    and request.if_modified_since is not None
+                    and last_modified <= request.if_modified_since
+                )
+            
+            if not_modified:
+                response = current_app.response_class(status=304)
+            else:
+                response = current_app.make_response(view(*args, **kwargs))
+                # Partial responses must not be revalidated later, so they get no validators
+                if response.status_code != 200 or response.cache_control.no_store:
+                    return response
+            
+            response.set_etag(matched_etag or etag)
+            if last_modified is not None:
+                response.last_modified = last_modified
+            # Let clients keep the response but revalidate it before each use
+            response.cache_control.no_cache = True
+            return response
+        return wrapper
@@ -0,0 +1,169 @@
+"""
+Date-window filters for the Ballet API.
+
+List endpoints accept a 'status' query parameter (current, upcoming or past)
+and 'from' / 'to' ISO dates. They are translated into range conditions on
+the startDay / endDay day numbers written at ingest time (see
+scrapers.common.normalize), which the start_day_company and end_day indexes
+serve, so only the performances in the window are read instead of the whole
+catalog. Filtered lists are sorted by start date (DATE_SORT).
+
+Performances stored before ingest-time normalization have no day numbers
+and never match a window; run "python run.py backfill" to add them.
+"""
+
+from datetime import date, datetime, time, timezone
+
+from flask import request
+
+from scrapers.common.normalize import epoch_day
+
+# Values of the 'status' query parameter
+DATE_STATUSES = ('current', 'upcoming', 'past')
+
+# Sort order of date-filtered lists; served by the start_day_company index
+DATE_SORT = [('startDay', 1), ('company', 1), ('_id', 1)]
+
+def _parse_day(value, name):
+    """
+    Convert a query parameter holding an ISO date to a day number.
+    
+    Raises:
+        ValueError: If the value is not a YYYY-MM-DD date
+    """
+    day = epoch_day(value)
+    if day is None:
+        raise ValueError(f"Invalid '{name}' date: {value} (expected YYYY-MM-DD)")
+    return day
+
+def _bound(query, field, operator, value):
+    """
+    Add a range condition to a query, keeping the tighter of two bounds.
+    """
+    condition = query.setdefault(field, {})
+    if operator in condition:
+        value = max(condition[operator], value) if operator in ('$gt', '$gte') else min(condition[operator], value)
+    condition[operator] = value
+
+def parse_date_window(status=None, start=None, end=None, today=None):
+    """
+    Build the query selecting the performances in a date window.
+    
+    A performance is current when it started on or before today and ends
+    today or later, upcoming when it starts after today and past when it
+    ended before today. 'from' and 'to' keep the performances running at
+    some point between the two dates (both inclusive).
+    
+    Args:
+        status (str, optional): 'current', 'upcoming' or 'past'
+        start (str, optional): Value of the 'from' parameter, YYYY-MM-DD
+        end (str, optional): Value of the 'to' parameter, YYYY-MM-DD
+        today (date, optional): Reference date for the status, defaults to today
+    
+    Returns:
+        dict: Query on startDay and endDay, or None if no window was requested
+    
+    Raises:
+        ValueError: If the status or a date is invalid, or 'from' is after 'to'
+    """
+    if not status and not start and not end:
+        return None
+    
+    query = {}
+    if status:
+        if status not in DATE_STATUSES:
+            raise ValueError(f"Invalid status: {status} (expected one of {', '.join(DATE_STATUSES)})")
+        day = epoch_day((today or date.today()).isoformat())
+        if status == 'current':
+            _bound(query, 'startDay', '$lte', day)
+            _bound(query, 'endDay', '$gte', day)
+        elif status == 'upcoming':
+            _bound(query, 'startDay', '$gt', day)
+        else:
+            _bound(query, 'endDay', '$lt', day)
+    
+    start_day = _parse_day(start, 'from') if start else None
+    end_day = _parse_day(end, 'to') if end else None
+    if start_day is not None and end_day is not None and start_day > end_day:
+        raise ValueError("'from' must not be after 'to'")
+    if start_day is not None:
+        _bound(query, 'endDay', '$gte', start_day)
+    if end_day is not None:
+        _bound(query, 'startDay', '$lte', end_day)
+    return query
+
+def get_date_window(today=None):
+    """
+    Read the 'status', 'from' and 'to' query parameters of the current request.
+    
+    Args:
+        today (date, optional): Reference date for the status, defaults to today
+    
+    Returns:
+        dict: Query on startDay and endDay, or None if no window was requested
+    
+    Raises:
+        ValueError: If a parameter is invalid
+    """
+    return parse_date_window(
+        request.args.get('status', default='', type=str).strip().lower(),
+        request.args.get('from', default='', type=str).strip(),
+        request.args.get('to', default='', type=str).strip(),
+        today
+    )
+
+def dated_version(version_source):
+    """
+    Make a data version source change with the date as well.
+    
+    Status windows and the past/current flags depend on today's date, so
+    validators derived from the version must not outlive the day.
+    
+    Args:
+        version_source (callable): Returns the current data version, or None
+    
+    Returns:
+        callable: Returns (version, ISO date), or None if the version is unknown
+    """
+    def source():
+        version = version_source()
+        return None if version is None else (version, date.today().isoformat())
+    return source
+
+def dated_last_modified(last_modified_source):
+    """
+    Make a modification time source move to the start of the day as well.
+    
+    Like dated_version for If-Modified-Since: responses that depend on
+    today's date change at midnight even when no performance did.
+    
+    Args:
+        last_modified_source (callable): Returns the newest modification time
+            of the data as an aware datetime, or None
+    
+    Returns:
+        callable: Returns the later of that time and the start of today (UTC),
+            or None if the time is unknown
+    """
+    def source():
+        last_modified = last_modified_source()
+        if last_modified is None:
+            return None
+        # Naive datetimes are interpreted as local time, like date.today()
+        return max(last_modified, datetime.combine(date.today(), time.min).astimezone(timezone.utc))
+    return source
+
+def date_window_key():
+    """
+    Get the response cache key part of the current request's date window.
+    
+    Status windows are computed relative to today, so their cached responses
+    must not outlive the day. 'from' and 'to' are fixed dates and do not
+    need it.
+    
+    Returns:
+        int: Today's day number for status windows, otherwise None
+    """
+    if request.args.get('status', default='', type=str).strip():
+        return epoch_day(date.today().isoformat())
+    return None
@@ -0,0 +1,116 @@
+"""
+Concurrent per-collection fan-out for the Ballet API.
+
+Routes that read several company collections submit one task per
+collection to a shared, bounded thread pool, so their latency approaches
+that of the slowest collection instead of the sum of all of them. Each
+task has its own timeout; tasks that fail or time out are reported rather
+than failing the whole request, and the route answers with the results of
+the collections that did respond.
+"""
+
+import os
+import time
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+# Size of the shared worker pool
+FANOUT_MAX_WORKERS = int(os.getenv('FANOUT_MAX_WORKERS', 8))
+
+# Default time a per-collection task may take, in seconds
+FANOUT_TIMEOUT = float(os.getenv('FANOUT_TIMEOUT', 5))
+
+# Header listing the collections missing from a partial response
+PARTIAL_RESULTS_HEADER = 'X-Partial-Results'
+
+_executor = None
+_executor_lock = threading.Lock()
+
+def get_executor():
+    """
+    Get the shared worker pool, creating it on first use.
+    
+    Returns:
+        ThreadPoolExecutor: Worker pool
+    """
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(max_workers=FANOUT_MAX_WORKERS, thread_name_prefix='fanout')
+        return _executor
+
+class FanOutResult:
+    """
+    Outcome of a fan-out: the results of the tasks that completed and the
+    reasons the others did not.
+    """
+    
+    def __init__(self):
+        # Task name -> return value, in submission order
+        self.results = {}
+        # Task name -> error message ('timeout' for tasks that ran out of time)
+        self.failures = {}
+    
+    @property
+    def partial(self):
+        """Whether some tasks failed or timed out."""
+        return bool(self.failures)
+
+def fan_out(tasks, timeout=FANOUT_TIMEOUT):
+    """
+    Run tasks concurrently on the shared worker pool.
+    
+    Every task's timeout counts from the moment it is submitted. Tasks that
+    time out are cancelled if they have not started yet; a running task
+    keeps its worker until it returns, but its result is discarded.
+    
+    Args:
+        tasks (dict): Task name (usually a collection name) -> callable taking no arguments
+        timeout (float or dict, optional): Seconds each task may take, or
+            task name -> seconds (FANOUT_TIMEOUT for missing names)
+    
+    Returns:
+        FanOutResult: Results and failures keyed by task name
+    """
+    executor = get_executor()
+    submitted = time.monotonic()
+    futures = {name: executor.submit(task) for name, task in tasks.items()}
+    
+    outcome = FanOutResult()
+    for name, future in futures.items():
+        task_timeout = timeout.get(name, FANOUT_TIMEOUT) if isinstance(timeout, dict) else timeout
+        remaining = max(0.0, submitted + task_timeout - time.monotonic())
+        try:
+            outcome.results[name] = future.result(timeout=remaining)
+        except FutureTimeoutError:
+            future.cancel()
+            outcome.failures[name] = 'timeout'
+            logger.warning(f"{name} did not respond within {task_timeout}s")
+        except Exception as e:
+            outcome.failures[name] = str(e)
+            logger.warning(f"Error reading {name}: {str(e)}")
+    return outcome
+
+def report_failures(response, failures):
+    """
+    Mark a response built from partial results.
+    
+    The missing collections are listed in the PARTIAL_RESULTS_HEADER header,
+    and the response is marked no-store so neither the response cache nor
+    HTTP caches keep it.
+    
+    Args:
+        response (Response): Response built from the results that completed
+        failures (dict): Task name -> error message
+    
+    Returns:
+        Response: The same response
+    """
+    if failures:
+        response.headers[PARTIAL_RESULTS_HEADER] = ', '.join(sorted(failures))
+        response.cache_control.no_store = True
+    return response
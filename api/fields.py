@@ -0,0 +1,146 @@
+"""
+Sparse fieldsets for the Ballet API.
+
+List endpoints accept a 'fields' query parameter naming the performance
+fields to return, either as a comma-separated list ("title,venue") or as
+one of the predefined views in FIELD_VIEWS. Requested fields are checked
+against FIELD_WHITELIST and pushed down to the database as a projection,
+so long fields such as descriptions are neither read nor serialized when
+a listing does not need them.
+"""
+
+from flask import request
+
+# Performance fields clients may request
+FIELD_WHITELIST = frozenset([
+    'title', 'company', 'company_id', 'date', 'startDate', 'endDate',
+    'venue', 'url', 'thumbnail', 'image', 'images', 'description', 'details', 'cast', 'composer',
+    'video_links', 'ballet_type', 'age_restriction', 'source', 'last_updated'
+])
+
+# Stored bookkeeping fields that are never returned: the scrapers' content
+# hash and the ingest-time date normalization. They are still read where the
+# API needs them (date windows, cursors, transform memo keys).
+INTERNAL_FIELDS = frozenset(['content_hash', 'date_parse_method', 'startDay', 'endDay'])
+
+# Predefined views; None selects every field
+FIELD_VIEWS = {
+    'summary': ('title', 'company', 'company_id', 'date', 'startDate', 'endDate', 'venue', 'thumbnail', 'url'),
+    'detail': None
+}
+
+# Stored fields a requested field is computed from
+SOURCE_FIELDS = {
+    'startDate': ('date', 'startDay', 'endDay'),
+    'endDate': ('date', 'startDay', 'endDay'),
+    'thumbnail': ('image',)
+}
+
+# Read with every sparse fieldset; marks documents normalized at ingest time
+ALWAYS_READ_FIELDS = ('date_parse_method',)
+
+# Frontend fields the legacy transforms derive from a stored field
+DERIVED_FIELDS = {
+    'url': ('id',),
+    'thumbnail': ('image',),
+    'startDate': ('isPast', 'isCurrent', 'isNext'),
+    'endDate': ('isPast', 'isCurrent', 'isNext'),
+    'video_links': ('videoUrl',),
+    'ballet_type': ('balletType',),
+    'age_restriction': ('ageRestriction',)
+}
+
+def parse_fields(value):
+    """
+    Parse the value of a 'fields' query parameter.
+    
+    Args:
+        value (str): View name or comma-separated field names
+    
+    Returns:
+        tuple: Requested fields in request order, or None for every field
+    
+    Raises:
+        ValueError: If a field is not in FIELD_WHITELIST
+    """
+    value = (value or '').strip()
+    if not value:
+        return None
+    if value in FIELD_VIEWS:
+        return FIELD_VIEWS[value]
+    
+    fields = []
+    for field in value.split(','):
+        field = field.strip()
+        if field and field not in fields:
+            fields.append(field)
+    
+    unknown = [field for field in fields if field not in FIELD_WHITELIST]
+    if unknown:
+        raise ValueError(f"Unknown fields: {', '.join(unknown)}")
+    return tuple(fields) or None
+
+def get_requested_fields():
+    """
+    Read the 'fields' query parameter of the current request.
+    
+    Returns:
+        tuple: Requested fields, or None for every field
+    
+    Raises:
+        ValueError: If a field is not in FIELD_WHITELIST
+    """
+    return parse_fields(request.args.get('fields', default='', type=str))
+
+def make_projection(fields, sort=None, include_id=True):
+    """
+    Build the database projection reading the requested fields.
+    
+    Fields the requested ones are computed from, ALWAYS_READ_FIELDS and the
+    sort fields needed to encode continuation cursors are read as well;
+    select_fields drops them again from the response.
+    
+    Args:
+        fields (tuple): Requested fields, or None for every field
+        sort (list, optional): List of (field, direction) pairs of the query
+        include_id (bool, optional): Whether to read the _id field
+    
+    Returns:
+        dict: Projection, or None for every field including _id
+    """
+    if fields is None:
+        return None if include_id else {'_id': 0}
+    
+    projection = {field: 1 for field in ALWAYS_READ_FIELDS}
+    for field in fields:
+        projection[field] = 1
+        for source in SOURCE_FIELDS.get(field, ()):
+            projection[source] = 1
+    for field, _ in sort or []:
+        if field != '_id':
+            projection[field] = 1
+    if not include_id:
+        projection['_id'] = 0
+    return projection
+
+def select_fields(document, fields):
+    """
+    Keep the requested fields of a response document.
+    
+    Fields derived from a requested field (see DERIVED_FIELDS) are kept too,
+    and INTERNAL_FIELDS are always dropped.
+    
+    Args:
+        document (dict): Response document
+        fields (tuple): Requested fields, or None for every field
+    
+    Returns:
+        dict: A new document with the requested fields
+    """
+    if fields is None:
+        return {field: value for field, value in document.items() if field not in INTERNAL_FIELDS}
+    
+    kept = set(fields)
+    for field in fields:
+        kept.update(DERIVED_FIELDS.get(field, ()))
+    return {field: value for field, value in document.items() if field in kept}
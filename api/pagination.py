@@ -0,0 +1,83 @@
+"""
+Keyset pagination helpers for the Ballet API.
+
+A continuation cursor records the sort key of the last document of a page.
+The next page is fetched with a range query on that key instead of skipping
+over the previous pages, so every page costs the same and documents added
+in the meantime do not shift the results.
+"""
+
+import base64
+import binascii
+
+from bson import json_util
+
+def encode_cursor(document, sort):
+    """
+    Build an opaque cursor positioned after a document.
+    
+    Args:
+        document (dict): Last document of the page, including the sort fields
+        sort (list): List of (field, 1) pairs the page was sorted by
+    
+    Returns:
+        str: URL-safe cursor token
+    """
+    payload = {
+        'sort': [field for field, _ in sort],
+        'after': [document.get(field) for field, _ in sort]
+    }
+    return base64.urlsafe_b64encode(json_util.dumps(payload).encode('utf-8')).decode('ascii').rstrip('=')
+
+def decode_cursor(token, sort):
+    """
+    Read the sort key stored in a cursor.
+    
+    Args:
+        token (str): Cursor from encode_cursor
+        sort (list): Sort the current request uses
+    
+    Returns:
+        list: Sort key values of the last document already returned
+    
+    Raises:
+        ValueError: If the token is malformed or was issued for another sort
+    """
+    try:
+        padded = token + '=' * (-len(token) % 4)
+        payload = json_util.loads(base64.urlsafe_b64decode(padded.encode('ascii')).decode('utf-8'))
+    except (ValueError, TypeError, binascii.Error, UnicodeError):
+        raise ValueError("Invalid cursor")
+    
+    if not isinstance(payload, dict) or payload.get('sort') != [field for field, _ in sort]:
+        raise ValueError("Invalid cursor")
+    after = payload.get('after')
+    if not isinstance(after, list) or len(after) != len(sort):
+        raise ValueError("Invalid cursor")
+    return after
+
+def keyset_query(query, sort, after):
+    """
+    Restrict a query to the documents that sort after a key.
+    
+    For an ascending sort on (a, b, c) and a key (x, y, z) this matches
+    a > x, or a = x and b > y, or a = x and b = y and c > z. Null values
+    sort first, so "greater than null" means "not null".
+    
+    Args:
+        query (dict): Base query
+        sort (list): List of (field, 1) pairs
+        after (list): Sort key values to start after
+    
+    Returns:
+        dict: The combined query
+    """
+    branches = []
+    for index, (field, _) in enumerate(sort):
+        branch = {previous: after[position] for position, (previous, _) in enumerate(sort[:index])}
+        value = after[index]
+        branch[field] = {'$ne': None} if value is None else {'$gt': value}
+        branches.append(branch)
+    
+    keyset = {'$or': branches}
+    return {'$and': [query, keyset]} if query else keyset
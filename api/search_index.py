@@ -0,0 +1,251 @@
+"""
+In-memory full-text search index for the Ballet API.
+
+Performances are tokenized into an inverted index over their title,
+description, composer, venue and cast, and queries are ranked with BM25.
+Accents are folded ("La Bayadère" matches "bayadere") and every query term
+also matches the indexed terms it is a prefix of ("coppel" matches
+"Coppélia").
+
+The index follows the per-collection data version stamps: a collection is
+re-read only when its version moved, and only performances whose content
+hash changed are tokenized again.
+"""
+
+import re
+import math
+import bisect
+import logging
+import threading
+import unicodedata
+
+from scrapers.common.db import compute_content_hash
+from scrapers.common.storage.base import TEXT_STOP_WORDS, stem, sort_key
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+# Indexed fields and their weights in term frequencies
+SEARCH_INDEX_WEIGHTS = {'title': 5, 'composer': 2, 'cast': 2, 'venue': 1, 'description': 1}
+
+# BM25 parameters
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+# Query terms shorter than this only match whole terms
+MIN_PREFIX_LENGTH = 3
+
+# Weight of a term matched through a prefix relative to an exact match
+PREFIX_MATCH_WEIGHT = 0.5
+
+def fold(text):
+    """
+    Lowercase text and strip its accents.
+    
+    Args:
+        text (str): Text to fold
+    
+    Returns:
+        str: Folded text
+    """
+    decomposed = unicodedata.normalize('NFKD', text)
+    return ''.join(char for char in decomposed if not unicodedata.combining(char)).lower()
+
+def tokenize(text):
+    """
+    Split text into folded, stemmed terms, without stop words.
+    
+    Args:
+        text (str): Text to split
+    
+    Returns:
+        list: Terms
+    """
+    return [stem(word) for word in re.findall(r'\w+', fold(text)) if word not in TEXT_STOP_WORDS]
+
+def _field_text(value):
+    """
+    Collect the strings of a field value, which may be a list or a dictionary.
+    """
+    if isinstance(value, str):
+        return [value]
+    if isinstance(value, dict):
+        value = list(value.values())
+    if isinstance(value, list):
+        return [text for item in value for text in _field_text(item)]
+    return []
+
+class SearchIndex:
+    """
+    Inverted index over the performances of several collections.
+    
+    Documents are identified by (collection name, _id).
+    """
+    
+    def __init__(self, load_collection):
+        """
+        Create an empty index.
+        
+        Args:
+            load_collection (callable): Takes a collection name and returns an
+                iterable of its documents, including _id
+        """
+        self.load_collection = load_collection
+        self._lock = threading.Lock()
+        self.clear()
+    
+    def clear(self):
+        """
+        Drop every indexed document.
+        """
+        with self._lock:
+            # Collection name -> version the collection was indexed at
+            self._versions = {}
+            # Key -> document, content hash, weighted term frequencies and length
+            self._documents = {}
+            self._hashes = {}
+            self._frequencies = {}
+            self._lengths = {}
+            self._total_length = 0
+            # Term -> key -> weighted term frequency
+            self._postings = {}
+            self._vocabulary = None
+    
+    def __len__(self):
+        return len(self._documents)
+    
+    def refresh(self, versions):
+        """
+        Re-index the collections whose version changed.
+        
+        Args:
+            versions (dict): Collection name -> current data version
+        """
+        with self._lock:
+            for collection_name, version in versions.items():
+                if collection_name in self._versions and self._versions[collection_name] == version:
+                    continue
+                self._index_collection(collection_name)
+                self._versions[collection_name] = version
+    
+    def search(self, text, collection_names, query=None, sort=None, skip=0, limit=0):
+        """
+        Rank the documents of some collections against a search text.
+        
+        Args:
+            text (str): Search text
+            collection_names (list): Collections to search
+            query (dict, optional): Field values the documents must have,
+                e.g. {'company_id': ...}
+            sort (list, optional): List of (field, 1) pairs breaking score ties
+            skip (int, optional): Number of results to skip
+            limit (int, optional): Maximum number of results (0 for no limit)
+        
+        Returns:
+            tuple: (total number of matches, list of documents with a 'score' field)
+        """
+        collections = set(collection_names)
+        query = query or {}
+        with self._lock:
+            scores = self._score(tokenize(text))
+            matches = [
+                (score, self._documents[key]) for key, score in scores.items()
+                if key[0] in collections
+                and all(self._documents[key].get(field) == value for field, value in query.items())
+            ]
+        
+        matches.sort(key=lambda match: (-match[0],) + sort_key(match[1], sort or []))
+        page = matches[skip:skip + limit] if limit else matches[skip:]
+        return len(matches), [dict(document, score=score) for score, document in page]
+    
+    def _index_collection(self, collection_name):
+        """
+        Bring a collection's documents up to date, re-tokenizing only changed ones.
+        """
+        seen = set()
+        changed = 0
+        for document in self.load_collection(collection_name):
+            key = (collection_name, str(document['_id']))
+            seen.add(key)
+            content_hash = document.get('content_hash') or compute_content_hash(document)
+            if self._hashes.get(key) == content_hash:
+                self._documents[key] = document
+                continue
+            self._remove(key)
+            self._add(key, document, content_hash)
+            changed += 1
+        
+        removed = [key for key in self._documents if key[0] == collection_name and key not in seen]
+        for key in removed:
+            self._remove(key)
+        logger.info(f"Indexed {collection_name} for search ({changed} changed, {len(removed)} removed)")
+    
+    def _add(self, key, document, content_hash):
+        frequencies = {}
+        length = 0
+        for field, weight in SEARCH_INDEX_WEIGHTS.items():
+            for value in _field_text(document.get(field)):
+                for term in tokenize(value):
+                    frequencies[term] = frequencies.get(term, 0) + weight
+                    length += weight
+        
+        for term, frequency in frequencies.items():
+            if term not in self._postings:
+                self._postings[term] = {}
+                self._vocabulary = None
+            self._postings[term][key] = frequency
+        
+        self._documents[key] = document
+        self._hashes[key] = content_hash
+        self._frequencies[key] = frequencies
+        self._lengths[key] = length
+        self._total_length += length
+    
+    def _remove(self, key):
+        if key not in self._documents:
+            return
+        for term in self._frequencies.pop(key):
+            postings = self._postings[term]
+            del postings[key]
+            if not postings:
+                del self._postings[term]
+                self._vocabulary = None
+        self._total_length -= self._lengths.pop(key)
+        del self._documents[key]
+        del self._hashes[key]
+    
+    def _expand(self, term):
+        """
+        Get the indexed terms a query term matches, with their weights.
+        """
+        if len(term) < MIN_PREFIX_LENGTH:
+            return [(term, 1.0)] if term in self._postings else []
+        
+        if self._vocabulary is None:
+            self._vocabulary = sorted(self._postings)
+        expansions = []
+        start = bisect.bisect_left(self._vocabulary, term)
+        for candidate in self._vocabulary[start:]:
+            if not candidate.startswith(term):
+                break
+            expansions.append((candidate, 1.0 if candidate == term else PREFIX_MATCH_WEIGHT))
+        return expansions
+    
+    def _score(self, terms):
+        """
+        Compute the BM25 score of every document matching at least one term.
+        """
+        count = len(self._documents)
+        if not count:
+            return {}
+        average_length = self._total_length / count or 1
+        
+        scores = {}
+        for term in set(terms):
+            for candidate, weight in self._expand(term):
+                postings = self._postings[candidate]
+                idf = math.log(1 + (count - len(postings) + 0.5) / (len(postings) + 0.5))
+                for key, frequency in postings.items():
+                    norm = BM25_K1 * (1 - BM25_B + BM25_B * self._lengths[key] / average_length)
+                    scores[key] = scores.get(key, 0.0) + weight * idf * frequency * (BM25_K1 + 1) / (frequency + norm)
+        return scores
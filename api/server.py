@@ -6,13 +6,33 @@ different ballet companies.
 """
 
 import os
+import re
 import json
+import time
+import heapq
 import logging
+import threading
+from itertools import islice
 from datetime import datetime
 from flask import Flask, jsonify, request, abort
 from flask_cors import CORS
-from pymongo import MongoClient
 from dotenv import load_dotenv
+from bson import ObjectId
+
+from scrapers.common.db import PERFORMANCES_COLLECTION, UNIFIED_COLLECTION_ENABLED
+from scrapers.common.indexes import INDEX_MANIFEST
+from scrapers.common.storage import get_storage_backend
+from scrapers.common.storage.base import sort_key, text_terms
+from scrapers.common.instrumentation import register_command_listener, get_command_stats
+from api.pagination import encode_cursor, decode_cursor, keyset_query
+from api.cache import ResponseCache
+from api.conditional import ConditionalGet, parse_last_updated
+from api.search_index import SearchIndex, tokenize
+from api.streaming import wants_stream, ndjson_response
+from api.compression import init_compression
+from api.fields import get_requested_fields, make_projection, select_fields
+from api.fanout import fan_out, report_failures
+from api.date_window import DATE_SORT, get_date_window, dated_version, dated_last_modified, date_window_key
 
 # Load environment variables
 load_dotenv()
@@ -21,26 +41,292 @@ load_dotenv()
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
-# MongoDB connection settings
-MONGODB_URI = os.getenv('MONGODB_URI')
-DATABASE_NAME = os.getenv('DATABASE_NAME')
+# Collection names
 POB_COLLECTION = os.getenv('COLLECTION_NAME', 'paris_opera_ballet')
 BOLSHOI_COLLECTION = os.getenv('BOLSHOI_COLLECTION_NAME', 'bolshoi_ballet')
 BOSTON_COLLECTION = os.getenv('BOSTON_COLLECTION_NAME', 'boston_ballet')
 
+# Collections whose version stamps and timestamps describe the API's data
+DATA_COLLECTIONS = [POB_COLLECTION, BOLSHOI_COLLECTION, BOSTON_COLLECTION, PERFORMANCES_COLLECTION]
+
+# Sort order of the listings, shared by the per-company collections so their
+# results can be merged and by the unified collection so pages and cursors do
+# not depend on the layout; served by the start_date_company index
+MERGE_SORT = [('startDate', 1), ('company', 1), ('_id', 1)]
+
+# Search modes: 'index' ranks matches with the in-process search index,
+# 'text' with the database text index, 'literal' matches the query as a
+# case-insensitive substring
+SEARCH_MODES = ('index', 'text', 'literal')
+SEARCH_MODE = os.getenv('SEARCH_MODE', 'index').lower()
+
+# Sort identifying ranked search pages; their cursors record an offset
+TEXT_CURSOR_SORT = [('offset', 1)]
+
+# How long collection counts are reused for the 'total' field, in seconds
+COUNT_CACHE_TTL = float(os.getenv('COUNT_CACHE_TTL', 30))
+
+# How long list and search responses are served from the response cache, in seconds
+PERFORMANCES_CACHE_TTL = float(os.getenv('PERFORMANCES_CACHE_TTL', 300))
+SEARCH_CACHE_TTL = float(os.getenv('SEARCH_CACHE_TTL', 60))
+
+# Maximum number of performances a batch lookup may request
+BATCH_GET_MAX_ITEMS = int(os.getenv('BATCH_GET_MAX_ITEMS', 100))
+
 # Create Flask app
 app = Flask(__name__)
 CORS(app)  # Enable CORS for all routes
+init_compression(app)
 
-# Connect to MongoDB
+# Time MongoDB commands; must be registered before the first client is created
+register_command_listener()
+
+# Open the configured storage backend
 try:
-    client = MongoClient(MONGODB_URI)
-    db = client[DATABASE_NAME]
-    logger.info("Connected to MongoDB")
+    storage = get_storage_backend()
+    logger.info(f"Using {storage.name} storage backend")
 except Exception as e:
-    logger.error(f"Failed to connect to MongoDB: {str(e)}")
+    logger.error(f"Failed to open storage backend: {str(e)}")
     raise
 
+# (collection name, serialized query) -> (expiry time, count)
+_count_cache = {}
+_count_cache_lock = threading.Lock()
+
+def cached_count(collection_name, query=None):
+    """
+    Count the documents matching a query, reusing recent results.
+    
+    Args:
+        collection_name (str): Name of the collection
+        query (dict, optional): Query (defaults to all documents)
+    
+    Returns:
+        int: Number of matching documents, at most COUNT_CACHE_TTL seconds old
+    """
+    key = (collection_name, json.dumps(query or {}, sort_keys=True, default=str))
+    now = time.monotonic()
+    with _count_cache_lock:
+        entry = _count_cache.get(key)
+    if entry is not None and entry[0] > now:
+        return entry[1]
+    
+    count = storage.count(collection_name, query)
+    with _count_cache_lock:
+        _count_cache[key] = (now + COUNT_CACHE_TTL, count)
+    return count
+
+def clear_count_cache():
+    """Forget all cached counts."""
+    with _count_cache_lock:
+        _count_cache.clear()
+
+def get_data_versions():
+    """
+    Get the version stamps of every collection the API reads.
+    
+    Returns:
+        tuple: One version per collection
+    """
+    return tuple(storage.get_data_version(collection_name) for collection_name in DATA_COLLECTIONS)
+
+def get_last_modified():
+    """
+    Get the newest last_updated timestamp of the collections the API reads.
+    
+    Returns:
+        datetime: Aware UTC datetime, or None if no performance has one
+    """
+    newest = None
+    for collection_name in DATA_COLLECTIONS:
+        documents = storage.find(
+            collection_name, {'last_updated': {'$ne': None}}, {'_id': 0, 'last_updated': 1},
+            sort=[('last_updated', -1)], limit=1
+        )
+        for document in documents:
+            last_modified = parse_last_updated(document['last_updated'])
+            if last_modified is not None and (newest is None or last_modified > newest):
+                newest = last_modified
+    return newest
+
+# Responses are dropped as soon as a scrape changes the stored performances
+response_cache = ResponseCache(get_data_versions)
+
+# In-process search index, refreshed when the version stamps move
+search_index = SearchIndex(lambda collection_name: storage.find(collection_name))
+
+# ETags follow the version the response cache trusts, so a cached body never
+# goes out with a newer tag
+conditional_get = ConditionalGet(dated_version(response_cache.get_version), dated_last_modified(get_last_modified))
+
+def iter_merged(collection_names, query, skip, limit, sort=MERGE_SORT, after=None, fields=None):
+    """
+    Lazily iterate over the documents matching a query across several collections.
+    
+    Each collection returns at most skip + limit documents sorted by the
+    sort specification, and the sorted cursors are merged with a heap, so
+    documents are read from the cursors only as they are consumed.
+    
+    Args:
+        collection_names (list): Names of the collections to read
+        query (dict): Query applied to every collection
+        skip (int): Number of merged documents to skip
+        limit (int): Maximum number of documents (0 for no limit)
+        sort (list, optional): List of (field, 1) pairs identifying each document
+        after (list, optional): Sort key of the last document already returned
+        fields (tuple, optional): Fields to read, or None for every field
+    
+    Returns:
+        iterator: Documents in sort order, including their _id and sort fields
+    """
+    if after is not None:
+        query = keyset_query(query, sort, after)
+    projection = make_projection(fields, sort)
+    
+    if len(collection_names) == 1:
+        return storage.find(collection_names[0], query, projection, sort=sort, skip=skip, limit=limit)
+    
+    cursors = [
+        storage.find(collection_name, query, projection, sort=sort, limit=skip + limit if limit else 0)
+        for collection_name in collection_names
+    ]
+    merged = heapq.merge(*cursors, key=lambda document: sort_key(document, sort))
+    return islice(merged, skip, skip + limit if limit else None)
+
+def merge_collections(collection_names, query, skip, limit, sort=MERGE_SORT, after=None, fields=None):
+    """
+    Get one page of the documents matching a query across several collections.
+    
+    Each collection's share of the page is read like in iter_merged, so the
+    cost depends on the page position rather than on the size of the
+    collections, and the collections are read concurrently. With a cursor
+    position the page starts right after it and is served by an index
+    range scan. Collections that fail or time out are left out of the page
+    and reported.
+    
+    Args:
+        collection_names (list): Names of the collections to read
+        query (dict): Query applied to every collection
+        skip (int): Number of merged documents to skip
+        limit (int): Maximum number of documents to return
+        sort (list, optional): List of (field, 1) pairs identifying each document
+        after (list, optional): Sort key of the last document already returned
+        fields (tuple, optional): Fields to return, or None for every field
+    
+    Returns:
+        tuple: (documents without their _id, cursor for the next page or None,
+            collection name -> error message for the collections left out)
+    """
+    failures = {}
+    if len(collection_names) == 1:
+        documents = list(iter_merged(collection_names, query, skip, limit, sort=sort, after=after, fields=fields))
+    else:
+        outcome = fan_out({
+            collection_name: lambda collection_name=collection_name: list(iter_merged(
+                [collection_name], query, 0, skip + limit if limit else 0, sort=sort, after=after, fields=fields
+            ))
+            for collection_name in collection_names
+        })
+        merged = heapq.merge(*outcome.results.values(), key=lambda document: sort_key(document, sort))
+        documents = list(islice(merged, skip, skip + limit if limit else None))
+        failures = outcome.failures
+    
+    # A full page may be followed by more documents
+    next_cursor = None
+    if limit and len(documents) == limit:
+        next_cursor = encode_cursor(documents[-1], sort)
+    
+    for document in documents:
+        document.pop('_id', None)
+    return [select_fields(document, fields) for document in documents], next_cursor, failures
+
+def page_response(page, failures):
+    """
+    Build the JSON response of a page read from several collections.
+    
+    Args:
+        page (dict): Response body
+        failures (dict): Collection name -> error message for the collections
+            missing from the page; listed as 'failed_collections' when present
+    
+    Returns:
+        Response: JSON response, marked as partial if a collection is missing
+    """
+    if failures:
+        page['failed_collections'] = sorted(failures)
+    return report_failures(jsonify(page), failures)
+
+def get_collection_name(company_id):
+    """
+    Get the collection holding a company's performances.
+    
+    Args:
+        company_id (str): Company ID, e.g. 'paris_opera_ballet'
+    
+    Returns:
+        str: Collection name; the unified collection when it is enabled
+    """
+    if UNIFIED_COLLECTION_ENABLED:
+        return PERFORMANCES_COLLECTION
+    if company_id == 'paris_opera_ballet':
+        return POB_COLLECTION
+    if company_id == 'bolshoi_ballet':
+        return BOLSHOI_COLLECTION
+    return BOSTON_COLLECTION
+
+def get_company_collection(company_id, query=None):
+    """
+    Get the collection and query reading a company's performances.
+    
+    Args:
+        company_id (str): Company ID, e.g. 'paris_opera_ballet'
+        query (dict, optional): Query to scope to the company
+    
+    Returns:
+        tuple: (collection name, query); in the unified collection the query
+            also matches the company_id
+    """
+    query = dict(query or {})
+    if UNIFIED_COLLECTION_ENABLED:
+        query['company_id'] = company_id
+    return get_collection_name(company_id), query
+
+def stored_ids(performance_id):
+    """
+    Get the forms a performance ID may be stored in.
+    
+    MongoDB upserts assign ObjectId _ids, while the other backends store the
+    same 24 hex characters as strings, so IDs of that shape are matched in
+    both forms.
+    
+    Args:
+        performance_id (str): Performance ID from the request
+    
+    Returns:
+        list: Values to match the _id field against
+    """
+    if len(performance_id) == 24 and ObjectId.is_valid(performance_id):
+        return [ObjectId(performance_id), performance_id]
+    return [performance_id]
+
+def get_cursor_position(sort):
+    """
+    Read the 'cursor' query parameter of the current request.
+    
+    Args:
+        sort (list): Sort the request pages by
+    
+    Returns:
+        list: Sort key to continue after, or None for the first page
+    
+    Raises:
+        ValueError: If the cursor is invalid
+    """
+    cursor = request.args.get('cursor', default='', type=str)
+    if not cursor:
+        return None
+    return decode_cursor(cursor, sort)
+
 @app.route('/api/health', methods=['GET'])
 def health_check():
     """Health check endpoint."""
@@ -49,6 +335,14 @@ def health_check():
         'timestamp': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
     })
 
+@app.route('/api/metrics', methods=['GET'])
+def get_metrics():
+    """Get MongoDB command latency and response cache statistics."""
+    return jsonify({
+        'commands': get_command_stats(),
+        'response_cache': response_cache.stats()
+    })
+
 @app.route('/api/companies', methods=['GET'])
 def get_companies():
     """Get list of available ballet companies."""
@@ -75,39 +369,65 @@ def get_companies():
     return jsonify(companies)
 
 @app.route('/api/performances', methods=['GET'])
+@conditional_get.conditional
+@response_cache.cached(PERFORMANCES_CACHE_TTL, vary=date_window_key)
 def get_all_performances():
     """Get performances from all companies."""
     try:
-        # Get query parameters
-        limit = request.args.get('limit', default=100, type=int)
+        # Get query parameters; streams are not paginated unless asked to
+        stream = wants_stream()
+        limit = request.args.get('limit', default=0 if stream else 100, type=int)
         skip = request.args.get('skip', default=0, type=int)
+        try:
+            # Date windows are range queries sorted by start date
+            query = get_date_window() or {}
+            sort = DATE_SORT if query else MERGE_SORT
+            after = get_cursor_position(sort)
+            fields = get_requested_fields()
+        except ValueError as e:
+            return jsonify({'error': str(e)}), 400
         
-        # Get performances from Paris Opera Ballet
-        pob_performances = list(db[POB_COLLECTION].find({}, {'_id': 0}))
+        collection_names = [POB_COLLECTION, BOLSHOI_COLLECTION, BOSTON_COLLECTION]
+        if UNIFIED_COLLECTION_ENABLED:
+            collection_names = [PERFORMANCES_COLLECTION]
+        if stream:
+            return ndjson_response(
+                iter_merged(collection_names, query, skip, limit, sort=sort, after=after, fields=fields),
+                lambda document: select_fields(document, fields)
+            )
         
-        # Get performances from Bolshoi Ballet
-        bolshoi_performances = list(db[BOLSHOI_COLLECTION].find({}, {'_id': 0}))
+        # The unified collection answers with a single paginated query
+        if UNIFIED_COLLECTION_ENABLED:
+            performances, next_cursor, _ = merge_collections(
+                [PERFORMANCES_COLLECTION], query, skip, limit, sort=sort, after=after, fields=fields
+            )
+            return jsonify({
+                'total': storage.count(PERFORMANCES_COLLECTION, query),
+                'limit': limit,
+                'skip': skip,
+                'next_cursor': next_cursor,
+                'data': performances
+            })
         
-        # Get performances from Boston Ballet
-        boston_performances = list(db[BOSTON_COLLECTION].find({}, {'_id': 0}))
+        # Merge the sorted company collections up to the requested page
+        performances, next_cursor, failures = merge_collections(
+            collection_names, query, skip, limit, sort=sort, after=after, fields=fields
+        )
         
-        # Combine performances
-        all_performances = pob_performances + bolshoi_performances + boston_performances
-        
-        # Apply pagination
-        paginated_performances = all_performances[skip:skip+limit]
-        
-        return jsonify({
-            'total': len(all_performances),
+        return page_response({
+            'total': sum(cached_count(collection_name, query) for collection_name in collection_names if collection_name not in failures),
             'limit': limit,
             'skip': skip,
-            'data': paginated_performances
-        })
+            'next_cursor': next_cursor,
+            'data': performances
+        }, failures)
     except Exception as e:
         logger.error(f"Error getting all performances: {str(e)}")
         return jsonify({'error': str(e)}), 500
 
 @app.route('/api/performances/<company_id>', methods=['GET'])
+@conditional_get.conditional
+@response_cache.cached(PERFORMANCES_CACHE_TTL, vary=date_window_key)
 def get_company_performances(company_id):
     """Get performances for a specific company."""
     try:
@@ -115,26 +435,37 @@ def get_company_performances(company_id):
         if company_id not in ['paris_opera_ballet', 'bolshoi_ballet', 'boston_ballet']:
             return jsonify({'error': 'Invalid company ID'}), 400
         
-        # Get query parameters
-        limit = request.args.get('limit', default=100, type=int)
+        # Get query parameters; streams are not paginated unless asked to
+        stream = wants_stream()
+        limit = request.args.get('limit', default=0 if stream else 100, type=int)
         skip = request.args.get('skip', default=0, type=int)
+        try:
+            # Date windows are range queries sorted by start date
+            window = get_date_window()
+            sort = DATE_SORT if window else MERGE_SORT
+            after = get_cursor_position(sort)
+            fields = get_requested_fields()
+        except ValueError as e:
+            return jsonify({'error': str(e)}), 400
+        
+        # Scope the query to the company in the unified collection
+        collection_name, query = get_company_collection(company_id, window)
         
-        # Get collection name based on company ID
-        if company_id == 'paris_opera_ballet':
-            collection_name = POB_COLLECTION
-        elif company_id == 'bolshoi_ballet':
-            collection_name = BOLSHOI_COLLECTION
-        else:  # boston_ballet
-            collection_name = BOSTON_COLLECTION
+        if stream:
+            return ndjson_response(
+                iter_merged([collection_name], query, skip, limit, sort=sort, after=after, fields=fields),
+                lambda document: select_fields(document, fields)
+            )
         
-        # Get performances
-        performances = list(db[collection_name].find({}, {'_id': 0}).skip(skip).limit(limit))
-        total_count = db[collection_name].count_documents({})
+        # Get performances in start date order
+        performances, next_cursor, _ = merge_collections([collection_name], query, skip, limit, sort=sort, after=after, fields=fields)
+        total_count = storage.count(collection_name, query)
         
         return jsonify({
             'total': total_count,
             'limit': limit,
             'skip': skip,
+            'next_cursor': next_cursor,
             'data': performances
         })
     except Exception as e:
@@ -142,6 +473,7 @@ def get_company_performances(company_id):
         return jsonify({'error': str(e)}), 500
 
 @app.route('/api/performances/<company_id>/<performance_id>', methods=['GET'])
+@conditional_get.conditional
 def get_performance(company_id, performance_id):
     """Get a specific performance by ID."""
     try:
@@ -149,85 +481,306 @@ def get_performance(company_id, performance_id):
         if company_id not in ['paris_opera_ballet', 'bolshoi_ballet', 'boston_ballet']:
             return jsonify({'error': 'Invalid company ID'}), 400
         
-        # Get collection name based on company ID
-        if company_id == 'paris_opera_ballet':
-            collection_name = POB_COLLECTION
-        elif company_id == 'bolshoi_ballet':
-            collection_name = BOLSHOI_COLLECTION
-        else:  # boston_ballet
-            collection_name = BOSTON_COLLECTION
+        try:
+            fields = get_requested_fields()
+        except ValueError as e:
+            return jsonify({'error': str(e)}), 400
+        
+        # Scope the lookup to the company in the unified collection
+        collection_name, query = get_company_collection(company_id, {'_id': {'$in': stored_ids(performance_id)}})
         
         # Get performance
-        performance = db[collection_name].find_one({'_id': performance_id}, {'_id': 0})
+        performance = storage.find_one(collection_name, query, make_projection(fields, include_id=False))
         
         if not performance:
             return jsonify({'error': 'Performance not found'}), 404
         
-        return jsonify(performance)
+        return jsonify(select_fields(performance, fields))
     except Exception as e:
         logger.error(f"Error getting performance {performance_id}: {str(e)}")
         return jsonify({'error': str(e)}), 500
 
+@app.route('/api/performances:batchGet', methods=['POST'])
+def batch_get_performances():
+    """
+    Get several performances by company and ID in one request.
+    
+    The body is {"items": [{"company": ..., "id": ...}, ...]}. The lookups
+    are grouped into one $in query per collection, and the results come back
+    in request order, with found set to false for missing performances.
+    """
+    try:
+        body = request.get_json(silent=True)
+        items = body.get('items') if isinstance(body, dict) else None
+        if not isinstance(items, list) or not items:
+            return jsonify({'error': 'Request body must be a JSON object with a non-empty "items" list'}), 400
+        if len(items) > BATCH_GET_MAX_ITEMS:
+            return jsonify({'error': f'At most {BATCH_GET_MAX_ITEMS} items may be requested at once'}), 400
+        
+        try:
+            fields = get_requested_fields()
+        except ValueError as e:
+            return jsonify({'error': str(e)}), 400
+        
+        # Group the requested IDs by collection
+        requested_ids = {}
+        for item in items:
+            if not isinstance(item, dict) or not isinstance(item.get('id'), str):
+                return jsonify({'error': 'Each item needs a "company" and a string "id"'}), 400
+            if item.get('company') not in ['paris_opera_ballet', 'bolshoi_ballet', 'boston_ballet']:
+                return jsonify({'error': 'Invalid company ID'}), 400
+            collection_name = get_collection_name(item['company'])
+            requested_ids.setdefault(collection_name, []).extend(stored_ids(item['id']))
+        
+        # The unified collection holds every company, so matches are keyed by company too
+        projection = make_projection(fields)
+        if projection is not None and UNIFIED_COLLECTION_ENABLED:
+            projection['company_id'] = 1
+        found = {}
+        for collection_name, performance_ids in requested_ids.items():
+            for performance in storage.find(collection_name, {'_id': {'$in': performance_ids}}, projection):
+                # Requests name ObjectId _ids by their hex string
+                performance_id = str(performance.pop('_id'))
+                company_id = performance.get('company_id') if UNIFIED_COLLECTION_ENABLED else None
+                found[(collection_name, company_id, performance_id)] = performance
+        
+        results = []
+        for item in items:
+            company_id = item['company'] if UNIFIED_COLLECTION_ENABLED else None
+            performance = found.get((get_collection_name(item['company']), company_id, item['id']))
+            results.append({
+                'company': item['company'],
+                'id': item['id'],
+                'found': performance is not None,
+                'performance': select_fields(performance, fields) if performance is not None else None
+            })
+        
+        return jsonify({'data': results})
+    except Exception as e:
+        logger.error(f"Error getting performances in batch: {str(e)}")
+        return jsonify({'error': str(e)}), 500
+
 @app.route('/api/search', methods=['GET'])
+@conditional_get.conditional
+@response_cache.cached(SEARCH_CACHE_TTL)
 def search_performances():
     """Search performances across all companies."""
     try:
         # Get query parameters
         query = request.args.get('q', default='', type=str)
         company = request.args.get('company', default='', type=str)
+        mode = request.args.get('mode', default=SEARCH_MODE, type=str)
         limit = request.args.get('limit', default=100, type=int)
         skip = request.args.get('skip', default=0, type=int)
         
         if not query:
             return jsonify({'error': 'Query parameter "q" is required'}), 400
-        
-        # Build MongoDB query
-        mongo_query = {
-            '$or': [
-                {'title': {'$regex': query, '$options': 'i'}},
-                {'description': {'$regex': query, '$options': 'i'}}
-            ]
-        }
+        if mode not in SEARCH_MODES:
+            return jsonify({'error': f'Invalid search mode (expected one of {", ".join(SEARCH_MODES)})'}), 400
+        try:
+            fields = get_requested_fields()
+        except ValueError as e:
+            return jsonify({'error': str(e)}), 400
         
         # Add company filter if specified
+        filter_query = {}
         if company:
             if company not in ['paris_opera_ballet', 'bolshoi_ballet', 'boston_ballet']:
                 return jsonify({'error': 'Invalid company ID'}), 400
-            mongo_query['company'] = company
+            # Per-company collections are scoped by picking the collection below
+            if UNIFIED_COLLECTION_ENABLED:
+                filter_query['company_id'] = company
         
         # Get collections to search
-        collections = []
-        if not company or company == 'paris_opera_ballet':
-            collections.append(POB_COLLECTION)
-        if not company or company == 'bolshoi_ballet':
-            collections.append(BOLSHOI_COLLECTION)
-        if not company or company == 'boston_ballet':
-            collections.append(BOSTON_COLLECTION)
-        
-        # Search performances
-        results = []
-        for collection_name in collections:
-            collection_results = list(db[collection_name].find(mongo_query, {'_id': 0}))
-            results.extend(collection_results)
+        if UNIFIED_COLLECTION_ENABLED:
+            collections = [PERFORMANCES_COLLECTION]
+        else:
+            collections = []
+            if not company or company == 'paris_opera_ballet':
+                collections.append(POB_COLLECTION)
+            if not company or company == 'bolshoi_ballet':
+                collections.append(BOLSHOI_COLLECTION)
+            if not company or company == 'boston_ballet':
+                collections.append(BOSTON_COLLECTION)
         
-        # Apply pagination
-        paginated_results = results[skip:skip+limit]
+        # Ranked searches need at least one word that is not a stop word
+        if mode == 'index' and tokenize(query):
+            versions = response_cache.get_version()
+            if versions is not None:
+                try:
+                    return search_indexed(
+                        collections, query, filter_query, dict(zip(DATA_COLLECTIONS, versions)), skip, limit, fields
+                    )
+                except ValueError as e:
+                    return jsonify({'error': str(e)}), 400
+            # Without version stamps the index cannot tell whether it is stale
+            mode = 'text'
         
-        return jsonify({
-            'total': len(results),
-            'limit': limit,
-            'skip': skip,
-            'data': paginated_results
-        })
+        if mode == 'text' and text_terms(query):
+            try:
+                return search_text(collections, query, filter_query, skip, limit, fields)
+            except ValueError as e:
+                return jsonify({'error': str(e)}), 400
+            except Exception as e:
+                logger.warning(f"Text search failed, falling back to literal search: {str(e)}")
+        
+        return search_literal(collections, query, filter_query, skip, limit, fields)
     except Exception as e:
         logger.error(f"Error searching performances: {str(e)}")
         return jsonify({'error': str(e)}), 500
 
+def search_indexed(collection_names, text, filter_query, versions, skip, limit, fields=None):
+    """
+    Answer a search request with the in-process search index, best matches first.
+    
+    The searched collections are re-indexed first if their version moved.
+    Continuation cursors record the offset of the next page.
+    
+    Args:
+        collection_names (list): Names of the collections to search
+        text (str): Search text
+        filter_query (dict): Field values the results must have
+        versions (dict): Collection name -> current data version
+        skip (int): Number of matches to skip
+        limit (int): Maximum number of matches to return
+        fields (tuple, optional): Fields to return besides 'score', or None for every field
+    
+    Returns:
+        Response: JSON page of results, each with a 'score' field
+    
+    Raises:
+        ValueError: If the cursor is invalid
+    """
+    after = get_cursor_position(TEXT_CURSOR_SORT)
+    start = skip + (after[0] if after else 0)
+    
+    search_index.refresh({collection_name: versions[collection_name] for collection_name in collection_names})
+    total, results = search_index.search(text, collection_names, filter_query, sort=MERGE_SORT, skip=start, limit=limit)
+    for document in results:
+        document.pop('_id', None)
+    results = [select_fields(document, fields + ('score',) if fields else None) for document in results]
+    
+    next_cursor = None
+    if limit and start + limit < total:
+        next_cursor = encode_cursor({'offset': start + limit}, TEXT_CURSOR_SORT)
+    
+    return jsonify({
+        'total': total,
+        'limit': limit,
+        'skip': skip,
+        'next_cursor': next_cursor,
+        'data': results
+    })
+
+def search_text(collection_names, text, filter_query, skip, limit, fields=None):
+    """
+    Answer a search request with the text index, best matches first.
+    
+    Each collection returns at most skip + limit matches sorted by score, the
+    collections are searched concurrently and the sorted results are merged
+    with a heap. Continuation cursors record the offset of the next page.
+    
+    Args:
+        collection_names (list): Names of the collections to search
+        text (str): Search text
+        filter_query (dict): Additional query applied to every collection
+        skip (int): Number of matches to skip
+        limit (int): Maximum number of matches to return
+        fields (tuple, optional): Fields to return besides 'score', or None for every field
+    
+    Returns:
+        Response: JSON page of results, each with a 'score' field
+    
+    Raises:
+        ValueError: If the cursor is invalid
+    """
+    after = get_cursor_position(TEXT_CURSOR_SORT)
+    start = skip + (after[0] if after else 0)
+    
+    outcome = fan_out({
+        collection_name: lambda collection_name=collection_name: list(
+            storage.text_search(collection_name, text, filter_query, sort=MERGE_SORT, limit=start + limit)
+        )
+        for collection_name in collection_names
+    })
+    # Without any result the database likely lacks text search; let the caller fall back
+    if not outcome.results:
+        raise RuntimeError(f"Text search failed in every collection: {outcome.failures}")
+    merged = heapq.merge(*outcome.results.values(), key=lambda document: (-document['score'],) + sort_key(document, MERGE_SORT))
+    results = list(islice(merged, start, start + limit))
+    for document in results:
+        document.pop('_id', None)
+    results = [select_fields(document, fields + ('score',) if fields else None) for document in results]
+    
+    next_cursor = None
+    if limit and len(results) == limit:
+        next_cursor = encode_cursor({'offset': start + limit}, TEXT_CURSOR_SORT)
+    
+    text_query = dict(filter_query, **{'$text': {'$search': text}})
+    return page_response({
+        'total': sum(cached_count(collection_name, text_query) for collection_name in outcome.results),
+        'limit': limit,
+        'skip': skip,
+        'next_cursor': next_cursor,
+        'data': results
+    }, outcome.failures)
+
+def search_literal(collection_names, text, filter_query, skip, limit, fields=None):
+    """
+    Answer a search request with a case-insensitive substring match.
+    
+    The search text is escaped, so it always matches literally. Results are
+    sorted like the listings and support keyset cursors.
+    
+    Args:
+        collection_names (list): Names of the collections to search
+        text (str): Search text
+        filter_query (dict): Additional query applied to every collection
+        skip (int): Number of matches to skip
+        limit (int): Maximum number of matches to return
+        fields (tuple, optional): Fields to return, or None for every field
+    
+    Returns:
+        Response: JSON page of results
+    """
+    try:
+        after = get_cursor_position(MERGE_SORT)
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    
+    pattern = re.escape(text)
+    mongo_query = dict(filter_query, **{
+        '$or': [
+            {'title': {'$regex': pattern, '$options': 'i'}},
+            {'description': {'$regex': pattern, '$options': 'i'}}
+        ]
+    })
+    
+    # Merge the sorted matches up to the requested page
+    results, next_cursor, failures = merge_collections(
+        collection_names, mongo_query, skip, limit, sort=MERGE_SORT, after=after, fields=fields
+    )
+    
+    return page_response({
+        'total': sum(
+            cached_count(collection_name, mongo_query) for collection_name in collection_names
+            if collection_name not in failures
+        ),
+        'limit': limit,
+        'skip': skip,
+        'next_cursor': next_cursor,
+        'data': results
+    }, failures)
+
 def main():
     """Run the Flask app."""
     port = int(os.getenv('PORT', 5000))
     debug = os.getenv('DEBUG', 'False').lower() == 'true'
     
+    # Make sure lookups, filters and search are served by indexes
+    for collection_name in INDEX_MANIFEST:
+        storage.ensure_indexes(collection_name)
+    
     logger.info(f"Starting Ballet API server on port {port}")
     app.run(host='0.0.0.0', port=port, debug=debug)
 
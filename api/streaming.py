@@ -0,0 +1,44 @@
+"""
+Newline-delimited JSON streaming for the Ballet API.
+
+Clients that send "Accept: application/x-ndjson" or "?stream=1" get list
+results as one JSON document per line, written while the database cursor
+is being read. The first bytes go out as soon as the first document is
+available and memory use does not grow with the number of documents.
+"""
+
+from flask import request, current_app, stream_with_context
+
+# Media type of newline-delimited JSON
+NDJSON_MIMETYPE = 'application/x-ndjson'
+
+def wants_stream():
+    """
+    Check whether the current request asks for a streamed response.
+    
+    Returns:
+        bool: True for ?stream=1 (or true) or when NDJSON is the preferred media type
+    """
+    if request.args.get('stream', default='', type=str).lower() in ('1', 'true'):
+        return True
+    return request.accept_mimetypes.best_match(['application/json', NDJSON_MIMETYPE]) == NDJSON_MIMETYPE
+
+def ndjson_response(documents, transform=None):
+    """
+    Stream documents as newline-delimited JSON.
+    
+    Args:
+        documents (iterable): Documents, consumed lazily while the response is sent
+        transform (callable, optional): Applied to each document before serialization
+    
+    Returns:
+        Response: Streamed response
+    """
+    def generate():
+        for document in documents:
+            document.pop('_id', None)
+            if transform is not None:
+                document = transform(document)
+            yield current_app.json.dumps(document) + '\n'
+    
+    return current_app.response_class(stream_with_context(generate()), mimetype=NDJSON_MIMETYPE)
@@ -0,0 +1,68 @@
+"""
+Tests for the date-window filters.
+"""
+
+from datetime import date, datetime, time, timedelta, timezone
+
+import pytest
+from flask import Flask
+
+from api.date_window import parse_date_window, dated_version, dated_last_modified, date_window_key
+from scrapers.common.normalize import epoch_day
+
+TODAY = date(2025, 5, 10)
+DAY = epoch_day('2025-05-10')
+
+def test_parse_date_window_statuses():
+    """Test that statuses become range conditions around today."""
+    assert parse_date_window() is None
+    assert parse_date_window('current', today=TODAY) == {'startDay': {'$lte': DAY}, 'endDay': {'$gte': DAY}}
+    assert parse_date_window('upcoming', today=TODAY) == {'startDay': {'$gt': DAY}}
+    assert parse_date_window('past', today=TODAY) == {'endDay': {'$lt': DAY}}
+
+def test_parse_date_window_dates():
+    """Test that from/to keep overlapping performances and tighten status bounds."""
+    assert parse_date_window(start='2025-05-01', end='2025-05-31') == {
+        'endDay': {'$gte': epoch_day('2025-05-01')},
+        'startDay': {'$lte': epoch_day('2025-05-31')}
+    }
+    assert parse_date_window('current', end='2025-05-31', today=TODAY) == {
+        'startDay': {'$lte': DAY}, 'endDay': {'$gte': DAY}
+    }
+    assert parse_date_window('current', start='2025-05-20', today=TODAY)['endDay'] == {'$gte': epoch_day('2025-05-20')}
+
+@pytest.mark.parametrize('status, start, end, message', [
+    ('soon', '', '', 'Invalid status'),
+    ('', '10/05/2025', '', "Invalid 'from' date"),
+    ('', '2025-06-01', '2025-05-01', "'from' must not be after 'to'")
+])
+def test_parse_date_window_rejects_invalid(status, start, end, message):
+    """Test that invalid parameters are rejected."""
+    with pytest.raises(ValueError, match=message):
+        parse_date_window(status, start, end)
+
+def test_dated_version():
+    """Test that versions carry the date and unknown versions stay unknown."""
+    assert dated_version(lambda: 3)() == (3, date.today().isoformat())
+    assert dated_version(lambda: None)() is None
+
+def test_dated_last_modified():
+    """Test that modification times never precede the start of today."""
+    day_start = datetime.combine(date.today(), time.min).astimezone(timezone.utc)
+    later = day_start + timedelta(hours=1)
+    assert dated_last_modified(lambda: datetime(2025, 1, 1, tzinfo=timezone.utc))() == day_start
+    assert dated_last_modified(lambda: later)() == later
+    assert dated_last_modified(lambda: None)() is None
+
+@pytest.mark.parametrize('query_string, keyed', [
+    ('status=current', True),
+    ('status=upcoming&from=2025-05-01', True),
+    ('from=2025-05-01', False),
+    ('to=2025-05-31', False),
+    ('from=2025-05-01&to=2025-05-31', False),
+    ('', False)
+])
+def test_date_window_key(query_string, keyed):
+    """Test that only status windows are keyed by today's date."""
+    with Flask(__name__).test_request_context(f'/?{query_string}'):
+        assert date_window_key() == (epoch_day(date.today().isoformat()) if keyed else None)
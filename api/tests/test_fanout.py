@@ -0,0 +1,51 @@
+"""
+Tests for the concurrent fan-out helper.
+"""
+
+import time
+import threading
+from flask import Flask
+
+from api.fanout import fan_out, report_failures
+
+def test_fan_out_runs_tasks_concurrently():
+    """Test that tasks overlap and results keep the submission order."""
+    barrier = threading.Barrier(3, timeout=2)
+    
+    def task(value):
+        barrier.wait()
+        return value
+    
+    outcome = fan_out({name: lambda name=name: task(name) for name in ['a', 'b', 'c']})
+    
+    assert list(outcome.results) == ['a', 'b', 'c']
+    assert not outcome.partial
+
+def test_fan_out_reports_failures_and_timeouts():
+    """Test that failing and slow tasks are reported without losing the others."""
+    def fail():
+        raise RuntimeError('connection reset')
+    
+    started = time.monotonic()
+    outcome = fan_out({
+        'fast': lambda: 1,
+        'broken': fail,
+        'slow': lambda: time.sleep(1)
+    }, timeout={'slow': 0.05})
+    
+    assert time.monotonic() - started < 0.9
+    assert outcome.results == {'fast': 1}
+    assert outcome.failures == {'broken': 'connection reset', 'slow': 'timeout'}
+    assert outcome.partial
+
+def test_report_failures():
+    """Test that partial responses name the missing collections and are not stored."""
+    app = Flask(__name__)
+    
+    with app.test_request_context():
+        complete = report_failures(app.response_class('[]'), {})
+        partial = report_failures(app.response_class('[]'), {'bolshoi_ballet': 'timeout'})
+    
+    assert 'X-Partial-Results' not in complete.headers
+    assert partial.headers['X-Partial-Results'] == 'bolshoi_ballet'
+    assert partial.cache_control.no_store
@@ -0,0 +1,47 @@
+"""
+Tests for the sparse fieldset helpers.
+"""
+
+import pytest
+
+from api.fields import FIELD_VIEWS, parse_fields, make_projection, select_fields
+
+def test_parse_fields():
+    """Test that field lists are deduplicated and views are expanded."""
+    assert parse_fields('') is None
+    assert parse_fields('title, venue,title') == ('title', 'venue')
+    assert parse_fields('summary') == FIELD_VIEWS['summary']
+    assert parse_fields('detail') is None
+
+def test_parse_fields_rejects_unknown():
+    """Test that fields outside the whitelist are rejected."""
+    with pytest.raises(ValueError, match='content_hash'):
+        parse_fields('title,content_hash')
+
+def test_make_projection():
+    """Test that projections read source and sort fields besides the requested ones."""
+    sort = [('startDate', 1), ('company', 1), ('_id', 1)]
+    
+    assert make_projection(None) is None
+    assert make_projection(None, include_id=False) == {'_id': 0}
+    assert make_projection(('title', 'endDate'), sort) == {
+        'date_parse_method': 1, 'title': 1, 'endDate': 1, 'date': 1, 'startDay': 1, 'endDay': 1,
+        'startDate': 1, 'company': 1
+    }
+    assert make_projection(('title',), include_id=False) == {'date_parse_method': 1, 'title': 1, '_id': 0}
+
+def test_select_fields():
+    """Test that only requested and derived fields are kept."""
+    document = {'title': 'Giselle', 'thumbnail': 'a.jpg', 'image': 'a.jpg', 'date': 'May 2025', 'description': '...'}
+    
+    assert select_fields(document, None) == document
+    assert select_fields(document, ('title', 'thumbnail')) == {'title': 'Giselle', 'thumbnail': 'a.jpg', 'image': 'a.jpg'}
+
+def test_select_fields_drops_internal_fields():
+    """Test that bookkeeping fields never reach a response."""
+    document = {'title': 'Giselle', 'content_hash': 'abc', 'date_parse_method': 'single', 'startDay': 1, 'endDay': 2}
+    
+    assert select_fields(document, None) == {'title': 'Giselle'}
+    assert select_fields(document, ('title', 'startDate')) == {'title': 'Giselle'}
+    with pytest.raises(ValueError):
+        parse_fields('title,startDay')
@@ -0,0 +1,42 @@
+"""
+Tests for the keyset pagination helpers.
+"""
+
+import pytest
+from bson import ObjectId
+
+from api.pagination import encode_cursor, decode_cursor, keyset_query
+
+SORT = [('startDate', 1), ('company', 1), ('_id', 1)]
+
+def test_cursor_round_trip():
+    """Test that a cursor stores the sort key of the document, including ObjectIds."""
+    document_id = ObjectId()
+    token = encode_cursor({'startDate': '2025-01-01', 'company': 'Bolshoi Ballet', '_id': document_id}, SORT)
+    
+    assert decode_cursor(token, SORT) == ['2025-01-01', 'Bolshoi Ballet', document_id]
+
+def test_decode_cursor_rejects_other_sort():
+    """Test that a cursor issued for another sort is rejected."""
+    token = encode_cursor({'company_id': 'bolshoi_ballet', 'title': 'Giselle'}, [('company_id', 1), ('title', 1)])
+    
+    with pytest.raises(ValueError):
+        decode_cursor(token, SORT)
+
+def test_decode_cursor_rejects_garbage():
+    """Test that a malformed cursor is rejected."""
+    with pytest.raises(ValueError):
+        decode_cursor('not-a-cursor', SORT)
+
+def test_keyset_query():
+    """Test the range query built from a sort key."""
+    query = keyset_query({'company_id': 'bolshoi_ballet'}, SORT, [None, 'Bolshoi Ballet', 'abc'])
+    
+    assert query == {'$and': [
+        {'company_id': 'bolshoi_ballet'},
+        {'$or': [
+            {'startDate': {'$ne': None}},
+            {'startDate': None, 'company': {'$gt': 'Bolshoi Ballet'}},
+            {'startDate': None, 'company': 'Bolshoi Ballet', '_id': {'$gt': 'abc'}}
+        ]}
+    ]}
@@ -0,0 +1,47 @@
+"""
+Tests for the in-memory search index.
+"""
+
+from unittest.mock import patch
+
+from api.search_index import SearchIndex, fold, tokenize
+
+def test_fold_and_tokenize():
+    """Test that accents are folded, stop words dropped and words stemmed."""
+    assert fold('La Bayadère') == 'la bayadere'
+    assert tokenize('The Swans of Coppélia') == ['swan', 'coppelia']
+
+def test_refresh_reindexes_changed_documents_only():
+    """Test that unchanged documents are not tokenized again and removed ones disappear."""
+    collections = {'bolshoi_ballet': [
+        {'_id': 1, 'title': 'Swan Lake', 'content_hash': 'a'},
+        {'_id': 2, 'title': 'Giselle', 'content_hash': 'b'}
+    ]}
+    index = SearchIndex(lambda collection_name: collections[collection_name])
+    index.refresh({'bolshoi_ballet': 1})
+    
+    collections['bolshoi_ballet'] = [{'_id': 1, 'title': 'Spartacus', 'content_hash': 'c'}]
+    with patch('api.search_index.tokenize', wraps=tokenize) as tokenize_calls:
+        index.refresh({'bolshoi_ballet': 1})
+        assert tokenize_calls.call_count == 0
+        index.refresh({'bolshoi_ballet': 2})
+    
+    assert len(index) == 1
+    assert index.search('giselle', ['bolshoi_ballet']) == (0, [])
+    total, results = index.search('spart', ['bolshoi_ballet'])
+    assert total == 1
+    assert results[0]['title'] == 'Spartacus'
+
+def test_search_ranks_title_matches_first():
+    """Test that title matches outrank description matches and filters apply."""
+    documents = [
+        {'_id': 1, 'title': 'Giselle', 'description': 'Not Swan Lake', 'company_id': 'boston_ballet'},
+        {'_id': 2, 'title': 'Swan Lake', 'company_id': 'boston_ballet'},
+        {'_id': 3, 'title': 'Swan Lake', 'company_id': 'bolshoi_ballet'}
+    ]
+    index = SearchIndex(lambda collection_name: documents)
+    index.refresh({'performances': 1})
+    
+    total, results = index.search('swan', ['performances'], {'company_id': 'boston_ballet'})
+    assert total == 2
+    assert [document['_id'] for document in results] == [2, 1]
@@ -2,11 +2,18 @@
 Tests for the Ballet API server.
 """
 
+import gzip
 import json
 import pytest
-from unittest.mock import patch, MagicMock
+from datetime import date, timedelta
+from unittest.mock import patch
+from bson import ObjectId
 
-from api.server import app
+from api import compression
+from api.conditional import parse_last_updated
+from api.server import app, clear_count_cache, response_cache, conditional_get, search_index
+from scrapers.common.normalize import epoch_day
+from scrapers.common.storage import MemoryBackend
 
 @pytest.fixture
 def client():
@@ -16,10 +23,15 @@ def client():
         yield client
 
 @pytest.fixture
-def mock_db():
-    """Create a mock MongoDB database."""
-    with patch('api.server.db') as mock_db:
-        yield mock_db
+def storage():
+    """Replace the storage backend with an empty in-memory one."""
+    backend = MemoryBackend()
+    clear_count_cache()
+    response_cache.clear()
+    conditional_get.clear()
+    search_index.clear()
+    with patch('api.server.storage', backend):
+        yield backend
 
 def test_health_check(client):
     """Test the health check endpoint."""
@@ -38,17 +50,17 @@ def test_get_companies(client):
     assert data[0]['id'] == 'paris_opera_ballet'
     assert data[1]['id'] == 'bolshoi_ballet'
 
-def test_get_all_performances(client, mock_db):
+def test_get_all_performances(client, storage):
     """Test getting all performances."""
-    # Mock the database collections
-    mock_db['paris_opera_ballet'].find.return_value = [
-        {'title': 'Swan Lake', 'company': 'Paris Opera Ballet'},
-        {'title': 'Giselle', 'company': 'Paris Opera Ballet'}
-    ]
-    mock_db['bolshoi_ballet'].find.return_value = [
-        {'title': 'Spartacus', 'company': 'Bolshoi Ballet'},
-        {'title': 'The Nutcracker', 'company': 'Bolshoi Ballet'}
-    ]
+    # Seed the collections
+    storage.store_performances('paris_opera_ballet', [
+        {'title': 'Swan Lake', 'company': 'Paris Opera Ballet', 'startDate': '2025-01-10'},
+        {'title': 'Giselle', 'company': 'Paris Opera Ballet', 'startDate': '2025-02-01'}
+    ])
+    storage.store_performances('bolshoi_ballet', [
+        {'title': 'Spartacus', 'company': 'Bolshoi Ballet', 'startDate': '2025-03-01'},
+        {'title': 'The Nutcracker', 'company': 'Bolshoi Ballet', 'startDate': '2025-04-01'}
+    ])
     
     response = client.get('/api/performances')
     assert response.status_code == 200
@@ -58,16 +70,219 @@ def test_get_all_performances(client, mock_db):
     assert data['data'][0]['title'] == 'Swan Lake'
     assert data['data'][2]['title'] == 'Spartacus'
 
-def test_get_company_performances(client, mock_db):
+def test_get_all_performances_merges_pages(client, storage):
+    """Test that pages are merged across collections in start date order."""
+    storage.store_performances('paris_opera_ballet', [
+        {'title': 'Giselle', 'company': 'Paris Opera Ballet', 'startDate': '2025-01-01'},
+        {'title': 'Swan Lake', 'company': 'Paris Opera Ballet', 'startDate': '2025-03-01'}
+    ])
+    storage.store_performances('bolshoi_ballet', [
+        {'title': 'Spartacus', 'company': 'Bolshoi Ballet', 'startDate': '2025-02-01'}
+    ])
+    storage.store_performances('boston_ballet', [
+        {'title': 'Cinderella', 'company': 'Boston Ballet', 'startDate': '2025-02-01'},
+        {'title': 'Coppelia', 'company': 'Boston Ballet', 'startDate': '2025-04-01'}
+    ])
+    
+    response = client.get('/api/performances?skip=1&limit=3')
+    
+    data = json.loads(response.data)
+    assert data['total'] == 5
+    assert [performance['title'] for performance in data['data']] == ['Spartacus', 'Cinderella', 'Swan Lake']
+    assert all('_id' not in performance for performance in data['data'])
+
+def test_get_all_performances_reads_one_page_per_collection(client, storage):
+    """Test that each collection is asked for at most skip + limit documents."""
+    # Look up the Last-Modified date before counting
+    client.get('/api/performances?limit=1')
+    
+    with patch.object(storage, 'find', wraps=storage.find) as find:
+        client.get('/api/performances?skip=20&limit=5')
+    
+    assert find.call_count == 3
+    assert all(call.kwargs['limit'] == 25 for call in find.call_args_list)
+
+def test_get_all_performances_with_cursor(client, storage):
+    """Test that continuation cursors walk every performance exactly once."""
+    storage.store_performances('paris_opera_ballet', [
+        {'title': 'Giselle', 'company': 'Paris Opera Ballet', 'startDate': '2025-01-01'},
+        {'title': 'Swan Lake', 'company': 'Paris Opera Ballet', 'startDate': '2025-03-01'}
+    ])
+    storage.store_performances('bolshoi_ballet', [
+        {'title': 'Spartacus', 'company': 'Bolshoi Ballet', 'startDate': '2025-02-01'}
+    ])
+    storage.store_performances('boston_ballet', [
+        {'title': 'Cinderella', 'company': 'Boston Ballet', 'startDate': '2025-02-01'},
+        {'title': 'Coppelia', 'company': 'Boston Ballet'}
+    ])
+    
+    titles = []
+    url = '/api/performances?limit=2'
+    while url:
+        data = json.loads(client.get(url).data)
+        titles.extend(performance['title'] for performance in data['data'])
+        url = f"/api/performances?limit=2&cursor={data['next_cursor']}" if data['next_cursor'] else None
+    
+    assert titles == ['Coppelia', 'Giselle', 'Spartacus', 'Cinderella', 'Swan Lake']
+
+def test_get_all_performances_cursor_ignores_new_documents(client, storage):
+    """Test that documents stored before the cursor position do not shift the next page."""
+    storage.store_performances('paris_opera_ballet', [
+        {'title': 'Giselle', 'company': 'Paris Opera Ballet', 'startDate': '2025-01-01'},
+        {'title': 'Swan Lake', 'company': 'Paris Opera Ballet', 'startDate': '2025-03-01'}
+    ])
+    data = json.loads(client.get('/api/performances?limit=1').data)
+    
+    storage.store_performances('bolshoi_ballet', [
+        {'title': 'Spartacus', 'company': 'Bolshoi Ballet', 'startDate': '2024-12-01'}
+    ])
+    response = client.get(f"/api/performances?limit=1&cursor={data['next_cursor']}")
+    
+    assert [performance['title'] for performance in json.loads(response.data)['data']] == ['Swan Lake']
+
+def test_get_all_performances_partial(client, storage):
+    """Test that a failing collection is reported and the others are still returned."""
+    storage.store_performances('paris_opera_ballet', [{'title': 'Giselle', 'startDate': '2025-01-01'}])
+    storage.store_performances('bolshoi_ballet', [{'title': 'Spartacus', 'startDate': '2025-02-01'}])
+    find = storage.find
+    
+    def failing_find(collection_name, *args, **kwargs):
+        if collection_name == 'bolshoi_ballet':
+            raise RuntimeError('connection reset')
+        return find(collection_name, *args, **kwargs)
+    
+    with patch.object(storage, 'find', side_effect=failing_find):
+        response = client.get('/api/performances')
+    
+    assert response.status_code == 200
+    data = json.loads(response.data)
+    assert [performance['title'] for performance in data['data']] == ['Giselle']
+    assert data['failed_collections'] == ['bolshoi_ballet']
+    assert response.headers['X-Partial-Results'] == 'bolshoi_ballet'
+    assert 'ETag' not in response.headers
+    assert response_cache.stats()['entries'] == 0
+    
+    # The next request reads every collection again
+    data = json.loads(client.get('/api/performances').data)
+    assert [performance['title'] for performance in data['data']] == ['Giselle', 'Spartacus']
+    assert 'failed_collections' not in data
+
+def test_get_all_performances_invalid_cursor(client, storage):
+    """Test that a malformed cursor is rejected."""
+    response = client.get('/api/performances?cursor=not-a-cursor')
+    assert response.status_code == 400
+    data = json.loads(response.data)
+    assert 'error' in data
+
+def test_get_all_performances_stream(client, storage):
+    """Test that performances are streamed as newline-delimited JSON in merge order."""
+    storage.store_performances('paris_opera_ballet', [
+        {'title': 'Giselle', 'company': 'Paris Opera Ballet', 'startDate': '2025-01-01'},
+        {'title': 'Swan Lake', 'company': 'Paris Opera Ballet', 'startDate': '2025-03-01'}
+    ])
+    storage.store_performances('bolshoi_ballet', [
+        {'title': 'Spartacus', 'company': 'Bolshoi Ballet', 'startDate': '2025-02-01'}
+    ])
+    
+    response = client.get('/api/performances', headers={'Accept': 'application/x-ndjson'})
+    
+    assert response.status_code == 200
+    assert response.mimetype == 'application/x-ndjson'
+    assert response.is_streamed
+    lines = [json.loads(line) for line in response.data.decode('utf-8').splitlines()]
+    assert [performance['title'] for performance in lines] == ['Giselle', 'Spartacus', 'Swan Lake']
+    assert all('_id' not in performance for performance in lines)
+    
+    response = client.get('/api/performances?stream=1&skip=1&limit=1')
+    lines = [json.loads(line) for line in response.data.decode('utf-8').splitlines()]
+    assert [performance['title'] for performance in lines] == ['Spartacus']
+
+def test_responses_omit_internal_fields(client, storage):
+    """Test that content hashes and normalized day numbers are not returned."""
+    storage.store_performances('paris_opera_ballet', [{
+        '_id': '123', 'title': 'Giselle', 'company': 'Paris Opera Ballet', 'startDate': '2025-01-01',
+        'content_hash': 'abc', 'date_parse_method': 'single', 'startDay': 20089, 'endDay': 20089
+    }])
+    internal = {'content_hash', 'date_parse_method', 'startDay', 'endDay'}
+    
+    listed = json.loads(client.get('/api/performances').data)['data']
+    streamed = client.get('/api/performances/paris_opera_ballet?stream=1').data.decode('utf-8').splitlines()
+    detail = json.loads(client.get('/api/performances/paris_opera_ballet/123').data)
+    batch = json.loads(client.post('/api/performances:batchGet', json={'items': [{'company': 'paris_opera_ballet', 'id': '123'}]}).data)
+    windowed = json.loads(client.get('/api/performances?from=2025-01-01').data)['data']
+    
+    for performance in listed + [json.loads(line) for line in streamed] + [detail, batch['data'][0]['performance']] + windowed:
+        assert performance['title'] == 'Giselle'
+        assert internal.isdisjoint(performance)
+
+def test_get_company_performances_stream_not_cached(client, storage):
+    """Test that streamed responses bypass the response cache and get their own ETag."""
+    storage.store_performances('paris_opera_ballet', [{'title': 'Giselle', 'startDate': '2025-01-01'}])
+    
+    json_response = client.get('/api/performances/paris_opera_ballet')
+    stream_response = client.get('/api/performances/paris_opera_ballet?stream=1')
+    
+    assert stream_response.mimetype == 'application/x-ndjson'
+    assert json.loads(stream_response.data)['title'] == 'Giselle'
+    assert response_cache.stats()['entries'] == 1
+    assert stream_response.headers['ETag'] != json_response.headers['ETag']
+
+def test_get_all_performances_fields(client, storage):
+    """Test that a sparse fieldset is pushed into the projection and trims the response."""
+    storage.store_performances('paris_opera_ballet', [
+        {'title': 'Giselle', 'startDate': '2025-01-01', 'venue': 'Palais Garnier', 'description': 'A long text'}
+    ])
+    storage.store_performances('bolshoi_ballet', [
+        {'title': 'Spartacus', 'startDate': '2025-02-01', 'cast': ['Ivan Vasiliev']}
+    ])
+    
+    with patch.object(storage, 'find', wraps=storage.find) as find:
+        response = client.get('/api/performances?fields=title,venue&limit=1')
+    
+    data = json.loads(response.data)
+    assert data['data'] == [{'title': 'Giselle', 'venue': 'Palais Garnier'}]
+    projections = [call.args[2] for call in find.call_args_list if len(call.args) > 2]
+    assert {'date_parse_method': 1, 'title': 1, 'venue': 1, 'startDate': 1, 'company': 1} in projections
+    
+    # Continuation cursors still work although the sort fields are not returned
+    response = client.get(f"/api/performances?fields=title,venue&limit=1&cursor={data['next_cursor']}")
+    assert json.loads(response.data)['data'] == [{'title': 'Spartacus'}]
+
+def test_get_all_performances_fields_view(client, storage):
+    """Test that the summary view leaves out long fields."""
+    storage.store_performances('paris_opera_ballet', [
+        {'title': 'Giselle', 'startDate': '2025-01-01', 'thumbnail': 'giselle.jpg', 'description': 'A long text'}
+    ])
+    
+    summary = json.loads(client.get('/api/performances?fields=summary').data)['data'][0]
+    detail = json.loads(client.get('/api/performances?fields=detail').data)['data'][0]
+    
+    assert summary == {'title': 'Giselle', 'startDate': '2025-01-01', 'thumbnail': 'giselle.jpg'}
+    assert detail['description'] == 'A long text'
+
+def test_get_all_performances_invalid_fields(client, storage):
+    """Test that fields outside the whitelist are rejected."""
+    response = client.get('/api/performances?fields=title,content_hash')
+    assert response.status_code == 400
+    assert 'content_hash' in json.loads(response.data)['error']
+
+def test_search_performances_fields(client, storage):
+    """Test that ranked search results keep their score with a sparse fieldset."""
+    storage.store_performances('paris_opera_ballet', [
+        {'title': 'Giselle', 'startDate': '2025-01-01', 'description': 'A long text'}
+    ])
+    
+    data = json.loads(client.get('/api/search?q=giselle&fields=title').data)
+    
+    assert set(data['data'][0]) == {'title', 'score'}
+
+def test_get_company_performances(client, storage):
     """Test getting performances for a specific company."""
-    # Mock the database collection
-    mock_db['paris_opera_ballet'].find.return_value = MagicMock()
-    mock_db['paris_opera_ballet'].find.return_value.skip.return_value = MagicMock()
-    mock_db['paris_opera_ballet'].find.return_value.skip.return_value.limit.return_value = [
-        {'title': 'Swan Lake', 'company': 'Paris Opera Ballet'},
-        {'title': 'Giselle', 'company': 'Paris Opera Ballet'}
-    ]
-    mock_db['paris_opera_ballet'].count_documents.return_value = 2
+    # Seed the collection
+    storage.store_performances('paris_opera_ballet', [
+        {'title': 'Swan Lake', 'company': 'Paris Opera Ballet', 'startDate': '2025-01-10'},
+        {'title': 'Giselle', 'company': 'Paris Opera Ballet', 'startDate': '2025-02-01'}
+    ])
     
     response = client.get('/api/performances/paris_opera_ballet')
     assert response.status_code == 200
@@ -77,14 +292,15 @@ def test_get_company_performances(client, mock_db):
     assert data['data'][0]['title'] == 'Swan Lake'
     assert data['data'][1]['title'] == 'Giselle'
 
-def test_get_performance(client, mock_db):
+def test_get_performance(client, storage):
     """Test getting a specific performance."""
-    # Mock the database collection
-    mock_db['paris_opera_ballet'].find_one.return_value = {
+    # Seed the collection
+    storage.store_performances('paris_opera_ballet', [{
+        '_id': '123',
         'title': 'Swan Lake',
         'company': 'Paris Opera Ballet',
         'description': 'A beautiful ballet'
-    }
+    }])
     
     response = client.get('/api/performances/paris_opera_ballet/123')
     assert response.status_code == 200
@@ -92,25 +308,93 @@ def test_get_performance(client, mock_db):
     assert data['title'] == 'Swan Lake'
     assert data['company'] == 'Paris Opera Ballet'
 
-def test_get_performance_not_found(client, mock_db):
+def test_get_performance_not_found(client, storage):
     """Test getting a performance that doesn't exist."""
-    # Mock the database collection
-    mock_db['paris_opera_ballet'].find_one.return_value = None
-    
     response = client.get('/api/performances/paris_opera_ballet/999')
     assert response.status_code == 404
     data = json.loads(response.data)
     assert 'error' in data
 
-def test_search_performances(client, mock_db):
-    """Test searching for performances."""
-    # Mock the database collections
-    mock_db['paris_opera_ballet'].find.return_value = [
-        {'title': 'Swan Lake', 'company': 'Paris Opera Ballet'}
+def test_batch_get_performances(client, storage):
+    """Test that a batch lookup runs one query per collection and keeps request order."""
+    storage.store_performances('paris_opera_ballet', [
+        {'_id': 'p1', 'title': 'Giselle', 'description': 'A long text'},
+        {'_id': 'p2', 'title': 'Swan Lake'}
+    ])
+    storage.store_performances('bolshoi_ballet', [{'_id': 'b1', 'title': 'Spartacus'}])
+    items = [
+        {'company': 'bolshoi_ballet', 'id': 'b1'},
+        {'company': 'paris_opera_ballet', 'id': 'p2'},
+        {'company': 'paris_opera_ballet', 'id': 'missing'},
+        {'company': 'paris_opera_ballet', 'id': 'p1'}
     ]
-    mock_db['bolshoi_ballet'].find.return_value = [
-        {'title': 'Swan Lake', 'company': 'Bolshoi Ballet'}
+    
+    with patch.object(storage, 'find', wraps=storage.find) as find:
+        response = client.post('/api/performances:batchGet?fields=title', json={'items': items})
+    
+    assert response.status_code == 200
+    data = json.loads(response.data)['data']
+    assert [result['found'] for result in data] == [True, True, False, True]
+    assert [result['performance'] for result in data] == [
+        {'title': 'Spartacus'}, {'title': 'Swan Lake'}, None, {'title': 'Giselle'}
     ]
+    assert data[2] == {'company': 'paris_opera_ballet', 'id': 'missing', 'found': False, 'performance': None}
+    assert find.call_count == 2
+
+def test_batch_get_performances_object_ids(client, storage):
+    """Test that ObjectId _ids, as assigned by MongoDB upserts, are found by their hex string."""
+    document_id = ObjectId()
+    storage.store_performances('paris_opera_ballet', [{'_id': document_id, 'title': 'Giselle'}])
+    
+    response = client.post('/api/performances:batchGet', json={'items': [
+        {'company': 'paris_opera_ballet', 'id': str(document_id)},
+        {'company': 'paris_opera_ballet', 'id': str(ObjectId())}
+    ]})
+    
+    data = json.loads(response.data)['data']
+    assert [result['found'] for result in data] == [True, False]
+    assert data[0]['performance']['title'] == 'Giselle'
+    
+    response = client.get(f"/api/performances/paris_opera_ballet/{document_id}")
+    assert json.loads(response.data)['title'] == 'Giselle'
+
+def test_batch_get_performances_unified(client, storage):
+    """Test that batch lookups in the unified collection match the company too."""
+    storage.store_performances('performances', [{'_id': 'x1', 'title': 'Giselle'}], scope={'company_id': 'boston_ballet'})
+    
+    with patch('api.server.UNIFIED_COLLECTION_ENABLED', True):
+        response = client.post('/api/performances:batchGet', json={'items': [
+            {'company': 'boston_ballet', 'id': 'x1'},
+            {'company': 'bolshoi_ballet', 'id': 'x1'}
+        ]})
+    
+    data = json.loads(response.data)['data']
+    assert data[0]['performance']['title'] == 'Giselle'
+    assert not data[1]['found']
+
+def test_batch_get_performances_invalid(client, storage):
+    """Test that malformed and oversized batch requests are rejected."""
+    assert client.post('/api/performances:batchGet', json={}).status_code == 400
+    assert client.post('/api/performances:batchGet', json={'items': [{'company': 'invalid', 'id': '1'}]}).status_code == 400
+    assert client.post('/api/performances:batchGet', json={'items': [{'company': 'bolshoi_ballet'}]}).status_code == 400
+    
+    with patch('api.server.BATCH_GET_MAX_ITEMS', 1):
+        response = client.post('/api/performances:batchGet', json={'items': [
+            {'company': 'bolshoi_ballet', 'id': '1'},
+            {'company': 'bolshoi_ballet', 'id': '2'}
+        ]})
+    assert response.status_code == 400
+
+def test_search_performances(client, storage):
+    """Test searching for performances."""
+    # Seed the collections
+    storage.store_performances('paris_opera_ballet', [
+        {'title': 'Swan Lake', 'company': 'Paris Opera Ballet', 'startDate': '2025-01-10'},
+        {'title': 'Giselle', 'company': 'Paris Opera Ballet', 'startDate': '2025-02-01'}
+    ])
+    storage.store_performances('bolshoi_ballet', [
+        {'title': 'Swan Lake', 'company': 'Bolshoi Ballet', 'startDate': '2025-02-10'}
+    ])
     
     response = client.get('/api/search?q=Swan')
     assert response.status_code == 200
@@ -122,12 +406,93 @@ def test_search_performances(client, mock_db):
     assert data['data'][1]['title'] == 'Swan Lake'
     assert data['data'][1]['company'] == 'Bolshoi Ballet'
 
-def test_search_performances_with_company_filter(client, mock_db):
+def test_search_performances_with_cursor(client, storage):
+    """Test that search results continue after the cursor."""
+    storage.store_performances('paris_opera_ballet', [
+        {'title': 'Swan Lake', 'company': 'Paris Opera Ballet', 'startDate': '2025-01-10'}
+    ])
+    storage.store_performances('bolshoi_ballet', [
+        {'title': 'Swan Lake', 'company': 'Bolshoi Ballet', 'startDate': '2025-02-10'}
+    ])
+    
+    first = json.loads(client.get('/api/search?q=Swan&limit=1').data)
+    second = json.loads(client.get(f"/api/search?q=Swan&limit=1&cursor={first['next_cursor']}").data)
+    
+    assert first['data'][0]['company'] == 'Paris Opera Ballet'
+    assert second['data'][0]['company'] == 'Bolshoi Ballet'
+
+def test_search_performances_ranked(client, storage):
+    """Test that text search ranks title matches above description matches."""
+    storage.store_performances('paris_opera_ballet', [
+        {'title': 'Giselle', 'description': 'Not Swan Lake', 'startDate': '2025-01-10'}
+    ])
+    storage.store_performances('bolshoi_ballet', [
+        {'title': 'Swan Lake', 'startDate': '2025-02-10'}
+    ])
+    
+    data = json.loads(client.get('/api/search?q=swans&mode=text').data)
+    
+    assert [performance['title'] for performance in data['data']] == ['Swan Lake', 'Giselle']
+    assert data['data'][0]['score'] > data['data'][1]['score']
+
+def test_search_performances_index(client, storage):
+    """Test that the search index folds accents and matches prefixes."""
+    storage.store_performances('paris_opera_ballet', [
+        {'title': 'La Bayadère', 'composer': 'Ludwig Minkus', 'startDate': '2025-01-10'},
+        {'title': 'Coppélia', 'startDate': '2025-02-10'}
+    ])
+    storage.store_performances('boston_ballet', [
+        {'title': 'Giselle', 'venue': 'Citizens Opera House', 'startDate': '2025-03-10'}
+    ])
+    
+    def search(text):
+        data = json.loads(client.get(f'/api/search?q={text}').data)
+        return [performance['title'] for performance in data['data']]
+    
+    assert search('Bayadere') == ['La Bayadère']
+    assert search('coppel') == ['Coppélia']
+    assert search('minkus') == ['La Bayadère']
+    assert search('citizen opera') == ['Giselle']
+
+def test_search_performances_index_refreshes(client, storage):
+    """Test that the search index picks up newly stored performances."""
+    storage.store_performances('paris_opera_ballet', [{'title': 'Giselle', 'startDate': '2025-01-10'}])
+    client.get('/api/search?q=giselle')
+    
+    storage.store_performances('bolshoi_ballet', [{'title': 'Giselle', 'startDate': '2025-02-10'}])
+    with patch.object(response_cache, 'version_check_interval', 0):
+        data = json.loads(client.get('/api/search?q=gisel').data)
+    
+    assert data['total'] == 2
+    assert [performance['startDate'] for performance in data['data']] == ['2025-01-10', '2025-02-10']
+
+def test_search_performances_literal(client, storage):
+    """Test that literal search escapes the query."""
+    storage.store_performances('paris_opera_ballet', [
+        {'title': 'Swan Lake (Nureyev)', 'startDate': '2025-01-10'},
+        {'title': 'Swan Lake', 'startDate': '2025-02-10'}
+    ])
+    
+    response = client.get('/api/search?q=Lake (&mode=literal')
+    
+    assert response.status_code == 200
+    data = json.loads(response.data)
+    assert [performance['title'] for performance in data['data']] == ['Swan Lake (Nureyev)']
+
+def test_search_performances_invalid_mode(client, storage):
+    """Test searching with an unknown mode."""
+    response = client.get('/api/search?q=Swan&mode=fuzzy')
+    assert response.status_code == 400
+
+def test_search_performances_with_company_filter(client, storage):
     """Test searching for performances with company filter."""
-    # Mock the database collection
-    mock_db['paris_opera_ballet'].find.return_value = [
+    # Seed the collections
+    storage.store_performances('paris_opera_ballet', [
         {'title': 'Swan Lake', 'company': 'Paris Opera Ballet'}
-    ]
+    ])
+    storage.store_performances('bolshoi_ballet', [
+        {'title': 'Swan Lake', 'company': 'Bolshoi Ballet'}
+    ])
     
     response = client.get('/api/search?q=Swan&company=paris_opera_ballet')
     assert response.status_code == 200
@@ -137,16 +502,301 @@ def test_search_performances_with_company_filter(client, mock_db):
     assert data['data'][0]['title'] == 'Swan Lake'
     assert data['data'][0]['company'] == 'Paris Opera Ballet'
 
-def test_search_performances_no_query(client):
+def test_search_performances_no_query(client, storage):
     """Test searching for performances without a query."""
     response = client.get('/api/search')
     assert response.status_code == 400
     data = json.loads(response.data)
     assert 'error' in data
 
-def test_search_performances_invalid_company(client):
+def test_search_performances_invalid_company(client, storage):
     """Test searching for performances with an invalid company."""
     response = client.get('/api/search?q=Swan&company=invalid')
     assert response.status_code == 400
     data = json.loads(response.data)
     assert 'error' in data
+
+def test_get_all_performances_unified(client, storage):
+    """Test getting all performances from the unified collection."""
+    storage.store_performances('performances', [{'title': 'Spartacus', 'startDate': '2025-03-01'}], scope={'company_id': 'bolshoi_ballet'})
+    storage.store_performances('performances', [{'title': 'Giselle', 'startDate': '2025-01-01'}], scope={'company_id': 'paris_opera_ballet'})
+    storage.store_performances('performances', [{'title': 'Swan Lake', 'startDate': '2025-02-01'}], scope={'company_id': 'bolshoi_ballet'})
+    
+    with patch('api.server.UNIFIED_COLLECTION_ENABLED', True):
+        response = client.get('/api/performances?skip=1&limit=1')
+    
+    assert response.status_code == 200
+    data = json.loads(response.data)
+    assert data['total'] == 3
+    assert [performance['title'] for performance in data['data']] == ['Swan Lake']
+
+def test_get_all_performances_unified_same_order(client, storage):
+    """Test that both storage layouts list and page performances in the same order."""
+    performances = {
+        'bolshoi_ballet': [
+            {'_id': 'b1', 'title': 'Spartacus', 'company': 'Bolshoi Ballet', 'startDate': '2025-03-01'},
+            {'_id': 'b2', 'title': 'Swan Lake', 'company': 'Bolshoi Ballet', 'startDate': '2025-01-01'}
+        ],
+        'paris_opera_ballet': [
+            {'_id': 'p1', 'title': 'Giselle', 'company': 'Paris Opera Ballet', 'startDate': '2025-01-01'}
+        ]
+    }
+    for company_id, documents in performances.items():
+        storage.store_performances(company_id, documents)
+        storage.store_performances('performances', documents, scope={'company_id': company_id})
+    
+    def pages(unified):
+        response_cache.clear()
+        titles, url = [], '/api/performances?limit=1'
+        with patch('api.server.UNIFIED_COLLECTION_ENABLED', unified):
+            while url:
+                data = json.loads(client.get(url).data)
+                titles += [performance['title'] for performance in data['data']]
+                url = f"/api/performances?limit=1&cursor={data['next_cursor']}" if data['next_cursor'] else None
+        return titles
+    
+    assert pages(False) == pages(True) == ['Swan Lake', 'Giselle', 'Spartacus']
+
+def test_get_company_performances_unified(client, storage):
+    """Test that company performances are scoped by company_id in the unified collection."""
+    storage.store_performances('performances', [{'title': 'Giselle'}], scope={'company_id': 'boston_ballet'})
+    storage.store_performances('performances', [{'title': 'Giselle'}], scope={'company_id': 'bolshoi_ballet'})
+    
+    with patch('api.server.UNIFIED_COLLECTION_ENABLED', True):
+        response = client.get('/api/performances/boston_ballet')
+    
+    assert response.status_code == 200
+    data = json.loads(response.data)
+    assert data['total'] == 1
+    assert data['data'][0]['company_id'] == 'boston_ballet'
+
+def test_search_performances_unified(client, storage):
+    """Test that search with a company filter is scoped by company_id in the unified collection."""
+    storage.store_performances('performances', [{'title': 'Swan Lake'}], scope={'company_id': 'bolshoi_ballet'})
+    storage.store_performances('performances', [{'title': 'Swan Lake'}], scope={'company_id': 'paris_opera_ballet'})
+    
+    with patch('api.server.UNIFIED_COLLECTION_ENABLED', True):
+        response = client.get('/api/search?q=Swan&company=bolshoi_ballet')
+    
+    assert response.status_code == 200
+    data = json.loads(response.data)
+    assert data['total'] == 1
+    assert data['data'][0]['company_id'] == 'bolshoi_ballet'
+
+def test_get_all_performances_cached(client, storage):
+    """Test that repeated requests are served from the response cache."""
+    storage.store_performances('paris_opera_ballet', [{'title': 'Giselle', 'startDate': '2025-01-01'}])
+    client.get('/api/performances?limit=1')
+    
+    with patch.object(storage, 'find', wraps=storage.find) as find:
+        first = client.get('/api/performances?limit=10&skip=0')
+        second = client.get('/api/performances?skip=0&limit=10')
+    
+    assert first.data == second.data
+    assert find.call_count == 3
+    assert response_cache.stats()['hits'] == 1
+
+def test_response_cache_invalidated_by_store(client, storage):
+    """Test that storing performances invalidates cached responses."""
+    storage.store_performances('paris_opera_ballet', [{'title': 'Giselle', 'startDate': '2025-01-01'}])
+    client.get('/api/performances')
+    
+    storage.store_performances('bolshoi_ballet', [{'title': 'Spartacus', 'startDate': '2025-02-01'}])
+    with patch.object(response_cache, 'version_check_interval', 0):
+        data = json.loads(client.get('/api/performances').data)
+    
+    assert [performance['title'] for performance in data['data']] == ['Giselle', 'Spartacus']
+    assert response_cache.stats()['invalidations'] == 1
+
+def test_get_all_performances_etag(client, storage):
+    """Test that a matching If-None-Match is answered with 304 until the data changes."""
+    storage.store_performances('paris_opera_ballet', [{'title': 'Giselle', 'startDate': '2025-01-01'}])
+    
+    first = client.get('/api/performances')
+    etag = first.headers['ETag']
+    with patch.object(storage, 'find', wraps=storage.find) as find:
+        revalidated = client.get('/api/performances', headers={'If-None-Match': etag})
+    
+    assert revalidated.status_code == 304
+    assert revalidated.data == b''
+    assert find.call_count == 0
+    assert client.get('/api/performances?limit=5').headers['ETag'] != etag
+    
+    storage.store_performances('bolshoi_ballet', [{'title': 'Spartacus', 'startDate': '2025-02-01'}])
+    with patch.object(response_cache, 'version_check_interval', 0):
+        changed = client.get('/api/performances', headers={'If-None-Match': etag})
+    assert changed.status_code == 200
+    assert changed.headers['ETag'] != etag
+
+def test_get_performance_last_modified(client, storage):
+    """Test that Last-Modified follows the newest last_updated and answers If-Modified-Since."""
+    newest = f'{date.today() + timedelta(days=1)} 10:00:00'
+    storage.store_performances('paris_opera_ballet', [
+        {'_id': '123', 'title': 'Giselle', 'last_updated': '2025-01-01 10:00:00'},
+        {'_id': '456', 'title': 'Swan Lake', 'last_updated': newest}
+    ])
+    
+    response = client.get('/api/performances/paris_opera_ballet/123')
+    last_modified = response.headers['Last-Modified']
+    assert response.status_code == 200
+    assert response.last_modified == parse_last_updated(newest)
+    
+    revalidated = client.get('/api/performances/paris_opera_ballet/123', headers={'If-Modified-Since': last_modified})
+    assert revalidated.status_code == 304
+    
+    stale = client.get('/api/performances/paris_opera_ballet/123', headers={'If-Modified-Since': 'Wed, 01 Jan 2025 00:00:00 GMT'})
+    assert stale.status_code == 200
+
+def test_get_all_performances_last_modified_changes_with_day(client, storage):
+    """Test that If-Modified-Since does not validate date-dependent lists across midnight."""
+    today = date.today()
+    storage.store_performances('paris_opera_ballet', [{
+        'title': 'Giselle', 'company': 'Paris Opera Ballet', 'last_updated': '2025-01-01 10:00:00',
+        'startDay': epoch_day((today + timedelta(days=1)).isoformat()),
+        'endDay': epoch_day((today + timedelta(days=3)).isoformat())
+    }])
+    
+    response = client.get('/api/performances?status=upcoming')
+    last_modified = response.headers['Last-Modified']
+    assert response.last_modified > parse_last_updated('2025-01-01 10:00:00')
+    
+    revalidated = client.get('/api/performances?status=upcoming', headers={'If-Modified-Since': last_modified})
+    assert revalidated.status_code == 304
+    
+    with patch('api.date_window.date') as mock_date:
+        mock_date.today.return_value = today + timedelta(days=2)
+        changed = client.get('/api/performances?status=upcoming', headers={'If-Modified-Since': last_modified})
+    assert changed.status_code == 200
+    assert json.loads(changed.data)['data'] == []
+
+def test_get_all_performances_compressed_once(client, storage):
+    """Test that large responses are gzipped and the compressed body is cached."""
+    storage.store_performances('paris_opera_ballet', [
+        {'title': f'Performance {i}', 'description': 'A ballet in two acts. ' * 20, 'startDate': '2025-01-01'}
+        for i in range(10)
+    ])
+    
+    with patch('api.cache.compress', wraps=compression.compress) as compress:
+        first = client.get('/api/performances', headers={'Accept-Encoding': 'gzip'})
+        second = client.get('/api/performances', headers={'Accept-Encoding': 'gzip'})
+    
+    assert first.headers['Content-Encoding'] == 'gzip'
+    assert 'Accept-Encoding' in first.headers['Vary']
+    assert first.headers['ETag'].endswith('-gzip"')
+    assert second.data == first.data
+    assert compress.call_count == 1
+    assert len(json.loads(gzip.decompress(first.data))['data']) == 10
+    
+    revalidated = client.get('/api/performances', headers={'Accept-Encoding': 'gzip', 'If-None-Match': first.headers['ETag']})
+    assert revalidated.status_code == 304
+    assert revalidated.headers['ETag'] == first.headers['ETag']
+    
+    # A brotli variant held from another server revalidates too
+    brotli_etag = first.headers['ETag'].replace('-gzip"', '-br"')
+    revalidated = client.get('/api/performances', headers={'If-None-Match': f'"other", {brotli_etag}'})
+    assert revalidated.status_code == 304
+    assert revalidated.headers['ETag'] == brotli_etag
+
+def test_small_responses_not_compressed(client, storage):
+    """Test that responses below the size threshold are sent as is."""
+    response = client.get('/api/performances', headers={'Accept-Encoding': 'gzip, br'})
+    
+    assert 'Content-Encoding' not in response.headers
+    assert json.loads(response.data)['data'] == []
+
+def test_get_metrics(client):
+    """Test that command statistics are exposed as a dictionary."""
+    with patch('api.server.get_command_stats', return_value={'performances.find': {'count': 3}}):
+        response = client.get('/api/metrics')
+    
+    assert response.status_code == 200
+    data = json.loads(response.data)
+    assert data['commands']['performances.find']['count'] == 3
+    assert 'hits' in data['response_cache']
+
+def seed_date_windows(storage):
+    """Store past, current and upcoming performances around today."""
+    today = epoch_day(date.today().isoformat())
+    
+    def performance(title, company, start, end):
+        return {'title': title, 'company': company, 'startDay': today + start, 'endDay': today + end}
+    
+    storage.store_performances('paris_opera_ballet', [
+        performance('Giselle', 'Paris Opera Ballet', -30, -20),
+        performance('Swan Lake', 'Paris Opera Ballet', -2, 2),
+        performance('Jewels', 'Paris Opera Ballet', 40, 45)
+    ])
+    storage.store_performances('bolshoi_ballet', [
+        performance('Spartacus', 'Bolshoi Ballet', 5, 8),
+        {'title': 'Undated', 'company': 'Bolshoi Ballet'}
+    ])
+
+def test_get_all_performances_status(client, storage):
+    """Test that status windows are queried and upcoming ones sorted by start date."""
+    seed_date_windows(storage)
+    
+    def titles(url):
+        return [performance['title'] for performance in json.loads(client.get(url).data)['data']]
+    
+    assert titles('/api/performances?status=current') == ['Swan Lake']
+    assert titles('/api/performances?status=past') == ['Giselle']
+    assert titles('/api/performances?status=upcoming') == ['Spartacus', 'Jewels']
+    
+    data = json.loads(client.get('/api/performances?status=upcoming&limit=1').data)
+    assert [performance['title'] for performance in data['data']] == ['Spartacus']
+    assert data['total'] == 2
+    
+    data = json.loads(client.get(f"/api/performances?status=upcoming&limit=1&cursor={data['next_cursor']}").data)
+    assert [performance['title'] for performance in data['data']] == ['Jewels']
+
+def test_get_company_performances_date_range(client, storage):
+    """Test that from/to keep the performances overlapping the range."""
+    seed_date_windows(storage)
+    start = (date.today() + timedelta(days=1)).isoformat()
+    end = (date.today() + timedelta(days=41)).isoformat()
+    
+    with patch.object(storage, 'find', wraps=storage.find) as find:
+        data = json.loads(client.get(f"/api/performances/paris_opera_ballet?from={start}&to={end}").data)
+    
+    assert [performance['title'] for performance in data['data']] == ['Swan Lake', 'Jewels']
+    assert data['total'] == 2
+    assert find.call_args.args[1] == {
+        'endDay': {'$gte': epoch_day(start)},
+        'startDay': {'$lte': epoch_day(end)}
+    }
+
+def test_get_company_performances_status_unified(client, storage):
+    """Test that status windows are scoped by company_id in the unified collection."""
+    today = epoch_day(date.today().isoformat())
+    storage.store_performances('performances', [{'title': 'Giselle', 'startDay': today + 3, 'endDay': today + 4}], scope={'company_id': 'boston_ballet'})
+    storage.store_performances('performances', [{'title': 'Giselle', 'startDay': today + 3, 'endDay': today + 4}], scope={'company_id': 'bolshoi_ballet'})
+    
+    with patch('api.server.UNIFIED_COLLECTION_ENABLED', True):
+        data = json.loads(client.get('/api/performances/boston_ballet?status=upcoming').data)
+    
+    assert data['total'] == 1
+    assert data['data'][0]['company_id'] == 'boston_ballet'
+
+def test_get_all_performances_invalid_status(client, storage):
+    """Test that unknown statuses and malformed dates are rejected."""
+    assert client.get('/api/performances?status=soon').status_code == 400
+    assert client.get('/api/performances/bolshoi_ballet?from=tomorrow').status_code == 400
+
+def test_get_all_performances_status_cache_expires_with_day(client, storage):
+    """Test that cached status windows are not served after the day changes."""
+    today = date.today()
+    storage.store_performances('paris_opera_ballet', [{
+        'title': 'Giselle', 'company': 'Paris Opera Ballet',
+        'startDay': epoch_day((today + timedelta(days=1)).isoformat()),
+        'endDay': epoch_day((today + timedelta(days=3)).isoformat())
+    }])
+    
+    def titles():
+        return [performance['title'] for performance in json.loads(client.get('/api/performances?status=upcoming').data)['data']]
+    
+    assert titles() == ['Giselle']
+    assert response_cache.stats()['entries'] == 1
+    
+    with patch('api.date_window.date') as mock_date:
+        mock_date.today.return_value = today + timedelta(days=2)
+        assert titles() == []
@@ -0,0 +1,68 @@
+"""
+Tests for the memoized transform layer.
+"""
+
+from datetime import date, timedelta
+
+from api.transform_memo import TransformMemo
+
+def make_transform(memo, calls):
+    """Create a memoized transform recording the documents it sees."""
+    @memo.memoize
+    def transform(document, fields=None):
+        calls.append(document['title'])
+        return dict(document, transformed=True)
+    return transform
+
+def test_memoize_reuses_identical_documents():
+    """Test that identical documents are transformed once and copies are returned."""
+    calls = []
+    memo = TransformMemo()
+    transform = make_transform(memo, calls)
+    
+    first = transform({'title': 'Giselle'})
+    first['mutated'] = True
+    second = transform({'title': 'Giselle'})
+    transform({'title': 'Giselle'}, ('title',))
+    
+    assert calls == ['Giselle', 'Giselle']
+    assert second == {'title': 'Giselle', 'transformed': True}
+    assert memo.stats() == {'entries': 2, 'hits': 1, 'misses': 2, 'hit_rate': 1 / 3}
+
+def test_memoize_uses_content_hash():
+    """Test that documents are keyed by their stored content hash and last_updated."""
+    calls = []
+    transform = make_transform(TransformMemo(), calls)
+    
+    transform({'title': 'Giselle', 'content_hash': 'abc', 'last_updated': '2025-01-01 10:00:00'})
+    transform({'title': 'Giselle', 'content_hash': 'abc', 'last_updated': '2025-01-01 10:00:00'})
+    transform({'title': 'Giselle', 'content_hash': 'def', 'last_updated': '2025-01-01 10:00:00'})
+    transform({'title': 'Giselle', 'content_hash': 'def', 'last_updated': '2025-02-01 10:00:00'})
+    
+    assert len(calls) == 3
+
+def test_memoize_expires_with_the_date():
+    """Test that the memo is dropped when the day changes."""
+    calls = []
+    today = [date(2025, 1, 1)]
+    memo = TransformMemo(today=lambda: today[0])
+    transform = make_transform(memo, calls)
+    
+    transform({'title': 'Giselle'})
+    today[0] += timedelta(days=1)
+    transform({'title': 'Giselle'})
+    
+    assert len(calls) == 2
+    assert memo.stats()['entries'] == 1
+
+def test_memoize_evicts_least_recently_used():
+    """Test that the memo stays within its size bound."""
+    calls = []
+    memo = TransformMemo(max_entries=2)
+    transform = make_transform(memo, calls)
+    
+    for title in ['Giselle', 'Spartacus', 'Giselle', 'Coppelia', 'Giselle', 'Spartacus']:
+        transform({'title': title})
+    
+    assert calls == ['Giselle', 'Spartacus', 'Coppelia', 'Spartacus']
+    assert memo.stats()['entries'] == 2
@@ -0,0 +1,138 @@
+"""
+Memoized document transforms for the Ballet API.
+
+List routes run every stored performance through a transform before sending
+it, although most documents are identical from one request to the next.
+TransformMemo keeps the transformed documents in a size-bounded LRU cache
+keyed by the content hash of the raw document, so steady-state requests skip
+the transform entirely.
+
+Transforms compute past/current/upcoming flags from today's date, so the
+memo only holds documents transformed today and is dropped when the day
+changes.
+"""
+
+import os
+import logging
+import functools
+import threading
+from datetime import date
+from collections import OrderedDict
+
+from scrapers.common.db import compute_content_hash
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+# Maximum number of memoized documents (0 disables the memo)
+TRANSFORM_MEMO_SIZE = int(os.getenv('TRANSFORM_MEMO_SIZE', 4096))
+
+def document_key(document):
+    """
+    Identify the content of a raw document.
+    
+    The content_hash written by store_performances is reused when present;
+    it leaves out last_updated, which is therefore added to the key.
+    
+    Args:
+        document (dict): Raw document
+    
+    Returns:
+        tuple: Content hash and last_updated timestamp
+    """
+    return (document.get('content_hash') or compute_content_hash(document), document.get('last_updated'))
+
+class TransformMemo:
+    """
+    Size-bounded LRU memo of transformed documents.
+    
+    Usage:
+        transform_memo = TransformMemo()
+        
+        @transform_memo.memoize
+        def transform_performance(performance, fields=None):
+            ...
+    """
+    
+    def __init__(self, max_entries=TRANSFORM_MEMO_SIZE, today=date.today):
+        """
+        Create an empty memo.
+        
+        Args:
+            max_entries (int, optional): Maximum number of memoized documents
+            today (callable, optional): Returns the current date
+        """
+        self.max_entries = max_entries
+        self.today = today
+        
+        # (transform name, document key, fields) -> transformed document
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self._day = None
+        self.hits = 0
+        self.misses = 0
+    
+    def clear(self):
+        """
+        Drop every memoized document and reset the counters.
+        """
+        with self._lock:
+            self._entries.clear()
+            self._day = None
+            self.hits = 0
+            self.misses = 0
+    
+    def stats(self):
+        """
+        Get the memo counters.
+        
+        Returns:
+            dict: Number of entries, hits, misses and hit rate
+        """
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'entries': len(self._entries),
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': self.hits / lookups if lookups else 0.0
+            }
+    
+    def memoize(self, transform):
+        """
+        Decorate a transform taking (document, fields=None).
+        
+        Args:
+            transform (callable): Transform returning a new dictionary
+        
+        Returns:
+            callable: The memoized transform; it returns a copy of the memoized
+                document, so callers may modify it
+        """
+        @functools.wraps(transform)
+        def wrapper(document, fields=None):
+            if self.max_entries <= 0:
+                return transform(document, fields)
+            
+            day = self.today()
+            key = (transform.__name__, document_key(document), fields)
+            with self._lock:
+                # Flags such as isPast change with the date
+                if day != self._day:
+                    self._entries.clear()
+                    self._day = day
+                transformed = self._entries.get(key)
+                if transformed is not None:
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return dict(transformed)
+                self.misses += 1
+            
+            transformed = transform(document, fields)
+            with self._lock:
+                if self._day == day:
+                    self._entries[key] = transformed
+                    while len(self._entries) > self.max_entries:
+                        self._entries.popitem(last=False)
+            return dict(transformed)
+        return wrapper
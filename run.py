@@ -89,6 +89,65 @@ def run_api_server(args):
         logger.error(f"Error running API server: {str(e)}")
         return False
 
+def run_indexes(args):
+    """Apply the index manifest to the performance collections."""
+    try:
+        from scrapers.common.indexes import apply_index_manifest, format_index_report
+        
+        logger.info("Applying index manifest")
+        reports = apply_index_manifest(collection_names=args.collection)
+        print(format_index_report(reports))
+        
+        return all(report['status'] != 'failed' for report in reports)
+    except Exception as e:
+        logger.error(f"Error applying indexes: {str(e)}")
+        return False
+
+def run_migrate(args):
+    """Copy the per-company collections into the unified performances collection."""
+    try:
+        from scrapers.common.migrations import migrate_to_unified_collection
+        
+        logger.info("Migrating performances to the unified collection")
+        results = migrate_to_unified_collection(company_ids=args.company)
+        
+        for company_id, summary in results.items():
+            if summary is None:
+                logger.error(f"Migration failed for {company_id}")
+            else:
+                logger.info(
+                    f"{company_id}: {summary['inserted']} inserted, "
+                    f"{summary['changed']} changed, {summary['unchanged']} unchanged"
+                )
+        
+        return all(summary is not None for summary in results.values())
+    except Exception as e:
+        logger.error(f"Error migrating performances: {str(e)}")
+        return False
+
+def run_backfill(args):
+    """Normalize stored performances that predate ingest-time normalization."""
+    try:
+        from scrapers.common.migrations import backfill_normalized_fields
+        
+        logger.info("Backfilling normalized performance fields")
+        results = backfill_normalized_fields(company_ids=args.company)
+        
+        for collection_name, summaries in results.items():
+            for company_id, summary in summaries.items():
+                if summary is None:
+                    logger.error(f"Backfill failed for {company_id} in {collection_name}")
+                else:
+                    logger.info(
+                        f"{collection_name} ({company_id}): {summary['inserted']} inserted, "
+                        f"{summary['changed']} changed, {summary['unchanged']} unchanged"
+                    )
+        
+        return all(summary is not None for summaries in results.values() for summary in summaries.values())
+    except Exception as e:
+        logger.error(f"Error backfilling performances: {str(e)}")
+        return False
+
 def run_all(args):
     """Run all components."""
     # Run scrapers in separate threads
@@ -157,6 +216,18 @@ def main():
     boston_parser.add_argument('--no-details', action='store_true', help='Skip scraping individual performance details')
     boston_parser.add_argument('--print-data', action='store_true', help='Print stored data after scraping')
     
+    # Index bootstrap/migration command
+    indexes_parser = subparsers.add_parser('indexes', help='Create missing indexes on the performance collections')
+    indexes_parser.add_argument('--collection', action='append', help='Only index this collection (can be repeated)')
+    
+    # Unified collection migration command
+    migrate_parser = subparsers.add_parser('migrate', help='Copy per-company collections into the unified performances collection')
+    migrate_parser.add_argument('--company', action='append', help='Only migrate this company ID (can be repeated)')
+    
+    # Normalized fields backfill command
+    backfill_parser = subparsers.add_parser('backfill', help='Normalize dates, images and venues of performances stored before ingest-time normalization')
+    backfill_parser.add_argument('--company', action='append', help='Only backfill this company ID (can be repeated)')
+    
     # All command (run everything)
     all_parser = subparsers.add_parser('all', help='Run all components')
     all_parser.add_argument('--no-pob', action='store_true', help='Skip Paris Opera Ballet scraper')
@@ -179,6 +250,12 @@ def main():
         success = run_boston_ballet_scraper(args)
     elif args.command == 'api':
         success = run_api_server(args)
+    elif args.command == 'indexes':
+        success = run_indexes(args)
+    elif args.command == 'migrate':
+        success = run_migrate(args)
+    elif args.command == 'backfill':
+        success = run_backfill(args)
     elif args.command == 'all':
         success = run_all(args)
     else:
@@ -16,10 +16,14 @@ load_dotenv()
 BASE_URL = "https://www.bolshoi.ru/en/season/"
 LOCAL_HTML_PATH = "../Bolshoi HTML TEST/Bolshoi Theatre • Season.html"
 
+# Company ID, used as the discriminator in the unified performances collection
+COMPANY_ID = 'bolshoi_ballet'
+
 # MongoDB settings
 MONGO_URI = os.getenv('MONGODB_URI')
 DATABASE_NAME = os.getenv('DATABASE_NAME')
 COLLECTION_NAME = os.getenv('BOLSHOI_COLLECTION_NAME', 'bolshoi_ballet')
+BULK_WRITE_BATCH_SIZE = int(os.getenv('BULK_WRITE_BATCH_SIZE', 500))
 
 # Scraping settings
 IMPLICIT_WAIT = 10  # seconds
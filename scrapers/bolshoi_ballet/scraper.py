@@ -16,7 +16,9 @@ from bs4 import BeautifulSoup
 import schedule
 
 # Import common utilities
-from scrapers.common.db import get_collection, store_performances
+from scrapers.common.storage import get_storage_backend
+from scrapers.common.instrumentation import register_command_listener, reset_command_stats, log_command_stats
+from scrapers.common.write_behind import WriteBehindQueue, store_batch
 from scrapers.common.utils import (
     setup_selenium_driver,
     fetch_with_requests,
@@ -32,6 +34,8 @@ from scrapers.bolshoi_ballet.config import (
     BASE_URL,
     LOCAL_HTML_PATH,
     COLLECTION_NAME,
+    COMPANY_ID,
+    BULK_WRITE_BATCH_SIZE,
     BALLET_TITLES,
     SELECTORS,
     DEFAULT_DESCRIPTIONS,
@@ -413,7 +417,8 @@ def scrape_performance_details(performance, use_selenium=False):
         logger.error(f"Error scraping details for {performance.get('title', 'Unknown')}: {str(e)}")
         return performance
 
-def scrape_all_performances(use_web=False, use_selenium=False, html_file=LOCAL_HTML_PATH, scrape_details=True):
+def scrape_all_performances(use_web=False, use_selenium=False, html_file=LOCAL_HTML_PATH, scrape_details=True,
+                            on_performance=None):
     """
     Scrape all performances, either from a local file or from the web.
     
@@ -422,6 +427,8 @@ def scrape_all_performances(use_web=False, use_selenium=False, html_file=LOCAL_H
         use_selenium (bool): Whether to use Selenium for web scraping
         html_file (str): Path to the local HTML file
         scrape_details (bool): Whether to scrape detailed information for each performance
+        on_performance (callable, optional): Called with each performance as soon
+                                             as it is complete
         
     Returns:
         list: List of performance dictionaries
@@ -445,6 +452,12 @@ def scrape_all_performances(use_web=False, use_selenium=False, html_file=LOCAL_H
             
             # Scrape details
             performances[i] = scrape_performance_details(performance, use_selenium)
+            
+            if on_performance:
+                on_performance(performances[i])
+    elif on_performance:
+        for performance in performances:
+            on_performance(performance)
     
     return performances
 
@@ -461,23 +474,36 @@ def main_scrape(use_web=False, use_selenium=False, html_file=LOCAL_HTML_PATH, sc
     Returns:
         bool: True if successful, False otherwise
     """
-    collection = get_collection(COLLECTION_NAME)
+    # Time every MongoDB command issued during this run
+    register_command_listener()
+    reset_command_stats()
+    
+    storage = get_storage_backend()
+    storage.ensure_indexes(COLLECTION_NAME)
+    
+    # Persist each performance in the background as soon as it is complete
+    writer = WriteBehindQueue(lambda batch: store_batch(storage, batch, COMPANY_ID, COLLECTION_NAME, BULK_WRITE_BATCH_SIZE))
     
     try:
         logger.info("Starting Bolshoi Ballet scrape")
-        performances = scrape_all_performances(use_web, use_selenium, html_file, scrape_details)
+        performances = scrape_all_performances(
+            use_web, use_selenium, html_file, scrape_details, on_performance=writer.put
+        )
         
         if not performances:
             logger.error("No performances found")
             return False
         
-        # Store performances in MongoDB
-        success = store_performances(collection, performances)
+        # Wait for the remaining performances to be stored
+        summary = writer.close()
         
-        return success
+        return summary['failed'] == 0
     except Exception as e:
         logger.error(f"An error occurred during main scrape: {str(e)}")
         return False
+    finally:
+        writer.close()
+        log_command_stats()
 
 def scheduled_scrape():
     """
@@ -491,9 +517,9 @@ def print_stored_data():
     """
     Print stored data for debugging.
     """
-    collection = get_collection(COLLECTION_NAME)
+    storage = get_storage_backend()
     
-    performances = list(collection.find())
+    performances = list(storage.find(COLLECTION_NAME))
     logger.info(f"Total performances stored: {len(performances)}")
     
     for performance in performances[:3]:  # Print details of first 3 performances
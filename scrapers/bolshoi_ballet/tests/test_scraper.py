@@ -16,6 +16,7 @@ from scrapers.bolshoi_ballet.scraper import (
     scrape_performance_details,
     main_scrape
 )
+from scrapers.common.normalize import normalize_performance
 
 # Sample HTML content for testing
 SAMPLE_HTML = """
@@ -59,13 +60,6 @@ def mock_html_file(tmp_path):
         f.write(SAMPLE_HTML)
     return str(file_path)
 
-@pytest.fixture
-def mock_collection():
-    """Create a mock MongoDB collection."""
-    collection = MagicMock()
-    collection.update_one.return_value = MagicMock()
-    return collection
-
 def test_extract_ballet_performances_from_html():
     """Test extracting ballet performances from HTML content."""
     performances = extract_ballet_performances_from_html(SAMPLE_HTML)
@@ -87,6 +81,23 @@ def test_extract_ballet_performances_from_html():
     assert performances[1]['composer'] == 'Music by Pyotr Tchaikovsky'
     assert performances[1]['date'] == 'January 5-10, 2026'
 
+def test_extract_ballet_performances_month_only_date():
+    """Test that a month-only date keeps the month range, recorded as approximate."""
+    html = """
+    <div class="event-item">
+        <h2 class="title">Anna Karenina</h2>
+        <p class="event-date">March 2026</p>
+    </div>
+    """
+    performances = extract_ballet_performances_from_html(html)
+    
+    assert len(performances) == 1
+    assert performances[0]['startDate'] == '2026-03-01'
+    assert performances[0]['endDate'] == '2026-03-31'
+    normalized = normalize_performance(performances[0], 'bolshoi_ballet')
+    assert (normalized['startDate'], normalized['endDate']) == ('2026-03-01', '2026-03-31')
+    assert normalized['date_parse_method'] == 'month'
+
 def test_extract_ballet_performances_from_file(mock_html_file):
     """Test extracting ballet performances from a file."""
     performances = extract_ballet_performances_from_file(mock_html_file)
@@ -152,13 +163,12 @@ def test_scrape_performance_details_with_default_description():
             assert updated_performance['description'] == 'Default Swan Lake description'
             assert updated_performance['details_scraped'] is True
 
-@patch('scrapers.bolshoi_ballet.scraper.get_collection')
+@patch('scrapers.bolshoi_ballet.scraper.get_storage_backend')
 @patch('scrapers.bolshoi_ballet.scraper.scrape_all_performances')
-@patch('scrapers.bolshoi_ballet.scraper.store_performances')
-def test_main_scrape(mock_store, mock_scrape_all, mock_get_collection, mock_collection):
+def test_main_scrape(mock_scrape_all, mock_get_storage_backend):
     """Test the main scraping function."""
     # Set up mocks
-    mock_get_collection.return_value = mock_collection
+    mock_storage = mock_get_storage_backend.return_value
     mock_scrape_all.return_value = [
         {
             'title': 'Swan Lake',
@@ -175,7 +185,7 @@ def test_main_scrape(mock_store, mock_scrape_all, mock_get_collection, mock_coll
             'company': 'Bolshoi Ballet'
         }
     ]
-    mock_store.return_value = True
+    mock_storage.store_performances.return_value = {'inserted': 2, 'changed': 0, 'unchanged': 0}
     
     # Run the main scrape function
     result = main_scrape(use_web=True, use_selenium=False)
@@ -183,17 +193,17 @@ def test_main_scrape(mock_store, mock_scrape_all, mock_get_collection, mock_coll
     # Check that the function returned success
     assert result is True
     
-    # Check that the collection was retrieved
-    mock_get_collection.assert_called_once()
+    # Check that the storage backend was retrieved
+    mock_get_storage_backend.assert_called_once()
     
     # Check that performances were scraped and stored
     mock_scrape_all.assert_called_once_with(True, False, None, True)
-    mock_store.assert_called_once()
+    mock_storage.store_performances.assert_called_once()
 
 def test_main_scrape_no_performances():
     """Test the main scraping function when no performances are found."""
-    with patch('scrapers.bolshoi_ballet.scraper.get_collection') as mock_get_collection:
-        mock_get_collection.return_value = MagicMock()
+    with patch('scrapers.bolshoi_ballet.scraper.get_storage_backend') as mock_get_storage_backend:
+        mock_get_storage_backend.return_value = MagicMock()
         
         with patch('scrapers.bolshoi_ballet.scraper.scrape_all_performances') as mock_scrape_all:
             mock_scrape_all.return_value = []
@@ -15,10 +15,14 @@ load_dotenv()
 # Base URL for the Boston Ballet website
 BASE_URL = "https://www.bostonballet.org/Home/Tickets-Performances/"
 
+# Company ID, used as the discriminator in the unified performances collection
+COMPANY_ID = 'boston_ballet'
+
 # MongoDB settings
 MONGO_URI = os.getenv('MONGODB_URI')
 DATABASE_NAME = os.getenv('DATABASE_NAME')
 COLLECTION_NAME = os.getenv('BOSTON_COLLECTION_NAME', 'boston_ballet')
+BULK_WRITE_BATCH_SIZE = int(os.getenv('BULK_WRITE_BATCH_SIZE', 500))
 
 # Scraping settings
 IMPLICIT_WAIT = 10  # seconds
@@ -14,7 +14,9 @@ from bs4 import BeautifulSoup
 import schedule
 
 # Import common utilities
-from scrapers.common.db import get_collection, store_performances
+from scrapers.common.storage import get_storage_backend
+from scrapers.common.instrumentation import register_command_listener, reset_command_stats, log_command_stats
+from scrapers.common.write_behind import WriteBehindQueue, store_batch
 from scrapers.common.utils import (
     setup_selenium_driver, 
     accept_cookies, 
@@ -28,6 +30,8 @@ from scrapers.common.utils import (
 from scrapers.boston_ballet.config import (
     BASE_URL, 
     COLLECTION_NAME, 
+    COMPANY_ID,
+    BULK_WRITE_BATCH_SIZE,
     SELECTORS, 
     DEFAULT_DESCRIPTIONS,
     COOKIE_SELECTORS,
@@ -345,7 +349,15 @@ def main_scrape(use_selenium=True, scrape_details=True):
         bool: True if successful, False otherwise
     """
     driver = setup_selenium_driver()
-    collection = get_collection(COLLECTION_NAME)
+    # Time every MongoDB command issued during this run
+    register_command_listener()
+    reset_command_stats()
+    
+    storage = get_storage_backend()
+    storage.ensure_indexes(COLLECTION_NAME)
+    
+    # Persist each performance in the background as soon as it is complete
+    writer = WriteBehindQueue(lambda batch: store_batch(storage, batch, COMPANY_ID, COLLECTION_NAME, BULK_WRITE_BATCH_SIZE))
     
     try:
         logger.info("Starting Boston Ballet scrape")
@@ -371,6 +383,11 @@ def main_scrape(use_selenium=True, scrape_details=True):
                         'details_scraped': False,
                         'last_updated': time.strftime('%Y-%m-%d %H:%M:%S')
                     })
+                
+                # Add a default description for well-known ballets, then hand
+                # the performance to the background writer
+                add_default_descriptions([performance])
+                writer.put(performance)
         else:
             logger.info("Skipping individual performance details")
             for performance in performances:
@@ -381,18 +398,19 @@ def main_scrape(use_selenium=True, scrape_details=True):
                     'details_scraped': False,
                     'last_updated': time.strftime('%Y-%m-%d %H:%M:%S')
                 })
+                add_default_descriptions([performance])
+                writer.put(performance)
         
-        # Add default descriptions for well-known ballets
-        performances = add_default_descriptions(performances)
-        
-        # Store performances in MongoDB
-        success = store_performances(collection, performances)
+        # Wait for the remaining performances to be stored
+        summary = writer.close()
         
-        return success
+        return summary['failed'] == 0
     except Exception as e:
         logger.error(f"An error occurred during main scrape: {str(e)}", exc_info=True)
         return False
     finally:
+        writer.close()
+        log_command_stats()
         driver.quit()
         logger.info("Boston Ballet scrape completed")
 
@@ -408,9 +426,9 @@ def print_stored_data():
     """
     Print stored data for debugging.
     """
-    collection = get_collection(COLLECTION_NAME)
+    storage = get_storage_backend()
     
-    performances = list(collection.find())
+    performances = list(storage.find(COLLECTION_NAME))
     logger.info(f"Total performances stored: {len(performances)}")
     
     for performance in performances[:3]:  # Print details of first 3 performances
@@ -157,20 +157,19 @@ class TestBostonBalletScraper(unittest.TestCase):
         self.assertEqual(updated_performances[2]['description'], 'Description not found')  # Unchanged
     
     @patch('scrapers.boston_ballet.scraper.setup_selenium_driver')
-    @patch('scrapers.boston_ballet.scraper.get_collection')
-    @patch('scrapers.boston_ballet.scraper.store_performances')
+    @patch('scrapers.boston_ballet.scraper.get_storage_backend')
     @patch('scrapers.boston_ballet.scraper.scrape_main_page')
     @patch('scrapers.boston_ballet.scraper.scrape_individual_page')
     def test_main_scrape(self, mock_scrape_individual, mock_scrape_main, 
-                         mock_store, mock_get_collection, mock_setup_driver):
+                         mock_get_storage_backend, mock_setup_driver):
         """Test the main scraping function."""
         # Mock the Selenium driver
         mock_driver = MagicMock()
         mock_setup_driver.return_value = mock_driver
         
-        # Mock collection
-        mock_collection = MagicMock()
-        mock_get_collection.return_value = mock_collection
+        # Mock storage backend
+        mock_storage = MagicMock()
+        mock_get_storage_backend.return_value = mock_storage
         
         # Mock scrape_main_page to return sample performances
         mock_performances = [
@@ -196,8 +195,8 @@ class TestBostonBalletScraper(unittest.TestCase):
         }
         mock_scrape_individual.return_value = mock_details
         
-        # Mock store_performances to return success
-        mock_store.return_value = True
+        # Mock store_performances to return a success summary
+        mock_storage.store_performances.return_value = {'inserted': 1, 'changed': 0, 'unchanged': 0}
         
         # Call the function
         success = main_scrape()
@@ -206,7 +205,7 @@ class TestBostonBalletScraper(unittest.TestCase):
         self.assertTrue(success)
         mock_scrape_main.assert_called_once()
         mock_scrape_individual.assert_called_once()
-        mock_store.assert_called_once()
+        mock_storage.store_performances.assert_called_once()
         mock_driver.quit.assert_called_once()
 
 if __name__ == '__main__':
@@ -0,0 +1,256 @@
+"""
+Asynchronous database utilities for ballet performance data.
+
+This module mirrors scrapers.common.db on top of Motor, so asyncio code (such
+as an async API server) can query the company collections concurrently
+without tying up a thread per query.
+"""
+
+import os
+import re
+import asyncio
+import logging
+from motor.motor_asyncio import AsyncIOMotorClient
+from pymongo import UpdateOne
+from dotenv import load_dotenv
+
+from scrapers.common.db import (
+    MONGODB_URI,
+    DATABASE_NAME,
+    MONGODB_MAX_POOL_SIZE,
+    MONGODB_MIN_POOL_SIZE,
+    MONGODB_WAIT_QUEUE_TIMEOUT_MS,
+    BULK_WRITE_BATCH_SIZE,
+    CURSOR_BATCH_SIZE
+)
+
+# Load environment variables
+load_dotenv()
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+# Timeouts for the async client, in milliseconds
+ASYNC_SERVER_SELECTION_TIMEOUT_MS = int(os.getenv('ASYNC_SERVER_SELECTION_TIMEOUT_MS', 5000))
+ASYNC_CONNECT_TIMEOUT_MS = int(os.getenv('ASYNC_CONNECT_TIMEOUT_MS', 5000))
+ASYNC_SOCKET_TIMEOUT_MS = int(os.getenv('ASYNC_SOCKET_TIMEOUT_MS', 10000))
+
+# Default server-side time budget for a single query, in milliseconds
+ASYNC_QUERY_MAX_TIME_MS = int(os.getenv('ASYNC_QUERY_MAX_TIME_MS', 5000))
+
+# Motor clients are bound to the event loop that first uses them, so the
+# registry is keyed by (URI, event loop) rather than by URI alone. Clients
+# of closed loops are evicted on the next lookup.
+_clients = {}
+
+def _evict_closed_loops():
+    """
+    Close and forget the clients whose event loop has been closed.
+    
+    Each asyncio.run() call gets a fresh loop, so without eviction every
+    call would leave its client and sockets behind.
+    """
+    for key in [key for key in _clients if key[1].is_closed()]:
+        client = _clients.pop(key)
+        try:
+            client.close()
+        except Exception as e:
+            logger.warning(f"Error closing async MongoDB client: {str(e)}")
+
+def get_async_client(uri=None):
+    """
+    Get the pooled Motor client for a URI and the running event loop.
+    
+    Must be called from within a running event loop.
+    
+    Args:
+        uri (str, optional): MongoDB connection URI (defaults to MONGODB_URI)
+    
+    Returns:
+        AsyncIOMotorClient: A Motor client instance
+    """
+    uri = uri or MONGODB_URI
+    loop = asyncio.get_running_loop()
+    key = (uri, loop)
+    _evict_closed_loops()
+    
+    client = _clients.get(key)
+    if client is None:
+        client = AsyncIOMotorClient(
+            uri,
+            maxPoolSize=MONGODB_MAX_POOL_SIZE,
+            minPoolSize=MONGODB_MIN_POOL_SIZE,
+            waitQueueTimeoutMS=MONGODB_WAIT_QUEUE_TIMEOUT_MS,
+            serverSelectionTimeoutMS=ASYNC_SERVER_SELECTION_TIMEOUT_MS,
+            connectTimeoutMS=ASYNC_CONNECT_TIMEOUT_MS,
+            socketTimeoutMS=ASYNC_SOCKET_TIMEOUT_MS,
+            io_loop=loop
+        )
+        _clients[key] = client
+        logger.info("Created async MongoDB client")
+    return client
+
+def close_async_clients():
+    """
+    Close every pooled Motor client and empty the registry.
+    """
+    for client in _clients.values():
+        try:
+            client.close()
+        except Exception as e:
+            logger.warning(f"Error closing async MongoDB client: {str(e)}")
+    _clients.clear()
+
+def get_async_collection(collection_name):
+    """
+    Get a Motor collection by name.
+    
+    Args:
+        collection_name (str): Name of the collection
+    
+    Returns:
+        AsyncIOMotorCollection: A Motor collection instance
+    """
+    return get_async_client()[DATABASE_NAME][collection_name]
+
+async def get_performance(collection_name, query, projection=None,
+                          max_time_ms=ASYNC_QUERY_MAX_TIME_MS):
+    """
+    Get a single performance matching a query.
+    
+    Args:
+        collection_name (str): Name of the collection
+        query (dict): MongoDB query
+        projection (dict, optional): MongoDB projection (defaults to excluding _id)
+        max_time_ms (int, optional): Server-side time budget in milliseconds
+    
+    Returns:
+        dict: The matching performance, or None if not found
+    """
+    collection = get_async_collection(collection_name)
+    return await collection.find_one(
+        query,
+        projection if projection is not None else {'_id': 0},
+        max_time_ms=max_time_ms
+    )
+
+async def find_performances(collection_name, query=None, projection=None, sort=None,
+                            skip=0, limit=0, batch_size=CURSOR_BATCH_SIZE,
+                            max_time_ms=ASYNC_QUERY_MAX_TIME_MS):
+    """
+    Find performances in a collection.
+    
+    Args:
+        collection_name (str): Name of the collection
+        query (dict, optional): MongoDB query (defaults to all documents)
+        projection (dict, optional): MongoDB projection (defaults to excluding _id)
+        sort (list, optional): List of (field, direction) pairs
+        skip (int, optional): Number of documents to skip
+        limit (int, optional): Maximum number of documents (0 for no limit)
+        batch_size (int, optional): Number of documents per cursor round-trip
+        max_time_ms (int, optional): Server-side time budget in milliseconds
+    
+    Returns:
+        list: List of performance dictionaries
+    """
+    collection = get_async_collection(collection_name)
+    cursor = collection.find(
+        query or {},
+        projection if projection is not None else {'_id': 0},
+        skip=skip,
+        limit=limit,
+        batch_size=batch_size,
+        max_time_ms=max_time_ms
+    )
+    if sort:
+        cursor = cursor.sort(sort)
+    return await cursor.to_list(length=None)
+
+async def search_performances(collection_name, text, fields=('title', 'description'), **kwargs):
+    """
+    Search performances whose fields contain a piece of text (case-insensitive).
+    
+    The text is matched literally; regular expression characters are escaped.
+    
+    Args:
+        collection_name (str): Name of the collection
+        text (str): Text to search for
+        fields (tuple, optional): Fields to search in
+        **kwargs: Extra arguments passed to find_performances
+    
+    Returns:
+        list: List of matching performance dictionaries
+    """
+    pattern = {'$regex': re.escape(text), '$options': 'i'}
+    query = {'$or': [{field: pattern} for field in fields]}
+    return await find_performances(collection_name, query, **kwargs)
+
+async def count_performances(collection_name, query=None, max_time_ms=ASYNC_QUERY_MAX_TIME_MS):
+    """
+    Count performances matching a query.
+    
+    Args:
+        collection_name (str): Name of the collection
+        query (dict, optional): MongoDB query (defaults to all documents)
+        max_time_ms (int, optional): Server-side time budget in milliseconds
+    
+    Returns:
+        int: Number of matching documents
+    """
+    collection = get_async_collection(collection_name)
+    return await collection.count_documents(query or {}, maxTimeMS=max_time_ms)
+
+async def bulk_upsert_performances(collection_name, performances, batch_size=BULK_WRITE_BATCH_SIZE):
+    """
+    Upsert performances using batched, unordered bulk writes.
+    
+    Args:
+        collection_name (str): Name of the collection
+        performances (list): List of performance dictionaries
+        batch_size (int, optional): Maximum number of upserts per bulk_write call
+    
+    Returns:
+        list: One dictionary per batch with 'batch', 'size', 'matched',
+              'modified' and 'upserted' counts
+    
+    Raises:
+        ValueError: If batch_size is not a positive integer
+    """
+    if batch_size < 1:
+        raise ValueError(f"batch_size must be a positive integer, got {batch_size}")
+    
+    collection = get_async_collection(collection_name)
+    batch_results = []
+    for start in range(0, len(performances), batch_size):
+        batch = performances[start:start + batch_size]
+        operations = [
+            UpdateOne({'title': performance['title']}, {'$set': performance}, upsert=True)
+            for performance in batch
+        ]
+        result = await collection.bulk_write(operations, ordered=False)
+        batch_results.append({
+            'batch': len(batch_results),
+            'size': len(batch),
+            'matched': result.matched_count,
+            'modified': result.modified_count,
+            'upserted': result.upserted_count
+        })
+    return batch_results
+
+async def find_across_collections(collection_names, query=None, **kwargs):
+    """
+    Run the same find on several collections concurrently.
+    
+    Args:
+        collection_names (list): Names of the collections to query
+        query (dict, optional): MongoDB query (defaults to all documents)
+        **kwargs: Extra arguments passed to find_performances
+    
+    Returns:
+        dict: Collection name -> list of performance dictionaries
+    """
+    results = await asyncio.gather(*[
+        find_performances(collection_name, query, **kwargs)
+        for collection_name in collection_names
+    ])
+    return dict(zip(collection_names, results))
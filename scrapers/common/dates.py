@@ -0,0 +1,304 @@
+"""
+Date parsing engine for ballet performance data.
+
+Scrapers, ingest-time normalization and the API all turn the free-text
+'date' of a performance into a date range with parse_performance_dates.
+The patterns are compiled once. The leading token of the text picks the
+patterns tried first ("from ...", a day number, "on ...", a month name).
+Month names are looked up in a table instead of retrying strptime formats,
+and results are cached per raw string, since the same few strings come up
+again and again.
+
+Run "python -m scrapers.common.dates" for a micro-benchmark.
+"""
+
+import os
+import re
+import time
+import logging
+import functools
+from datetime import date
+from collections import namedtuple
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+# Number of distinct date strings whose parse results are kept
+DATE_CACHE_SIZE = int(os.getenv('DATE_CACHE_SIZE', 4096))
+
+# How sure each method is about the range it returns: exact patterns, a
+# month or year named in the text, or nothing usable
+METHOD_CONFIDENCE = {
+    'from_to': 1.0,
+    'on': 1.0,
+    'day_range': 1.0,
+    'full_range': 1.0,
+    'range': 1.0,
+    'single': 1.0,
+    'month': 0.5,
+    'year': 0.2,
+    'none': 0.0
+}
+
+# Month names and abbreviations -> month number
+MONTHS = {
+    'january': 1, 'february': 2, 'march': 3, 'april': 4, 'may': 5, 'june': 6,
+    'july': 7, 'august': 8, 'september': 9, 'october': 10, 'november': 11, 'december': 12,
+    'jan': 1, 'feb': 2, 'mar': 3, 'apr': 4, 'jun': 6, 'jul': 7, 'aug': 8,
+    'sep': 9, 'sept': 9, 'oct': 10, 'nov': 11, 'dec': 12
+}
+
+# Days in each month, ignoring leap years like the month fallback always did
+MONTH_LENGTHS = (31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+
+class DateRange(namedtuple('DateRange', ['start', 'end', 'method', 'confidence'])):
+    """
+    Result of parse_performance_dates.
+    
+    start and end are datetime.date objects (None when nothing was found),
+    method names the pattern or fallback that produced them and confidence
+    is METHOD_CONFIDENCE[method].
+    """
+    __slots__ = ()
+    
+    @property
+    def exact(self):
+        """Whether the range comes from an exact pattern rather than a fallback."""
+        return self.confidence >= 1.0
+
+NO_DATES = DateRange(None, None, 'none', 0.0)
+
+# Building blocks, applied to lowercased text
+_DAY = r'(\d{1,2})(?:st|nd|rd|th)?'
+_MONTH = r'([a-z]+)\.?'
+_YEAR = r'(\d{4})'
+_DASH = r'\s*[–—-]\s*'
+
+def _day(day, month, year):
+    """
+    Build a date from its parts.
+    
+    Returns:
+        date: The date, or None if the month is unknown or the day invalid
+    """
+    month_number = MONTHS.get(month)
+    if month_number is None:
+        return None
+    try:
+        return date(int(year), month_number, int(day))
+    except ValueError:
+        return None
+
+def _range(start, end):
+    """
+    Order a parsed range whose start year was inferred from its end.
+    
+    "from 28 Dec to 3 Jan 2026" starts in the previous year.
+    
+    Returns:
+        tuple: (start, end), or None if either date is invalid
+    """
+    if start is None or end is None:
+        return None
+    if start > end:
+        try:
+            start = start.replace(year=start.year - 1)
+        except ValueError:
+            return None
+    return start, end
+
+def _from_to(match):
+    # [from] 28 sep to 31 oct 2025
+    day1, month1, day2, month2, year = match.groups()
+    return _range(_day(day1, month1, year), _day(day2, month2, year))
+
+def _from_to_same_month(match):
+    # from 01 to 31 dec 2025
+    day1, day2, month, year = match.groups()
+    return _range(_day(day1, month, year), _day(day2, month, year))
+
+def _single_day_first(match):
+    # on 12 may 2025, 12 may 2025
+    day = _day(*match.groups())
+    return (day, day) if day else None
+
+def _day_range(match):
+    # 23 – 25 may 2025
+    day1, day2, month, year = match.groups()
+    return _range(_day(day1, month, year), _day(day2, month, year))
+
+def _full_range(match):
+    # 19 september 2024 – 23 march 2025
+    day1, month1, year1, day2, month2, year2 = match.groups()
+    start, end = _day(day1, month1, year1), _day(day2, month2, year2)
+    return (start, end) if start and end else None
+
+def _month_first_range(match):
+    # may 7 - june 3, 2024 or may 7, 2024 - june 3, 2024
+    month1, day1, year1, month2, day2, year2 = match.groups()
+    return _range(_day(day1, month1, year1 or year2), _day(day2, month2, year2))
+
+def _month_first_same_month(match):
+    # may 7 - 10, 2024
+    month, day1, day2, year = match.groups()
+    return _range(_day(day1, month, year), _day(day2, month, year))
+
+def _single_month_first(match):
+    # may 7, 2024
+    month, day, year = match.groups()
+    day = _day(day, month, year)
+    return (day, day) if day else None
+
+# (compiled pattern, method, builder returning (start, end) or None)
+FROM_TO_PATTERNS = [
+    (re.compile(rf'(?:from\s+)?{_DAY}\s+{_MONTH}\s+to\s+{_DAY}\s+{_MONTH}\s+{_YEAR}'), 'from_to', _from_to),
+    (re.compile(rf'from\s+{_DAY}\s+to\s+{_DAY}\s+{_MONTH}\s+{_YEAR}'), 'from_to', _from_to_same_month)
+]
+ON_PATTERNS = [
+    (re.compile(rf'\bon\s+{_DAY}\s+{_MONTH}\s+{_YEAR}'), 'on', _single_day_first)
+]
+DAY_FIRST_PATTERNS = [
+    (re.compile(rf'{_DAY}\s+{_MONTH}\s+{_YEAR}{_DASH}{_DAY}\s+{_MONTH}\s+{_YEAR}'), 'full_range', _full_range),
+    (re.compile(rf'{_DAY}{_DASH}{_DAY}\s+{_MONTH}\s+{_YEAR}'), 'day_range', _day_range),
+    (re.compile(rf'{_DAY}\s+{_MONTH}\s+{_YEAR}'), 'single', _single_day_first)
+]
+MONTH_FIRST_PATTERNS = [
+    (re.compile(rf'{_MONTH}\s+{_DAY}(?:,?\s+{_YEAR})?{_DASH}{_MONTH}\s+{_DAY},?\s+{_YEAR}'), 'range', _month_first_range),
+    (re.compile(rf'{_MONTH}\s+{_DAY}{_DASH}{_DAY},?\s+{_YEAR}'), 'range', _month_first_same_month),
+    (re.compile(rf'{_MONTH}\s+{_DAY},?\s+{_YEAR}'), 'single', _single_month_first)
+]
+ALL_PATTERNS = FROM_TO_PATTERNS + ON_PATTERNS + DAY_FIRST_PATTERNS + MONTH_FIRST_PATTERNS
+
+# Patterns tried first, by leading token; the others are tried afterwards
+DISPATCH = {
+    'from': FROM_TO_PATTERNS,
+    'on': ON_PATTERNS,
+    'day': FROM_TO_PATTERNS + DAY_FIRST_PATTERNS,
+    'month': MONTH_FIRST_PATTERNS
+}
+
+MONTH_NAME_PATTERN = re.compile(r'\b(' + '|'.join(sorted(MONTHS, key=len, reverse=True)) + r')\b')
+YEAR_PATTERN = re.compile(r'\b(\d{4})\b')
+
+def _leading_token(text):
+    """
+    Classify the first token of a lowercased date string.
+    """
+    if text[:1].isdigit():
+        return 'day'
+    first = text.split(None, 1)[0]
+    if first in ('from', 'on'):
+        return first
+    return 'month' if first.rstrip('.,') in MONTHS else None
+
+def _fallback(text):
+    """
+    Span the month named in a date string, or its year.
+    """
+    year_match = YEAR_PATTERN.search(text)
+    if not year_match:
+        return NO_DATES
+    year = int(year_match.group(1))
+    
+    month_match = MONTH_NAME_PATTERN.search(text)
+    if month_match:
+        month = MONTHS[month_match.group(1)]
+        start, end = date(year, month, 1), date(year, month, MONTH_LENGTHS[month - 1])
+        return DateRange(start, end, 'month', METHOD_CONFIDENCE['month'])
+    return DateRange(date(year, 1, 1), date(year, 12, 31), 'year', METHOD_CONFIDENCE['year'])
+
+@functools.lru_cache(maxsize=DATE_CACHE_SIZE)
+def _parse(text):
+    lowered = ' '.join(text.lower().split())
+    if not lowered:
+        return NO_DATES
+    
+    preferred = DISPATCH.get(_leading_token(lowered), [])
+    for patterns in (preferred, [entry for entry in ALL_PATTERNS if entry not in preferred]):
+        for pattern, method, build in patterns:
+            match = pattern.search(lowered)
+            if not match:
+                continue
+            dates = build(match)
+            if dates:
+                return DateRange(dates[0], dates[1], method, METHOD_CONFIDENCE[method])
+    
+    return _fallback(lowered)
+
+def parse_performance_dates(text):
+    """
+    Parse the date range of a performance.
+    
+    Handles "from 28 Sep to 31 Oct 2025", "from 01 to 31 Dec 2025",
+    "20 Dec to 31 Dec 2024", "on 12 May 2025", "23 – 25 May 2025",
+    "19 September 2024 – 23 March 2025", "May 7 - June 3, 2024",
+    "May 7 - 10, 2024", "May 7, 2024" and "12 May 2025". Otherwise the month
+    or the year named in the text is spanned, with a lower confidence.
+    
+    Args:
+        text (str): Date string, may be empty or None
+    
+    Returns:
+        DateRange: (start, end, method, confidence)
+    """
+    if not text or not isinstance(text, str):
+        return NO_DATES
+    return _parse(text)
+
+def clear_cache():
+    """
+    Forget every cached parse result.
+    """
+    _parse.cache_clear()
+
+def cache_info():
+    """
+    Get the parse cache counters.
+    
+    Returns:
+        functools._CacheInfo: Hits, misses, maximum and current size
+    """
+    return _parse.cache_info()
+
+# Date strings as scraped from the company websites, for the benchmark
+BENCHMARK_SAMPLES = [
+    'from 28 Sep to 31 Oct 2025',
+    'from 01 to 31 Dec 2025',
+    '20 Dec to 31 Dec 2024',
+    'on 12 May 2025 at 8pm',
+    '23 – 25 May 2025',
+    '19 September 2024 – 23 March 2025',
+    'May 7 - June 3, 2024',
+    'October 17th, 2024 - November 3rd, 2024',
+    'May 7, 2024',
+    'Season 2025'
+]
+
+def benchmark(samples=BENCHMARK_SAMPLES, rounds=2000):
+    """
+    Time parse_performance_dates with a cold and a warm cache.
+    
+    Args:
+        samples (list, optional): Date strings to parse
+        rounds (int, optional): Number of passes over the samples
+    
+    Returns:
+        dict: Microseconds per parse for 'cold' (cache cleared before every
+              pass) and 'warm' parses
+    """
+    results = {}
+    for name, clear in (('cold', True), ('warm', False)):
+        elapsed = 0.0
+        for _ in range(rounds):
+            if clear:
+                clear_cache()
+            started = time.perf_counter()
+            for sample in samples:
+                parse_performance_dates(sample)
+            elapsed += time.perf_counter() - started
+        results[name] = elapsed / (rounds * len(samples)) * 1e6
+    return results
+
+if __name__ == '__main__':
+    for name, microseconds in benchmark().items():
+        print(f"{name}: {microseconds:.2f} µs per date string")
@@ -6,8 +6,12 @@ ensuring consistent database operations and error handling.
 """
 
 import os
+import json
+import atexit
+import hashlib
 import logging
-from pymongo import MongoClient
+import threading
+from pymongo import MongoClient, UpdateOne
 from dotenv import load_dotenv
 
 # Load environment variables
@@ -21,9 +25,73 @@ logger = logging.getLogger(__name__)
 MONGODB_URI = os.getenv('MONGODB_URI')
 DATABASE_NAME = os.getenv('DATABASE_NAME')
 
-def get_mongodb_client():
+# Per-company collections
+POB_COLLECTION = os.getenv('COLLECTION_NAME', 'paris_opera_ballet')
+BOLSHOI_COLLECTION = os.getenv('BOLSHOI_COLLECTION_NAME', 'bolshoi_ballet')
+BOSTON_COLLECTION = os.getenv('BOSTON_COLLECTION_NAME', 'boston_ballet')
+
+# Company ID -> per-company collection name
+COMPANY_COLLECTIONS = {
+    'paris_opera_ballet': POB_COLLECTION,
+    'bolshoi_ballet': BOLSHOI_COLLECTION,
+    'boston_ballet': BOSTON_COLLECTION
+}
+
+# Unified collection holding every company's performances, discriminated by
+# an indexed company_id field
+PERFORMANCES_COLLECTION = os.getenv('PERFORMANCES_COLLECTION_NAME', 'performances')
+UNIFIED_COLLECTION_ENABLED = os.getenv('USE_UNIFIED_COLLECTION', 'False').lower() == 'true'
+
+# Collection holding one version stamp per performance collection, bumped
+# whenever stored performances change so readers can invalidate caches
+DATA_VERSIONS_COLLECTION = os.getenv('DATA_VERSIONS_COLLECTION_NAME', 'data_versions')
+
+# Connection pool settings shared by every client in the registry
+MONGODB_MAX_POOL_SIZE = int(os.getenv('MONGODB_MAX_POOL_SIZE', 50))
+MONGODB_MIN_POOL_SIZE = int(os.getenv('MONGODB_MIN_POOL_SIZE', 0))
+MONGODB_WAIT_QUEUE_TIMEOUT_MS = int(os.getenv('MONGODB_WAIT_QUEUE_TIMEOUT_MS', 10000))
+
+# Number of upserts sent to MongoDB in a single bulk_write call
+BULK_WRITE_BATCH_SIZE = int(os.getenv('BULK_WRITE_BATCH_SIZE', 500))
+
+# Number of documents fetched per cursor round-trip when streaming results
+CURSOR_BATCH_SIZE = int(os.getenv('CURSOR_BATCH_SIZE', 100))
+
+# Fields that change on every scrape without the performance itself changing,
+# and are therefore left out of the content hash
+CONTENT_HASH_EXCLUDED_FIELDS = ('_id', 'last_updated', 'content_hash')
+
+# Process-wide client registry, keyed by URI. MongoClient is thread-safe and
+# owns its own connection pool, so one instance per URI is shared by every
+# caller in the process.
+_clients = {}
+_clients_lock = threading.Lock()
+
+def _reset_clients_after_fork():
     """
-    Get a MongoDB client instance.
+    Forget clients inherited from the parent process.
+    
+    PyMongo clients are not fork-safe: the child must open its own pools
+    instead of reusing the parent's sockets.
+    """
+    global _clients_lock
+    _clients_lock = threading.Lock()
+    _clients.clear()
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_reset_clients_after_fork)
+
+def get_mongodb_client(uri=None, ping=True):
+    """
+    Get the pooled MongoDB client for a URI.
+    
+    The client is created lazily on first use and reused by every later call
+    in the same process.
+    
+    Args:
+        uri (str, optional): MongoDB connection URI (defaults to MONGODB_URI)
+        ping (bool, optional): Whether to verify the connection when the client
+                               is first created
     
     Returns:
         MongoClient: A MongoDB client instance
@@ -31,15 +99,45 @@ def get_mongodb_client():
     Raises:
         Exception: If connection to MongoDB fails
     """
-    try:
-        client = MongoClient(MONGODB_URI)
-        # Test the connection
-        client.admin.command('ping')
-        logger.info("Successfully connected to MongoDB")
+    uri = uri or MONGODB_URI
+    with _clients_lock:
+        client = _clients.get(uri)
+        if client is not None:
+            return client
+        
+        try:
+            client = MongoClient(
+                uri,
+                maxPoolSize=MONGODB_MAX_POOL_SIZE,
+                minPoolSize=MONGODB_MIN_POOL_SIZE,
+                waitQueueTimeoutMS=MONGODB_WAIT_QUEUE_TIMEOUT_MS
+            )
+            if ping:
+                # Test the connection
+                client.admin.command('ping')
+                logger.info("Successfully connected to MongoDB")
+        except Exception as e:
+            logger.error(f"Failed to connect to MongoDB: {str(e)}")
+            raise
+        
+        _clients[uri] = client
         return client
-    except Exception as e:
-        logger.error(f"Failed to connect to MongoDB: {str(e)}")
-        raise
+
+def close_mongodb_clients():
+    """
+    Close every pooled MongoDB client and empty the registry.
+    
+    Registered with atexit so pools are shut down cleanly when the process exits.
+    """
+    with _clients_lock:
+        for client in _clients.values():
+            try:
+                client.close()
+            except Exception as e:
+                logger.warning(f"Error closing MongoDB client: {str(e)}")
+        _clients.clear()
+
+atexit.register(close_mongodb_clients)
 
 def get_database():
     """
@@ -64,32 +162,250 @@ def get_collection(collection_name):
     db = get_database()
     return db[collection_name]
 
-def store_performances(collection, performances):
+def bulk_upsert_performances(collection, performances, batch_size=BULK_WRITE_BATCH_SIZE, scope=None):
     """
-    Store performances in MongoDB.
+    Upsert performances in MongoDB using batched, unordered bulk writes.
+    
+    Each batch is sent as a single bulk_write round-trip. Because the writes
+    are unordered, a failing document does not prevent the rest of its batch
+    from being applied.
     
     Args:
         collection: MongoDB collection
         performances (list): List of performance dictionaries
+        batch_size (int, optional): Maximum number of upserts per bulk_write call
+        scope (dict, optional): Fields added to every upsert filter and document,
+                                e.g. {'company_id': ...} for the unified collection
         
     Returns:
-        bool: True if successful, False otherwise
+        list: One dictionary per batch with 'batch', 'size', 'matched',
+              'modified' and 'upserted' counts
+    
+    Raises:
+        ValueError: If batch_size is not a positive integer
+    """
+    if batch_size < 1:
+        raise ValueError(f"batch_size must be a positive integer, got {batch_size}")
+    
+    scope = scope or {}
+    batch_results = []
+    batch_count = (len(performances) + batch_size - 1) // batch_size
+    for start in range(0, len(performances), batch_size):
+        batch = performances[start:start + batch_size]
+        # The query is based on the title field, which should be unique
+        # within each ballet company's collection
+        operations = [
+            UpdateOne(dict(scope, title=performance['title']), _upsert_update(performance, scope), upsert=True)
+            for performance in batch
+        ]
+        result = collection.bulk_write(operations, ordered=False)
+        batch_results.append({
+            'batch': len(batch_results),
+            'size': len(batch),
+            'matched': result.matched_count,
+            'modified': result.modified_count,
+            'upserted': result.upserted_count
+        })
+        logger.debug(f"Bulk write batch {start // batch_size + 1} of {batch_count}: {batch_results[-1]}")
+    
+    return batch_results
+
+def _upsert_update(performance, scope):
+    """
+    Build the update document for upserting a performance.
+    
+    An existing _id is only applied on insert, since _id cannot be modified.
+    """
+    document = dict(performance, **scope)
+    update = {'$set': document}
+    if '_id' in document:
+        update['$setOnInsert'] = {'_id': document.pop('_id')}
+    return update
+
+def compute_content_hash(performance):
+    """
+    Compute a stable hash of a performance's scraped content.
+    
+    Keys are sorted so the hash does not depend on field order, and the
+    fields in CONTENT_HASH_EXCLUDED_FIELDS are ignored.
+    
+    Args:
+        performance (dict): Performance dictionary
+        
+    Returns:
+        str: Hex-encoded SHA-256 digest
+    """
+    content = {
+        key: value for key, value in performance.items()
+        if key not in CONTENT_HASH_EXCLUDED_FIELDS
+    }
+    serialized = json.dumps(content, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(serialized.encode('utf-8')).hexdigest()
+
+def get_content_hashes(collection, titles, batch_size=BULK_WRITE_BATCH_SIZE, scope=None):
+    """
+    Get the stored content hash for each existing performance title.
+    
+    Args:
+        collection: MongoDB collection
+        titles (list): Performance titles to look up
+        batch_size (int, optional): Maximum number of titles per query
+        scope (dict, optional): Extra filter fields, e.g. {'company_id': ...}
+        
+    Returns:
+        dict: Title -> stored content hash (None for documents stored before
+              content hashing was introduced)
+    """
+    hashes = {}
+    for start in range(0, len(titles), batch_size):
+        batch = titles[start:start + batch_size]
+        query = dict(scope or {}, title={'$in': batch})
+        for document in collection.find(query, {'_id': 0, 'title': 1, 'content_hash': 1}):
+            hashes[document['title']] = document.get('content_hash')
+    return hashes
+
+def store_performances(collection, performances, batch_size=BULK_WRITE_BATCH_SIZE, scope=None):
+    """
+    Store performances in MongoDB, skipping those whose content is unchanged.
+    
+    A content hash is stored on every document. Performances whose hash
+    matches the stored one are not written at all, so their last_updated
+    timestamp is preserved. The collection's version stamp is bumped when
+    anything was written, even if a later batch failed.
+    
+    Args:
+        collection: MongoDB collection
+        performances (list): List of performance dictionaries
+        batch_size (int, optional): Maximum number of upserts per bulk_write call
+        scope (dict, optional): Fields added to every upsert filter and document,
+                                e.g. {'company_id': ...} for the unified collection
+        
+    Returns:
+        dict: Summary with 'inserted', 'changed' and 'unchanged' counts and the
+              per-batch 'batches' results, or None if storing failed
     """
     try:
+        stored_hashes = get_content_hashes(
+            collection, [performance['title'] for performance in performances], batch_size, scope
+        )
+        
+        summary = {'inserted': 0, 'changed': 0, 'unchanged': 0}
+        pending = []
         for performance in performances:
-            # Use upsert to update existing entries or insert new ones
-            # The query is based on the title field, which should be unique
-            # within each ballet company's collection
-            collection.update_one(
-                {'title': performance['title']},
-                {'$set': performance},
-                upsert=True
-            )
-        logger.info(f"Stored {len(performances)} performances in MongoDB")
-        return True
+            content_hash = compute_content_hash(performance)
+            title = performance['title']
+            if title not in stored_hashes:
+                summary['inserted'] += 1
+            elif stored_hashes[title] == content_hash:
+                summary['unchanged'] += 1
+                continue
+            else:
+                summary['changed'] += 1
+            pending.append(dict(performance, content_hash=content_hash))
+        
+        try:
+            summary['batches'] = bulk_upsert_performances(collection, pending, batch_size, scope)
+        finally:
+            # Batches written before a failure stay persisted, and a failed
+            # unordered batch may still have applied some of its upserts
+            if pending:
+                bump_data_version(collection.database, collection.name)
+        logger.info(
+            f"Stored {len(performances)} performances in MongoDB "
+            f"({summary['inserted']} inserted, {summary['changed']} changed, "
+            f"{summary['unchanged']} unchanged, {len(summary['batches'])} batches)"
+        )
+        return summary
     except Exception as e:
         logger.error(f"Error storing performances in MongoDB: {str(e)}")
-        return False
+        return None
+
+def update_performance(collection, query, fields):
+    """
+    Set fields on one stored performance.
+    
+    The collection's version stamp is bumped when the document changed, so
+    cached responses and ETags do not keep serving the old values.
+    
+    Args:
+        collection: MongoDB collection
+        query (dict): MongoDB query selecting the performance
+        fields (dict): Field name -> new value
+        
+    Returns:
+        UpdateResult: Result of the update
+    """
+    result = collection.update_one(query, {'$set': fields})
+    if result.modified_count:
+        bump_data_version(collection.database, collection.name)
+    return result
+
+def bump_data_version(database, collection_name):
+    """
+    Record that the performances in a collection changed.
+    
+    Args:
+        database: MongoDB database
+        collection_name (str): Name of the changed collection
+    """
+    database[DATA_VERSIONS_COLLECTION].update_one(
+        {'_id': collection_name},
+        {'$inc': {'version': 1}, '$currentDate': {'updated_at': True}},
+        upsert=True
+    )
+
+def get_data_version(database, collection_name):
+    """
+    Get the version stamp of a collection.
+    
+    Args:
+        database: MongoDB database
+        collection_name (str): Name of the collection
+        
+    Returns:
+        int: Number of times the collection changed, 0 if it never did
+    """
+    stamp = database[DATA_VERSIONS_COLLECTION].find_one({'_id': collection_name}, {'version': 1})
+    return stamp['version'] if stamp else 0
+
+def iter_performances(collection_name, query=None, projection=None, sort=None,
+                      batch_size=CURSOR_BATCH_SIZE, max_time_ms=None):
+    """
+    Lazily iterate over the performances in a collection.
+    
+    Documents are fetched from the server in batches of batch_size and yielded
+    one at a time, so memory use does not grow with the size of the result.
+    
+    Args:
+        collection_name (str): Name of the collection
+        query (dict, optional): MongoDB query (defaults to all documents)
+        projection (dict, optional): MongoDB projection (defaults to excluding _id)
+        sort (list, optional): List of (field, direction) pairs
+        batch_size (int, optional): Number of documents per cursor round-trip
+        max_time_ms (int, optional): Server-side time budget for the query in milliseconds
+        
+    Yields:
+        dict: Performance dictionaries
+    
+    Raises:
+        pymongo.errors.ExecutionTimeout: If the query exceeds max_time_ms
+    """
+    collection = get_collection(collection_name)
+    cursor = collection.find(
+        query or {},
+        projection if projection is not None else {'_id': 0},
+        batch_size=batch_size
+    )
+    if sort:
+        cursor = cursor.sort(sort)
+    if max_time_ms is not None:
+        cursor = cursor.max_time_ms(max_time_ms)
+    
+    try:
+        for performance in cursor:
+            yield performance
+    finally:
+        cursor.close()
 
 def get_all_performances(collection_name):
     """
@@ -102,8 +418,7 @@ def get_all_performances(collection_name):
         list: List of performance dictionaries
     """
     try:
-        collection = get_collection(collection_name)
-        performances = list(collection.find({}, {'_id': 0}))
+        performances = list(iter_performances(collection_name))
         logger.info(f"Retrieved {len(performances)} performances from {collection_name}")
         return performances
     except Exception as e:
@@ -122,8 +437,7 @@ def search_performances(collection_name, query):
         list: List of matching performance dictionaries
     """
     try:
-        collection = get_collection(collection_name)
-        performances = list(collection.find(query, {'_id': 0}))
+        performances = list(iter_performances(collection_name, query))
         logger.info(f"Found {len(performances)} performances matching query in {collection_name}")
         return performances
     except Exception as e:
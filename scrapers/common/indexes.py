@@ -0,0 +1,192 @@
+"""
+Index management for ballet performance collections.
+
+This module declares the indexes every performance collection should have and
+applies them idempotently, so scrapers, the API server and the command line
+can all bootstrap or migrate a database with the same manifest.
+"""
+
+import time
+import logging
+from pymongo import ASCENDING, TEXT
+
+from scrapers.common.db import (
+    get_database,
+    POB_COLLECTION,
+    BOLSHOI_COLLECTION,
+    BOSTON_COLLECTION,
+    PERFORMANCES_COLLECTION
+)
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+# Indexes shared by every performance collection. Each entry is passed to
+# create_index as keys plus options; the name identifies the index when
+# checking whether it already exists.
+PERFORMANCE_INDEXES = [
+    {
+        'name': 'company_title_unique',
+        'keys': [('company', ASCENDING), ('title', ASCENDING)],
+        'options': {'unique': True}
+    },
+    {
+        'name': 'url',
+        'keys': [('url', ASCENDING)],
+        'options': {}
+    },
+    {
+        'name': 'start_end_date',
+        'keys': [('startDate', ASCENDING), ('endDate', ASCENDING)],
+        'options': {}
+    },
+    {
+        'name': 'start_date_company',
+        'keys': [('startDate', ASCENDING), ('company', ASCENDING), ('_id', ASCENDING)],
+        'options': {}
+    },
+    {
+        'name': 'start_day_company',
+        'keys': [('startDay', ASCENDING), ('company', ASCENDING), ('_id', ASCENDING)],
+        'options': {}
+    },
+    {
+        'name': 'end_day',
+        'keys': [('endDay', ASCENDING)],
+        'options': {}
+    },
+    {
+        'name': 'last_updated',
+        'keys': [('last_updated', ASCENDING)],
+        'options': {}
+    },
+    {
+        'name': 'text_search',
+        'keys': [('title', TEXT), ('description', TEXT)],
+        'options': {
+            'weights': {'title': 10, 'description': 1},
+            'default_language': 'english'
+        }
+    }
+]
+
+# Indexes for the unified collection, where every query is scoped by company_id
+UNIFIED_PERFORMANCE_INDEXES = [
+    {
+        'name': 'company_id_title_unique',
+        'keys': [('company_id', ASCENDING), ('title', ASCENDING)],
+        'options': {'unique': True}
+    },
+    {
+        'name': 'company_id_start_date',
+        'keys': [('company_id', ASCENDING), ('startDate', ASCENDING)],
+        'options': {}
+    },
+    {
+        'name': 'company_id_start_day',
+        'keys': [('company_id', ASCENDING), ('startDay', ASCENDING), ('company', ASCENDING), ('_id', ASCENDING)],
+        'options': {}
+    }
+] + PERFORMANCE_INDEXES[1:]
+
+# Index manifest: collection name -> list of index specifications
+INDEX_MANIFEST = {
+    POB_COLLECTION: PERFORMANCE_INDEXES,
+    BOLSHOI_COLLECTION: PERFORMANCE_INDEXES,
+    BOSTON_COLLECTION: PERFORMANCE_INDEXES,
+    PERFORMANCES_COLLECTION: UNIFIED_PERFORMANCE_INDEXES
+}
+
+def ensure_indexes(collection, indexes=PERFORMANCE_INDEXES):
+    """
+    Create any missing indexes on a collection.
+    
+    Indexes that already exist (by name) are left untouched, so this can be
+    called on every startup.
+    
+    Args:
+        collection: MongoDB collection
+        indexes (list, optional): Index specifications to apply
+    
+    Returns:
+        list: One report dictionary per index with 'collection', 'index',
+              'status' ('created', 'exists' or 'failed'), 'seconds' and 'error'
+    """
+    reports = []
+    try:
+        existing = collection.index_information()
+    except Exception as e:
+        logger.error(f"Could not list indexes on {collection.name}: {str(e)}")
+        existing = {}
+    
+    for index in indexes:
+        report = {
+            'collection': collection.name,
+            'index': index['name'],
+            'status': 'exists',
+            'seconds': 0.0,
+            'error': None
+        }
+        
+        if index['name'] not in existing:
+            start = time.perf_counter()
+            try:
+                collection.create_index(index['keys'], name=index['name'], **index['options'])
+                report['status'] = 'created'
+                logger.info(f"Created index {index['name']} on {collection.name}")
+            except Exception as e:
+                report['status'] = 'failed'
+                report['error'] = str(e)
+                logger.error(f"Failed to create index {index['name']} on {collection.name}: {str(e)}")
+            report['seconds'] = time.perf_counter() - start
+        
+        reports.append(report)
+    
+    return reports
+
+def apply_index_manifest(db=None, manifest=None, collection_names=None):
+    """
+    Apply the index manifest to a database.
+    
+    Args:
+        db (Database, optional): MongoDB database (defaults to get_database())
+        manifest (dict, optional): Collection name -> index specifications
+                                   (defaults to INDEX_MANIFEST)
+        collection_names (list, optional): Restrict to these collections
+    
+    Returns:
+        list: Index reports from ensure_indexes for every collection
+    """
+    if db is None:
+        db = get_database()
+    if manifest is None:
+        manifest = INDEX_MANIFEST
+    
+    reports = []
+    for collection_name, indexes in manifest.items():
+        if collection_names and collection_name not in collection_names:
+            continue
+        reports.extend(ensure_indexes(db[collection_name], indexes))
+    
+    created = sum(1 for report in reports if report['status'] == 'created')
+    failed = sum(1 for report in reports if report['status'] == 'failed')
+    logger.info(f"Index manifest applied: {created} created, {failed} failed, {len(reports)} checked")
+    return reports
+
+def format_index_report(reports):
+    """
+    Format index reports as a human-readable table.
+    
+    Args:
+        reports (list): Index reports from ensure_indexes
+    
+    Returns:
+        str: One line per index
+    """
+    lines = []
+    for report in reports:
+        line = f"{report['collection']:<24} {report['index']:<24} {report['status']:<8} {report['seconds']:.3f}s"
+        if report['error']:
+            line += f"  ({report['error']})"
+        lines.append(line)
+    return "\n".join(lines)
@@ -0,0 +1,246 @@
+"""
+MongoDB command timing instrumentation.
+
+A pymongo CommandListener records how long every command takes, grouped by
+collection and command name, as latency histograms. Commands slower than a
+threshold are logged. The collected statistics are available as a plain
+dictionary snapshot and as a one-line summary for logs.
+"""
+
+import os
+import bisect
+import logging
+import threading
+from pymongo import monitoring
+from dotenv import load_dotenv
+
+# Load environment variables
+load_dotenv()
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+# Whether command timing is recorded at all
+COMMAND_MONITORING_ENABLED = os.getenv('MONGO_COMMAND_MONITORING', 'True').lower() == 'true'
+
+# Commands slower than this are logged as warnings
+SLOW_COMMAND_MS = float(os.getenv('MONGO_SLOW_COMMAND_MS', 100))
+
+# Whether scrapers log the command summary at the end of a run
+LOG_COMMAND_STATS = os.getenv('MONGO_LOG_COMMAND_STATS', 'True').lower() == 'true'
+
+# Upper bounds of the latency histogram buckets in milliseconds; slower
+# commands fall into a final overflow bucket
+LATENCY_BUCKETS_MS = (1, 2, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000)
+
+# Collection label for commands that are not tied to a collection (ping, ...)
+NO_COLLECTION = '-'
+
+def _collection_name(event):
+    """
+    Get the collection a started command targets.
+    """
+    command = event.command
+    if event.command_name == 'getMore':
+        return command.get('collection', NO_COLLECTION)
+    value = command.get(event.command_name)
+    return value if isinstance(value, str) else NO_COLLECTION
+
+class LatencyHistogram:
+    """
+    Fixed-bucket latency histogram for one (collection, command) pair.
+    """
+    
+    def __init__(self):
+        self.count = 0
+        self.failed = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+        self.buckets = [0] * (len(LATENCY_BUCKETS_MS) + 1)
+    
+    def record(self, duration_ms, failed=False):
+        self.count += 1
+        self.failed += int(failed)
+        self.total_ms += duration_ms
+        self.max_ms = max(self.max_ms, duration_ms)
+        self.buckets[bisect.bisect_left(LATENCY_BUCKETS_MS, duration_ms)] += 1
+    
+    def percentile(self, fraction):
+        """
+        Estimate a percentile as the upper bound of the bucket that contains it.
+        
+        Args:
+            fraction (float): Percentile between 0 and 1
+            
+        Returns:
+            float: Estimated latency in milliseconds (max_ms for the overflow bucket)
+        """
+        if not self.count:
+            return 0.0
+        
+        rank = fraction * self.count
+        seen = 0
+        for index, bucket_count in enumerate(self.buckets):
+            seen += bucket_count
+            if seen >= rank:
+                return float(LATENCY_BUCKETS_MS[index]) if index < len(LATENCY_BUCKETS_MS) else self.max_ms
+        return self.max_ms
+    
+    def snapshot(self):
+        labels = [f"<={bound}ms" for bound in LATENCY_BUCKETS_MS] + [f">{LATENCY_BUCKETS_MS[-1]}ms"]
+        return {
+            'count': self.count,
+            'failed': self.failed,
+            'total_ms': round(self.total_ms, 3),
+            'mean_ms': round(self.total_ms / self.count, 3) if self.count else 0.0,
+            'max_ms': round(self.max_ms, 3),
+            'p50_ms': self.percentile(0.5),
+            'p95_ms': self.percentile(0.95),
+            'p99_ms': self.percentile(0.99),
+            'buckets': {label: count for label, count in zip(labels, self.buckets) if count}
+        }
+
+class CommandTimer(monitoring.CommandListener):
+    """
+    Command listener that records MongoDB command latencies.
+    
+    Usage:
+        timer = register_command_listener()
+        ...
+        logger.info(format_command_stats(timer.snapshot()))
+    """
+    
+    def __init__(self, slow_command_ms=SLOW_COMMAND_MS):
+        """
+        Create the listener.
+        
+        Args:
+            slow_command_ms (float, optional): Log commands slower than this
+        """
+        self.slow_command_ms = slow_command_ms
+        self._lock = threading.Lock()
+        # (connection_id, request_id) -> (collection, command) of in-flight commands
+        self._in_flight = {}
+        # (collection, command) -> LatencyHistogram
+        self._histograms = {}
+    
+    def started(self, event):
+        with self._lock:
+            self._in_flight[(event.connection_id, event.request_id)] = (
+                _collection_name(event), event.command_name
+            )
+    
+    def succeeded(self, event):
+        self._finish(event, failed=False)
+    
+    def failed(self, event):
+        self._finish(event, failed=True)
+    
+    def _finish(self, event, failed):
+        duration_ms = event.duration_micros / 1000.0
+        with self._lock:
+            key = self._in_flight.pop((event.connection_id, event.request_id), None)
+            if key is None:
+                key = (NO_COLLECTION, event.command_name)
+            histogram = self._histograms.get(key)
+            if histogram is None:
+                histogram = self._histograms[key] = LatencyHistogram()
+            histogram.record(duration_ms, failed)
+        
+        if duration_ms >= self.slow_command_ms:
+            collection, command = key
+            logger.warning(
+                f"Slow MongoDB command: {command} on {collection} took {duration_ms:.1f} ms"
+                + (" (failed)" if failed else "")
+            )
+    
+    def snapshot(self):
+        """
+        Get the statistics recorded so far.
+        
+        Returns:
+            dict: "collection.command" -> histogram statistics (count, failed,
+                  total_ms, mean_ms, max_ms, p50_ms, p95_ms, p99_ms, buckets)
+        """
+        with self._lock:
+            return {
+                f"{collection}.{command}": histogram.snapshot()
+                for (collection, command), histogram in sorted(self._histograms.items())
+            }
+    
+    def reset(self):
+        """
+        Forget all recorded statistics.
+        """
+        with self._lock:
+            self._histograms.clear()
+
+# Process-wide listener, registered with pymongo at most once
+_command_timer = None
+_command_timer_lock = threading.Lock()
+
+def register_command_listener():
+    """
+    Register the shared CommandTimer with pymongo.
+    
+    Listeners registered this way apply to clients created afterwards, so
+    this should be called before the first MongoDB client is opened. Calling
+    it again returns the same listener.
+    
+    Returns:
+        CommandTimer: The shared listener, or None if MONGO_COMMAND_MONITORING is off
+    """
+    global _command_timer
+    if not COMMAND_MONITORING_ENABLED:
+        return None
+    
+    with _command_timer_lock:
+        if _command_timer is None:
+            _command_timer = CommandTimer()
+            monitoring.register(_command_timer)
+        return _command_timer
+
+def get_command_stats():
+    """
+    Get a snapshot of the shared listener's statistics.
+    
+    Returns:
+        dict: Statistics as returned by CommandTimer.snapshot(), empty if the
+              listener has not been registered
+    """
+    return _command_timer.snapshot() if _command_timer is not None else {}
+
+def reset_command_stats():
+    """
+    Clear the shared listener's statistics, e.g. at the start of a scrape run.
+    """
+    if _command_timer is not None:
+        _command_timer.reset()
+
+def format_command_stats(stats):
+    """
+    Format command statistics as a single log line.
+    
+    Args:
+        stats (dict): Statistics as returned by CommandTimer.snapshot()
+        
+    Returns:
+        str: Summary ordered by total time, slowest first
+    """
+    if not stats:
+        return "MongoDB commands: none recorded"
+    
+    ordered = sorted(stats.items(), key=lambda item: item[1]['total_ms'], reverse=True)
+    parts = [
+        f"{name} n={entry['count']} total={entry['total_ms']:.1f}ms "
+        f"p50<={entry['p50_ms']:g}ms p95<={entry['p95_ms']:g}ms max={entry['max_ms']:.1f}ms"
+        for name, entry in ordered
+    ]
+    return "MongoDB commands: " + "; ".join(parts)
+
+def log_command_stats():
+    """
+    Log the shared listener's statistics if MONGO_LOG_COMMAND_STATS is on.
+    """
+    if LOG_COMMAND_STATS and _command_timer is not None:
+        logger.info(format_command_stats(get_command_stats()))
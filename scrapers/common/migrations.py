@@ -0,0 +1,96 @@
+"""
+Data migrations for ballet performance collections.
+
+This module copies performances from the per-company collections into the
+unified performances collection, where each document carries a company_id
+discriminator, and backfills the ingest-time normalized fields of
+performances stored before normalization existed.
+"""
+
+import logging
+
+from scrapers.common.db import (
+    COMPANY_COLLECTIONS,
+    PERFORMANCES_COLLECTION,
+    BULK_WRITE_BATCH_SIZE
+)
+from scrapers.common.storage import get_storage_backend
+from scrapers.common.normalize import normalize_performances
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+def migrate_to_unified_collection(storage=None, company_ids=None, batch_size=BULK_WRITE_BATCH_SIZE):
+    """
+    Copy performances from the per-company collections into the unified collection.
+    
+    Documents keep their _id and are upserted by (company_id, title), and
+    unchanged documents are skipped by content hash. The migration can
+    therefore be re-run safely to bring the unified collection up to date.
+    
+    Args:
+        storage (StorageBackend, optional): Storage backend (defaults to get_storage_backend())
+        company_ids (list, optional): Only migrate these companies
+        batch_size (int, optional): Maximum number of upserts per round-trip
+        
+    Returns:
+        dict: Company ID -> store_performances summary (None if that company failed)
+    """
+    if storage is None:
+        storage = get_storage_backend()
+    
+    storage.ensure_indexes(PERFORMANCES_COLLECTION)
+    
+    results = {}
+    for company_id, collection_name in COMPANY_COLLECTIONS.items():
+        if company_ids and company_id not in company_ids:
+            continue
+        
+        performances = list(storage.find(collection_name))
+        logger.info(f"Migrating {len(performances)} performances from {collection_name}")
+        results[company_id] = storage.store_performances(
+            PERFORMANCES_COLLECTION, performances, batch_size, scope={'company_id': company_id}
+        )
+    
+    return results
+
+def backfill_normalized_fields(storage=None, company_ids=None, batch_size=BULK_WRITE_BATCH_SIZE):
+    """
+    Normalize the stored performances that predate ingest-time normalization.
+    
+    Only documents without a date_parse_method are read, in the per-company
+    collections and in the unified collection, so the backfill can be re-run
+    safely and does nothing once every document is normalized.
+    
+    Args:
+        storage (StorageBackend, optional): Storage backend (defaults to get_storage_backend())
+        company_ids (list, optional): Only backfill these companies
+        batch_size (int, optional): Maximum number of upserts per round-trip
+        
+    Returns:
+        dict: Collection name -> company ID -> store_performances summary
+              (None if that company failed)
+    """
+    if storage is None:
+        storage = get_storage_backend()
+    
+    pending = {'date_parse_method': {'$exists': False}}
+    results = {}
+    for company_id, collection_name in COMPANY_COLLECTIONS.items():
+        if company_ids and company_id not in company_ids:
+            continue
+        
+        targets = [
+            (collection_name, pending, None),
+            (PERFORMANCES_COLLECTION, dict(pending, company_id=company_id), {'company_id': company_id})
+        ]
+        for target_name, query, scope in targets:
+            performances = normalize_performances(storage.find(target_name, query), company_id)
+            if not performances:
+                continue
+            logger.info(f"Normalizing {len(performances)} performances in {target_name} for {company_id}")
+            results.setdefault(target_name, {})[company_id] = storage.store_performances(
+                target_name, performances, batch_size, scope=scope
+            )
+    
+    return results
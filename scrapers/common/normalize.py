@@ -0,0 +1,110 @@
+"""
+Ingest-time normalization of ballet performance data.
+
+Scrapers run every performance through normalize_performance before storing
+it, so dates, image and venue defaults are computed once per scrape rather
+than on every API request. Normalized documents carry:
+
+- startDate / endDate: ISO dates parsed from the free-text 'date' field by
+  scrapers.common.dates.parse_performance_dates
+- startDay / endDay: the same dates as days since 1970-01-01, for cheap
+  range comparisons
+- image / venue: the frontend image and a company default venue
+- date_parse_method: how the dates were obtained (see DATE_PARSE_METHODS);
+  its presence marks the document as normalized
+
+Documents stored before normalization existed are brought up to date with
+backfill_normalized_fields in scrapers.common.migrations.
+"""
+
+import logging
+from datetime import date
+
+from scrapers.common.dates import METHOD_CONFIDENCE, parse_performance_dates
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+# Fields written by normalize_performance
+NORMALIZED_FIELDS = ('startDate', 'endDate', 'startDay', 'endDay', 'image', 'venue', 'date_parse_method')
+
+# Values of date_parse_method: the methods of parse_performance_dates, or
+# dates already set by the scraper
+DATE_PARSE_METHODS = tuple(METHOD_CONFIDENCE) + ('scraped',)
+
+# Image used when a performance has no thumbnail
+PLACEHOLDER_IMAGE = 'placeholder.jpg'
+
+# Venue used when a performance has none, per company
+DEFAULT_VENUES = {
+    'paris_opera_ballet': 'Venue information unavailable',
+    'bolshoi_ballet': 'Bolshoi Theatre',
+    'boston_ballet': 'Venue information unavailable'
+}
+
+# Day numbers count from this date
+EPOCH = date(1970, 1, 1)
+
+def epoch_day(iso_date):
+    """
+    Convert an ISO date to a day number.
+    
+    Args:
+        iso_date (str): Date as YYYY-MM-DD
+    
+    Returns:
+        int: Days since 1970-01-01, or None if the date is invalid
+    """
+    try:
+        return (date.fromisoformat(iso_date) - EPOCH).days
+    except (TypeError, ValueError):
+        return None
+
+def normalize_performance(performance, company_id):
+    """
+    Compute the normalized fields of a performance.
+    
+    Dates parsed from the 'date' field take precedence; when it cannot be
+    parsed precisely, dates already set by the scraper are kept before
+    falling back to a month or year range.
+    
+    Args:
+        performance (dict): Scraped performance
+        company_id (str): Company ID, e.g. 'paris_opera_ballet'
+    
+    Returns:
+        dict: A copy of the performance with the NORMALIZED_FIELDS set
+    """
+    normalized = dict(performance)
+    
+    parsed = parse_performance_dates(performance.get('date'))
+    scraped = (performance.get('startDate'), performance.get('endDate'))
+    fallback = (parsed.start.isoformat(), parsed.end.isoformat()) if parsed.start and parsed.end else None
+    # Scrapers that kept the parser's month or year fallback get its method
+    if not parsed.exact and all(scraped) and scraped != fallback:
+        method = 'scraped'
+    else:
+        method = parsed.method
+        if parsed.start and parsed.end:
+            normalized['startDate'] = parsed.start.isoformat()
+            normalized['endDate'] = parsed.end.isoformat()
+    normalized['startDay'] = epoch_day(normalized.get('startDate'))
+    normalized['endDay'] = epoch_day(normalized.get('endDate'))
+    normalized['date_parse_method'] = method
+    
+    normalized['image'] = performance.get('thumbnail') or performance.get('image') or PLACEHOLDER_IMAGE
+    normalized['venue'] = performance.get('venue') or DEFAULT_VENUES.get(company_id, DEFAULT_VENUES['paris_opera_ballet'])
+    return normalized
+
+def normalize_performances(performances, company_id):
+    """
+    Normalize a batch of performances; see normalize_performance.
+    
+    Args:
+        performances (list): Scraped performances
+        company_id (str): Company ID
+    
+    Returns:
+        list: Normalized copies, in the same order
+    """
+    return [normalize_performance(performance, company_id) for performance in performances]
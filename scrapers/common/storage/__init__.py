@@ -0,0 +1,57 @@
+"""
+Pluggable storage for ballet performance data.
+
+The engine is chosen with the STORAGE_BACKEND environment variable:
+
+    mongo   MongoDB (default), configured by MONGODB_URI and DATABASE_NAME
+    sqlite  Embedded SQLite database in WAL mode, stored at SQLITE_PATH
+    memory  Process-local dictionaries, nothing is persisted
+"""
+
+import os
+import threading
+from dotenv import load_dotenv
+
+from scrapers.common.storage.base import StorageBackend
+from scrapers.common.storage.memory import MemoryBackend
+from scrapers.common.storage.mongo import MongoBackend
+from scrapers.common.storage.sqlite import SQLiteBackend
+
+# Load environment variables
+load_dotenv()
+
+# Name of the storage engine to use
+STORAGE_BACKEND = os.getenv('STORAGE_BACKEND', 'mongo').lower()
+
+# Engine name -> backend class
+BACKENDS = {
+    MongoBackend.name: MongoBackend,
+    SQLiteBackend.name: SQLiteBackend,
+    MemoryBackend.name: MemoryBackend
+}
+
+# Shared backend per engine name
+_backends = {}
+_backends_lock = threading.Lock()
+
+def get_storage_backend(name=None):
+    """
+    Get the shared storage backend.
+    
+    Args:
+        name (str, optional): Engine name (defaults to STORAGE_BACKEND)
+        
+    Returns:
+        StorageBackend: The backend, created on first use
+        
+    Raises:
+        ValueError: If the engine name is unknown
+    """
+    name = (name or STORAGE_BACKEND).lower()
+    if name not in BACKENDS:
+        raise ValueError(f"Unknown storage backend: {name} (expected one of {', '.join(BACKENDS)})")
+    
+    with _backends_lock:
+        if name not in _backends:
+            _backends[name] = BACKENDS[name]()
+        return _backends[name]
@@ -0,0 +1,404 @@
+"""
+Storage backend interface for ballet performance data.
+
+Every storage engine implements StorageBackend. Queries, projections and sort
+specifications use the MongoDB syntax, restricted to the subset handled by
+match_query, apply_projection and sort_documents, so callers can switch
+engines without changing their queries.
+"""
+
+import re
+import json
+import secrets
+from abc import ABC, abstractmethod
+
+# Comparison operators supported in queries
+COMPARISON_OPERATORS = {'$eq', '$ne', '$gt', '$gte', '$lt', '$lte', '$in', '$nin', '$exists', '$regex', '$options'}
+
+# Fields covered by $text queries and their weights, as in the text_search index
+TEXT_SEARCH_WEIGHTS = {'title': 10, 'description': 1}
+
+# Words ignored by $text queries
+TEXT_STOP_WORDS = frozenset((
+    'a', 'an', 'and', 'are', 'as', 'at', 'be', 'by', 'for', 'from', 'in', 'is', 'it',
+    'of', 'on', 'or', 'that', 'the', 'this', 'to', 'was', 'with'
+))
+
+# Suffixes removed by the stemmer, longest first, with their replacements
+_STEM_SUFFIXES = (('ies', 'y'), ('ing', ''), ('ed', ''), ('es', ''), ('s', ''), ('e', ''))
+
+class StorageBackend(ABC):
+    """
+    Interface for storing and querying performance documents.
+    
+    Documents are grouped in named collections, as in MongoDB. Engines must
+    implement the abstract methods; the others have working defaults.
+    """
+    
+    # Short name used to select the engine with STORAGE_BACKEND
+    name = None
+    
+    @abstractmethod
+    def store_performances(self, collection_name, performances, batch_size=None, scope=None):
+        """
+        Upsert performances by title, skipping those whose content is unchanged.
+        
+        Args:
+            collection_name (str): Name of the collection
+            performances (list): List of performance dictionaries
+            batch_size (int, optional): Maximum number of writes per round-trip
+            scope (dict, optional): Fields added to every upsert filter and document
+        
+        Returns:
+            dict: Summary with 'inserted', 'changed' and 'unchanged' counts,
+                  or None if storing failed
+        """
+        raise NotImplementedError
+    
+    @abstractmethod
+    def find(self, collection_name, query=None, projection=None, sort=None, skip=0, limit=0):
+        """
+        Iterate over the documents matching a query.
+        
+        Args:
+            collection_name (str): Name of the collection
+            query (dict, optional): Query (defaults to all documents)
+            projection (dict, optional): Projection (defaults to all fields)
+            sort (list, optional): List of (field, direction) pairs
+            skip (int, optional): Number of documents to skip
+            limit (int, optional): Maximum number of documents (0 for no limit)
+        
+        Returns:
+            iterator: Matching documents
+        """
+        raise NotImplementedError
+    
+    def text_search(self, collection_name, text, query=None, sort=None, skip=0, limit=0):
+        """
+        Iterate over the documents matching a full-text search, best first.
+        
+        Words are stemmed and stop words ignored, as in a MongoDB $text query
+        on the text_search index. This default implementation scores the
+        matches in Python; engines with a native text index override it.
+        
+        Args:
+            collection_name (str): Name of the collection
+            text (str): Search text
+            query (dict, optional): Additional query
+            sort (list, optional): List of (field, direction) pairs breaking score ties
+            skip (int, optional): Number of documents to skip
+            limit (int, optional): Maximum number of documents (0 for no limit)
+        
+        Returns:
+            iterator: Matching documents, each with a 'score' field
+        """
+        terms = text_terms(text)
+        text_query = dict(query or {}, **{'$text': {'$search': text}})
+        
+        documents = []
+        for document in self.find(collection_name, text_query):
+            document['score'] = text_score(document, terms)
+            documents.append(document)
+        
+        documents = sort_documents(documents, [('score', -1)] + list(sort or []))
+        documents = documents[skip:skip + limit] if limit else documents[skip:]
+        return iter(documents)
+    
+    def find_one(self, collection_name, query=None, projection=None):
+        """
+        Get the first document matching a query.
+        
+        Args:
+            collection_name (str): Name of the collection
+            query (dict, optional): Query (defaults to all documents)
+            projection (dict, optional): Projection (defaults to all fields)
+        
+        Returns:
+            dict: The matching document, or None if not found
+        """
+        return next(iter(self.find(collection_name, query, projection, limit=1)), None)
+    
+    @abstractmethod
+    def count(self, collection_name, query=None):
+        """
+        Count the documents matching a query.
+        
+        Args:
+            collection_name (str): Name of the collection
+            query (dict, optional): Query (defaults to all documents)
+        
+        Returns:
+            int: Number of matching documents
+        """
+        raise NotImplementedError
+    
+    @abstractmethod
+    def get_data_version(self, collection_name):
+        """
+        Get the version stamp of a collection.
+        
+        The stamp is bumped by store_performances whenever a performance is
+        inserted or changed, so readers can detect stale caches cheaply.
+        
+        Args:
+            collection_name (str): Name of the collection
+        
+        Returns:
+            int: Number of times the collection changed, 0 if it never did
+        """
+        raise NotImplementedError
+    
+    def ensure_indexes(self, collection_name):
+        """
+        Create the indexes the collection needs, if they are missing.
+        
+        Args:
+            collection_name (str): Name of the collection
+        """
+    
+    def close(self):
+        """
+        Release any resources held by the backend.
+        """
+
+def new_document_id():
+    """
+    Generate a document ID for engines without native IDs.
+    
+    Returns:
+        str: 24 hex characters, the same shape as a MongoDB ObjectId
+    """
+    return secrets.token_hex(12)
+
+def upsert_key(title, scope=None):
+    """
+    Build the key that identifies a performance for upserts.
+    
+    Args:
+        title (str): Performance title
+        scope (dict, optional): Extra identifying fields, e.g. {'company_id': ...}
+    
+    Returns:
+        str: A stable string key
+    """
+    return json.dumps([sorted((scope or {}).items()), title], ensure_ascii=False)
+
+def stem(word):
+    """
+    Reduce a lowercase word to a crude stem by removing common English suffixes.
+    
+    Args:
+        word (str): Lowercase word
+    
+    Returns:
+        str: The stem, at least three characters long unless the word is shorter
+    """
+    for suffix, replacement in _STEM_SUFFIXES:
+        if word.endswith(suffix) and len(word) - len(suffix) + len(replacement) >= 3:
+            return word[:len(word) - len(suffix)] + replacement
+    return word
+
+def text_terms(text):
+    """
+    Split text into the stemmed terms used by $text queries.
+    
+    Args:
+        text (str): Text to split
+    
+    Returns:
+        list: Stemmed terms, without stop words
+    """
+    words = re.findall(r'\w+', (text or '').lower())
+    return [stem(word) for word in words if word not in TEXT_STOP_WORDS]
+
+def text_score(document, terms):
+    """
+    Score a document against stemmed search terms.
+    
+    Each field in TEXT_SEARCH_WEIGHTS contributes its weight times the share
+    of its terms that match, so short fields full of matches rank highest.
+    
+    Args:
+        document (dict): Document to score
+        terms (list): Terms from text_terms
+    
+    Returns:
+        float: Relevance score, 0 if no term matches
+    """
+    wanted = set(terms)
+    score = 0.0
+    for field, weight in TEXT_SEARCH_WEIGHTS.items():
+        value = get_field(document, field)
+        if not isinstance(value, str):
+            continue
+        field_terms = text_terms(value)
+        matches = sum(1 for term in field_terms if term in wanted)
+        if matches:
+            score += weight * (matches / len(field_terms) + 1)
+    return score
+
+def get_field(document, field):
+    """
+    Get a possibly dotted field from a document.
+    
+    Returns:
+        The value, or None if any part of the path is missing
+    """
+    value = document
+    for part in field.split('.'):
+        if not isinstance(value, dict) or part not in value:
+            return None
+        value = value[part]
+    return value
+
+def _has_field(document, field):
+    value = document
+    for part in field.split('.'):
+        if not isinstance(value, dict) or part not in value:
+            return False
+        value = value[part]
+    return True
+
+def _compare(value, operand, operator):
+    """
+    Compare two values the way MongoDB does for same-typed values.
+    
+    Values of different types (or None) never satisfy a range comparison.
+    """
+    if value is None or operand is None:
+        return False
+    try:
+        if operator == '$gt':
+            return value > operand
+        if operator == '$gte':
+            return value >= operand
+        if operator == '$lt':
+            return value < operand
+        return value <= operand
+    except TypeError:
+        return False
+
+def _match_condition(document, field, condition):
+    value = get_field(document, field)
+    
+    if not isinstance(condition, dict) or not any(key.startswith('$') for key in condition):
+        return value == condition
+    
+    for operator, operand in condition.items():
+        if operator not in COMPARISON_OPERATORS:
+            raise ValueError(f"Unsupported query operator: {operator}")
+        if operator == '$eq' and value != operand:
+            return False
+        if operator == '$ne' and value == operand:
+            return False
+        if operator in ('$gt', '$gte', '$lt', '$lte') and not _compare(value, operand, operator):
+            return False
+        if operator == '$in' and value not in operand:
+            return False
+        if operator == '$nin' and value in operand:
+            return False
+        if operator == '$exists' and _has_field(document, field) != bool(operand):
+            return False
+        if operator == '$regex':
+            flags = re.IGNORECASE if 'i' in condition.get('$options', '') else 0
+            if not isinstance(value, str) or not re.search(operand, value, flags):
+                return False
+    return True
+
+def match_query(document, query):
+    """
+    Check whether a document matches a MongoDB-style query.
+    
+    Supports field equality, $eq, $ne, $gt, $gte, $lt, $lte, $in, $nin,
+    $exists, $regex (with the 'i' option), $and, $or and $text (with
+    $search only).
+    
+    Args:
+        document (dict): Document to test
+        query (dict): Query
+    
+    Returns:
+        bool: True if the document matches
+    
+    Raises:
+        ValueError: If the query uses an unsupported operator
+    """
+    for key, condition in (query or {}).items():
+        if key == '$or':
+            if not any(match_query(document, sub_query) for sub_query in condition):
+                return False
+        elif key == '$and':
+            if not all(match_query(document, sub_query) for sub_query in condition):
+                return False
+        elif key == '$text':
+            if not text_score(document, text_terms(condition['$search'])):
+                return False
+        elif key.startswith('$'):
+            raise ValueError(f"Unsupported query operator: {key}")
+        elif not _match_condition(document, key, condition):
+            return False
+    return True
+
+def apply_projection(document, projection):
+    """
+    Apply a MongoDB-style projection to a document.
+    
+    Inclusion projections ({'title': 1}) keep only the listed fields (plus
+    _id unless excluded); exclusion projections ({'_id': 0}) drop the listed
+    fields. Only top-level fields are supported.
+    
+    Args:
+        document (dict): Document to project
+        projection (dict): Projection, or None for all fields
+    
+    Returns:
+        dict: A new, projected document
+    """
+    if not projection:
+        return dict(document)
+    
+    included = [field for field, flag in projection.items() if flag and field != '_id']
+    if included:
+        result = {field: document[field] for field in included if field in document}
+        if projection.get('_id', 1) and '_id' in document:
+            result['_id'] = document['_id']
+        return result
+    
+    return {field: value for field, value in document.items() if projection.get(field, 1)}
+
+def _sort_key(value):
+    # None sorts before every other value, as in MongoDB
+    return (value is not None, value)
+
+def sort_key(document, sort):
+    """
+    Build a key that orders documents like an ascending sort specification.
+    
+    Useful to merge documents from several collections that were each
+    sorted by the same specification.
+    
+    Args:
+        document (dict): Document
+        sort (list): List of (field, 1) pairs
+    
+    Returns:
+        tuple: Comparable key
+    """
+    return tuple(_sort_key(get_field(document, field)) for field, _ in sort)
+
+def sort_documents(documents, sort):
+    """
+    Sort documents by a list of (field, direction) pairs.
+    
+    Args:
+        documents (list): Documents to sort
+        sort (list): List of (field, direction) pairs, direction 1 or -1
+    
+    Returns:
+        list: The sorted documents
+    """
+    documents = list(documents)
+    # Stable sorts applied from the least to the most significant key
+    for field, direction in reversed(sort or []):
+        documents.sort(key=lambda document: _sort_key(get_field(document, field)), reverse=direction < 0)
+    return documents
@@ -0,0 +1,80 @@
+"""
+In-memory storage backend.
+
+Keeps every collection in a Python dictionary. Nothing is persisted, which
+makes it suitable for tests, hermetic benchmarks and quick local runs.
+"""
+
+import copy
+import threading
+
+from scrapers.common.db import compute_content_hash
+from scrapers.common.storage.base import (
+    StorageBackend,
+    new_document_id,
+    upsert_key,
+    match_query,
+    apply_projection,
+    sort_documents
+)
+
+class MemoryBackend(StorageBackend):
+    """
+    Storage backend holding documents in process memory.
+    """
+    
+    name = 'memory'
+    
+    def __init__(self):
+        # Collection name -> upsert key -> document
+        self._collections = {}
+        # Collection name -> version stamp
+        self._versions = {}
+        self._lock = threading.Lock()
+    
+    def store_performances(self, collection_name, performances, batch_size=None, scope=None):
+        summary = {'inserted': 0, 'changed': 0, 'unchanged': 0}
+        with self._lock:
+            documents = self._collections.setdefault(collection_name, {})
+            for performance in performances:
+                key = upsert_key(performance['title'], scope)
+                content_hash = compute_content_hash(performance)
+                stored = documents.get(key)
+                
+                if stored is None:
+                    summary['inserted'] += 1
+                    stored = {'_id': performance.get('_id') or new_document_id()}
+                elif stored.get('content_hash') == content_hash:
+                    summary['unchanged'] += 1
+                    continue
+                else:
+                    summary['changed'] += 1
+                
+                # Merge like MongoDB's $set: fields missing from the new
+                # performance are kept
+                update = {field: value for field, value in performance.items() if field != '_id'}
+                stored.update(copy.deepcopy(update), **(scope or {}))
+                stored['content_hash'] = content_hash
+                documents[key] = stored
+            if summary['inserted'] or summary['changed']:
+                self._versions[collection_name] = self._versions.get(collection_name, 0) + 1
+        return summary
+    
+    def find(self, collection_name, query=None, projection=None, sort=None, skip=0, limit=0):
+        with self._lock:
+            documents = list(self._collections.get(collection_name, {}).values())
+        
+        matches = [document for document in documents if match_query(document, query)]
+        if sort:
+            matches = sort_documents(matches, sort)
+        matches = matches[skip:skip + limit] if limit else matches[skip:]
+        return iter([apply_projection(copy.deepcopy(document), projection) for document in matches])
+    
+    def count(self, collection_name, query=None):
+        with self._lock:
+            documents = list(self._collections.get(collection_name, {}).values())
+        return sum(1 for document in documents if match_query(document, query))
+    
+    def get_data_version(self, collection_name):
+        with self._lock:
+            return self._versions.get(collection_name, 0)
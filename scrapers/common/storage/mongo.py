@@ -0,0 +1,97 @@
+"""
+MongoDB storage backend.
+
+Thin adapter over the helpers in scrapers.common.db and
+scrapers.common.indexes, so the MongoDB code path behaves exactly as before.
+"""
+
+from scrapers.common.db import (
+    get_mongodb_client,
+    store_performances,
+    get_data_version,
+    DATABASE_NAME,
+    BULK_WRITE_BATCH_SIZE,
+    CURSOR_BATCH_SIZE
+)
+from scrapers.common.indexes import ensure_indexes, INDEX_MANIFEST, PERFORMANCE_INDEXES
+from scrapers.common.storage.base import StorageBackend
+
+class MongoBackend(StorageBackend):
+    """
+    Storage backend for a MongoDB database.
+    """
+    
+    name = 'mongo'
+    
+    def __init__(self, database=None):
+        """
+        Create the backend.
+        
+        Args:
+            database (Database, optional): MongoDB database. Defaults to
+                DATABASE_NAME on the shared client, resolved on first use so
+                that creating the backend does not open a connection.
+        """
+        self._database = database
+    
+    @property
+    def database(self):
+        if self._database is None:
+            self._database = get_mongodb_client(ping=False)[DATABASE_NAME]
+        return self._database
+    
+    def store_performances(self, collection_name, performances, batch_size=BULK_WRITE_BATCH_SIZE, scope=None):
+        return store_performances(
+            self.database[collection_name], performances, batch_size or BULK_WRITE_BATCH_SIZE, scope=scope
+        )
+    
+    def find(self, collection_name, query=None, projection=None, sort=None, skip=0, limit=0):
+        cursor = self.database[collection_name].find(query or {}, projection, batch_size=CURSOR_BATCH_SIZE)
+        if sort:
+            cursor = cursor.sort(sort)
+        if skip:
+            cursor = cursor.skip(skip)
+        if limit:
+            cursor = cursor.limit(limit)
+        
+        try:
+            for document in cursor:
+                yield document
+        finally:
+            cursor.close()
+    
+    def text_search(self, collection_name, text, query=None, sort=None, skip=0, limit=0):
+        # Served by the text_search index, which scores and stems on the server
+        text_query = dict(query or {}, **{'$text': {'$search': text}})
+        score = {'$meta': 'textScore'}
+        cursor = self.database[collection_name].find(text_query, {'score': score}, batch_size=CURSOR_BATCH_SIZE)
+        cursor = cursor.sort([('score', score)] + list(sort or []))
+        if skip:
+            cursor = cursor.skip(skip)
+        if limit:
+            cursor = cursor.limit(limit)
+        
+        try:
+            for document in cursor:
+                yield document
+        finally:
+            cursor.close()
+    
+    def find_one(self, collection_name, query=None, projection=None):
+        return self.database[collection_name].find_one(query or {}, projection)
+    
+    def count(self, collection_name, query=None):
+        return self.database[collection_name].count_documents(query or {})
+    
+    def get_data_version(self, collection_name):
+        return get_data_version(self.database, collection_name)
+    
+    def ensure_indexes(self, collection_name):
+        """
+        Create the indexes listed for the collection in INDEX_MANIFEST.
+        
+        Returns:
+            list: Index reports from ensure_indexes
+        """
+        indexes = INDEX_MANIFEST.get(collection_name, PERFORMANCE_INDEXES)
+        return ensure_indexes(self.database[collection_name], indexes)
@@ -0,0 +1,311 @@
+"""
+SQLite storage backend.
+
+Stores each collection as a table of JSON documents in a single SQLite
+database running in WAL mode. Frequently queried fields get expression
+indexes on json_extract, and MongoDB-style queries are translated to SQL.
+"""
+
+import os
+import re
+import json
+import logging
+import sqlite3
+import threading
+from dotenv import load_dotenv
+from bson import ObjectId
+
+from scrapers.common.db import compute_content_hash, BULK_WRITE_BATCH_SIZE
+from scrapers.common.storage.base import (
+    StorageBackend,
+    COMPARISON_OPERATORS,
+    new_document_id,
+    upsert_key,
+    apply_projection,
+    text_terms,
+    text_score
+)
+
+# Load environment variables
+load_dotenv()
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+# Path of the SQLite database file
+SQLITE_PATH = os.getenv('SQLITE_PATH', 'ballet_world.db')
+
+# Table holding one version stamp per collection
+SQLITE_VERSIONS_TABLE = 'data_versions'
+
+# Document fields that get an expression index in every collection
+SQLITE_INDEXED_FIELDS = ('company', 'company_id', 'title', 'url', 'startDate', 'endDate', 'startDay', 'endDay', 'last_updated')
+
+# Collection and field names are inlined in SQL, so they are restricted to
+# safe characters
+_NAME_PATTERN = re.compile(r'^[A-Za-z0-9_]+$')
+_FIELD_PATTERN = re.compile(r'^[A-Za-z0-9_]+(\.[A-Za-z0-9_]+)*$')
+
+def _regexp(pattern, value):
+    """
+    Implementation of the SQL REGEXP operator.
+    """
+    return isinstance(value, str) and re.search(pattern, value) is not None
+
+def _text_score(doc, terms):
+    """
+    Implementation of the SQL TEXT_SCORE function.
+    
+    Scores a JSON document against a JSON list of stemmed terms.
+    """
+    return text_score(json.loads(doc), json.loads(terms))
+
+def _to_sql_value(value):
+    # JSON booleans are extracted as 1/0
+    if isinstance(value, bool):
+        return int(value)
+    # IDs are stored as the hex string of an ObjectId
+    if isinstance(value, ObjectId):
+        return str(value)
+    return value
+
+class SQLiteBackend(StorageBackend):
+    """
+    Storage backend keeping documents in SQLite JSON columns.
+    """
+    
+    name = 'sqlite'
+    
+    def __init__(self, path=SQLITE_PATH):
+        """
+        Open (or create) the database.
+        
+        Args:
+            path (str, optional): Database file path, or ':memory:'
+        """
+        self.path = path
+        self._lock = threading.RLock()
+        self._tables = set()
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        self._connection.create_function('REGEXP', 2, _regexp, deterministic=True)
+        self._connection.create_function('TEXT_SCORE', 2, _text_score, deterministic=True)
+        self._connection.execute('PRAGMA journal_mode=WAL')
+        self._connection.execute('PRAGMA synchronous=NORMAL')
+        with self._connection:
+            self._connection.execute(
+                f'CREATE TABLE IF NOT EXISTS "{SQLITE_VERSIONS_TABLE}" ('
+                'collection TEXT PRIMARY KEY, '
+                'version INTEGER NOT NULL)'
+            )
+        logger.info(f"Opened SQLite storage at {path}")
+    
+    def _table(self, collection_name):
+        """
+        Get the quoted table name for a collection, creating the table if needed.
+        """
+        if not _NAME_PATTERN.match(collection_name):
+            raise ValueError(f"Invalid collection name: {collection_name}")
+        
+        table = f'"{collection_name}"'
+        if collection_name not in self._tables:
+            with self._lock, self._connection:
+                self._connection.execute(
+                    f'CREATE TABLE IF NOT EXISTS {table} ('
+                    '_id TEXT PRIMARY KEY, '
+                    'upsert_key TEXT NOT NULL UNIQUE, '
+                    'content_hash TEXT, '
+                    'doc TEXT NOT NULL)'
+                )
+            self._tables.add(collection_name)
+        return table
+    
+    def ensure_indexes(self, collection_name):
+        table = self._table(collection_name)
+        with self._lock, self._connection:
+            for field in SQLITE_INDEXED_FIELDS:
+                self._connection.execute(
+                    f'CREATE INDEX IF NOT EXISTS "{collection_name}_{field}" '
+                    f'ON {table} ({self._field_expression(field)})'
+                )
+    
+    def store_performances(self, collection_name, performances, batch_size=BULK_WRITE_BATCH_SIZE, scope=None):
+        table = self._table(collection_name)
+        summary = {'inserted': 0, 'changed': 0, 'unchanged': 0}
+        batch_size = batch_size or BULK_WRITE_BATCH_SIZE
+        
+        try:
+            with self._lock, self._connection:
+                for start in range(0, len(performances), batch_size):
+                    batch = performances[start:start + batch_size]
+                    keys = [upsert_key(performance['title'], scope) for performance in batch]
+                    placeholders = ', '.join('?' * len(keys))
+                    stored = {
+                        row[0]: row[1:]
+                        for row in self._connection.execute(
+                            f'SELECT upsert_key, _id, content_hash, doc FROM {table} '
+                            f'WHERE upsert_key IN ({placeholders})',
+                            keys
+                        )
+                    }
+                    
+                    for key, performance in zip(keys, batch):
+                        content_hash = compute_content_hash(performance)
+                        update = {field: value for field, value in performance.items() if field != '_id'}
+                        update.update(scope or {})
+                        update['content_hash'] = content_hash
+                        
+                        if key not in stored:
+                            summary['inserted'] += 1
+                            document_id = str(performance.get('_id') or new_document_id())
+                            self._connection.execute(
+                                f'INSERT INTO {table} (_id, upsert_key, content_hash, doc) VALUES (?, ?, ?, ?)',
+                                (document_id, key, content_hash, json.dumps(update, default=str))
+                            )
+                            stored[key] = (document_id, content_hash, None)
+                        elif stored[key][1] == content_hash:
+                            summary['unchanged'] += 1
+                        else:
+                            summary['changed'] += 1
+                            # Merge like MongoDB's $set
+                            document = json.loads(stored[key][2]) if stored[key][2] else {}
+                            document.update(update)
+                            self._connection.execute(
+                                f'UPDATE {table} SET content_hash = ?, doc = ? WHERE upsert_key = ?',
+                                (content_hash, json.dumps(document, default=str), key)
+                            )
+                
+                if summary['inserted'] or summary['changed']:
+                    self._connection.execute(
+                        f'INSERT INTO "{SQLITE_VERSIONS_TABLE}" (collection, version) VALUES (?, 1) '
+                        'ON CONFLICT(collection) DO UPDATE SET version = version + 1',
+                        (collection_name,)
+                    )
+            return summary
+        except Exception as e:
+            logger.error(f"Error storing performances in SQLite: {str(e)}")
+            return None
+    
+    def find(self, collection_name, query=None, projection=None, sort=None, skip=0, limit=0):
+        table = self._table(collection_name)
+        params = []
+        where = self._translate_query(query, params)
+        sql = f'SELECT _id, doc FROM {table} WHERE {where}'
+        if sort:
+            order = ', '.join(
+                f'{self._field_expression(field)} {"DESC" if direction < 0 else "ASC"}'
+                for field, direction in sort
+            )
+            sql += f' ORDER BY {order}'
+        sql += ' LIMIT ? OFFSET ?'
+        params.extend([limit or -1, skip])
+        
+        with self._lock:
+            rows = self._connection.execute(sql, params).fetchall()
+        return (apply_projection(dict(json.loads(doc), _id=document_id), projection) for document_id, doc in rows)
+    
+    def count(self, collection_name, query=None):
+        table = self._table(collection_name)
+        params = []
+        where = self._translate_query(query, params)
+        with self._lock:
+            return self._connection.execute(f'SELECT COUNT(*) FROM {table} WHERE {where}', params).fetchone()[0]
+    
+    def get_data_version(self, collection_name):
+        with self._lock:
+            row = self._connection.execute(
+                f'SELECT version FROM "{SQLITE_VERSIONS_TABLE}" WHERE collection = ?', (collection_name,)
+            ).fetchone()
+        return row[0] if row else 0
+    
+    def close(self):
+        with self._lock:
+            self._connection.close()
+    
+    def _field_expression(self, field):
+        """
+        SQL expression for a document field.
+        """
+        if field == '_id':
+            return '_id'
+        if not _FIELD_PATTERN.match(field):
+            raise ValueError(f"Invalid field name: {field}")
+        return f"json_extract(doc, '$.{field}')"
+    
+    def _translate_query(self, query, params):
+        """
+        Translate a MongoDB-style query into a SQL WHERE clause.
+        
+        Supports the same operators as match_query.
+        """
+        clauses = []
+        for key, condition in (query or {}).items():
+            if key in ('$or', '$and'):
+                parts = [self._translate_query(sub_query, params) for sub_query in condition]
+                if key == '$or':
+                    clauses.append(f"({' OR '.join(parts)})" if parts else '0')
+                else:
+                    clauses.append(f"({' AND '.join(parts)})" if parts else '1')
+            elif key == '$text':
+                clauses.append('TEXT_SCORE(doc, ?) > 0')
+                params.append(json.dumps(text_terms(condition['$search'])))
+            elif key.startswith('$'):
+                raise ValueError(f"Unsupported query operator: {key}")
+            else:
+                clauses.append(self._translate_condition(key, condition, params))
+        return ' AND '.join(clauses) if clauses else '1'
+    
+    def _translate_condition(self, field, condition, params):
+        expression = self._field_expression(field)
+        
+        if not isinstance(condition, dict) or not any(key.startswith('$') for key in condition):
+            condition = {'$eq': condition}
+        
+        clauses = []
+        for operator, operand in condition.items():
+            if operator not in COMPARISON_OPERATORS:
+                raise ValueError(f"Unsupported query operator: {operator}")
+            
+            if operator == '$eq':
+                if operand is None:
+                    clauses.append(f'{expression} IS NULL')
+                else:
+                    clauses.append(f'{expression} = ?')
+                    params.append(_to_sql_value(operand))
+            elif operator == '$ne':
+                if operand is None:
+                    clauses.append(f'{expression} IS NOT NULL')
+                else:
+                    clauses.append(f'({expression} IS NULL OR {expression} != ?)')
+                    params.append(_to_sql_value(operand))
+            elif operator in ('$gt', '$gte', '$lt', '$lte'):
+                symbol = {'$gt': '>', '$gte': '>=', '$lt': '<', '$lte': '<='}[operator]
+                clauses.append(f'{expression} {symbol} ?')
+                params.append(_to_sql_value(operand))
+            elif operator in ('$in', '$nin'):
+                values = [_to_sql_value(value) for value in operand if value is not None]
+                placeholders = ', '.join('?' * len(values))
+                contains = f'{expression} IN ({placeholders})' if values else '0'
+                if None in operand:
+                    contains = f'({contains} OR {expression} IS NULL)'
+                params.extend(values)
+                if operator == '$in':
+                    clauses.append(contains)
+                elif None in operand:
+                    clauses.append(f'NOT {contains}')
+                else:
+                    # Like MongoDB, missing fields are not in the list
+                    clauses.append(f'({expression} IS NULL OR NOT {contains})')
+            elif operator == '$exists':
+                if field == '_id':
+                    clauses.append('1' if operand else '0')
+                else:
+                    presence = 'IS NOT NULL' if operand else 'IS NULL'
+                    clauses.append(f"json_type(doc, '$.{field}') {presence}")
+            elif operator == '$regex':
+                pattern = operand
+                if 'i' in condition.get('$options', ''):
+                    pattern = f'(?i){pattern}'
+                clauses.append(f'{expression} REGEXP ?')
+                params.append(pattern)
+        
+        return ' AND '.join(clauses) if clauses else '1'
@@ -0,0 +1,116 @@
+"""
+Tests for the asynchronous database utilities.
+"""
+
+import asyncio
+import pytest
+from unittest.mock import patch, MagicMock, AsyncMock
+
+from scrapers.common import async_db
+
+@pytest.fixture
+def mock_motor_client():
+    """Patch the Motor client and start every test with an empty registry."""
+    async_db.close_async_clients()
+    with patch('scrapers.common.async_db.AsyncIOMotorClient') as mock_client_class:
+        collections = {}
+        
+        def make_client(*args, **kwargs):
+            client = MagicMock()
+            client.__getitem__.return_value.__getitem__.side_effect = (
+                lambda name: collections.setdefault(name, make_collection(name))
+            )
+            return client
+        
+        mock_client_class.side_effect = make_client
+        mock_client_class.collections = collections
+        yield mock_client_class
+    async_db.close_async_clients()
+
+def make_collection(name):
+    """Create a mock Motor collection returning one document per query."""
+    collection = MagicMock()
+    cursor = MagicMock()
+    cursor.sort.return_value = cursor
+    cursor.to_list = AsyncMock(return_value=[{'title': f'{name} performance'}])
+    collection.find.return_value = cursor
+    collection.find_one = AsyncMock(return_value={'title': 'Giselle'})
+    collection.count_documents = AsyncMock(return_value=7)
+    collection.bulk_write = AsyncMock(return_value=MagicMock(matched_count=1, modified_count=0, upserted_count=1))
+    return collection
+
+def test_get_async_client_reused_within_loop(mock_motor_client):
+    """Test that one client is shared per event loop."""
+    async def get_twice():
+        return async_db.get_async_client(), async_db.get_async_client()
+    
+    first, second = asyncio.run(get_twice())
+    assert first is second
+    third, _ = asyncio.run(get_twice())
+    assert third is not first
+    
+    kwargs = mock_motor_client.call_args.kwargs
+    assert kwargs['serverSelectionTimeoutMS'] == async_db.ASYNC_SERVER_SELECTION_TIMEOUT_MS
+    assert kwargs['maxPoolSize'] == async_db.MONGODB_MAX_POOL_SIZE
+
+def test_get_async_client_evicts_closed_loops(mock_motor_client):
+    """Test that clients of closed event loops are closed and dropped."""
+    async def get_client():
+        return async_db.get_async_client()
+    
+    first = asyncio.run(get_client())
+    second = asyncio.run(get_client())
+    
+    first.close.assert_called_once()
+    second.close.assert_not_called()
+    assert list(async_db._clients.values()) == [second]
+
+def test_find_performances(mock_motor_client):
+    """Test that find options are passed to the Motor cursor."""
+    results = asyncio.run(async_db.find_performances(
+        'paris_opera_ballet', {'venue': 'Palais Garnier'}, sort=[('title', 1)], limit=5
+    ))
+    
+    assert results == [{'title': 'paris_opera_ballet performance'}]
+    collection = mock_motor_client.collections['paris_opera_ballet']
+    args, kwargs = collection.find.call_args
+    assert args == ({'venue': 'Palais Garnier'}, {'_id': 0})
+    assert kwargs['limit'] == 5
+    assert kwargs['max_time_ms'] == async_db.ASYNC_QUERY_MAX_TIME_MS
+    collection.find.return_value.sort.assert_called_once_with([('title', 1)])
+
+def test_search_performances_escapes_text(mock_motor_client):
+    """Test that search text is matched literally."""
+    asyncio.run(async_db.search_performances('bolshoi_ballet', 'Swan (Lake'))
+    
+    query = mock_motor_client.collections['bolshoi_ballet'].find.call_args.args[0]
+    assert query['$or'][0] == {'title': {'$regex': r'Swan\ \(Lake', '$options': 'i'}}
+
+def test_get_and_count_performances(mock_motor_client):
+    """Test single-document lookup and counting."""
+    async def run():
+        return (
+            await async_db.get_performance('boston_ballet', {'title': 'Giselle'}),
+            await async_db.count_performances('boston_ballet')
+        )
+    
+    performance, count = asyncio.run(run())
+    assert performance == {'title': 'Giselle'}
+    assert count == 7
+
+def test_bulk_upsert_performances(mock_motor_client):
+    """Test that upserts are batched into unordered bulk writes."""
+    performances = [{'title': f'Performance {i}'} for i in range(3)]
+    results = asyncio.run(async_db.bulk_upsert_performances('boston_ballet', performances, batch_size=2))
+    
+    assert [batch['size'] for batch in results] == [2, 1]
+    collection = mock_motor_client.collections['boston_ballet']
+    assert collection.bulk_write.await_count == 2
+    assert collection.bulk_write.call_args.kwargs['ordered'] is False
+
+def test_find_across_collections(mock_motor_client):
+    """Test that several collections are queried in one call."""
+    results = asyncio.run(async_db.find_across_collections(['paris_opera_ballet', 'bolshoi_ballet']))
+    
+    assert list(results) == ['paris_opera_ballet', 'bolshoi_ballet']
+    assert results['bolshoi_ballet'] == [{'title': 'bolshoi_ballet performance'}]
@@ -0,0 +1,76 @@
+"""
+Tests for the date parsing engine.
+"""
+
+from datetime import date
+
+import pytest
+
+from scrapers.common.dates import parse_performance_dates, clear_cache, cache_info, benchmark
+from scrapers.common.utils import parse_date_range
+
+@pytest.mark.parametrize('date_str, expected', [
+    ('from 28 Sep to 31 Oct 2025', ('2025-09-28', '2025-10-31', 'from_to')),
+    ('from 01 to 31 Dec 2025', ('2025-12-01', '2025-12-31', 'from_to')),
+    ('20 Dec to 31 Dec 2024', ('2024-12-20', '2024-12-31', 'from_to')),
+    ('from 28 Dec to 3 Jan 2026', ('2025-12-28', '2026-01-03', 'from_to')),
+    ('on 12 May 2025 at 8pm', ('2025-05-12', '2025-05-12', 'on')),
+    ('23 – 25 May 2025', ('2025-05-23', '2025-05-25', 'day_range')),
+    ('19 September 2024 – 23 March 2025', ('2024-09-19', '2025-03-23', 'full_range')),
+    ('May 7 - June 3, 2024', ('2024-05-07', '2024-06-03', 'range')),
+    ('October 17th, 2024 - November 3rd, 2024', ('2024-10-17', '2024-11-03', 'range')),
+    ('May 7 - 10, 2024', ('2024-05-07', '2024-05-10', 'range')),
+    ('May 7, 2024', ('2024-05-07', '2024-05-07', 'single')),
+    ('12 May 2025', ('2025-05-12', '2025-05-12', 'single')),
+    ('February 2025', ('2025-02-01', '2025-02-28', 'month')),
+    ('31 Feb 2025', ('2025-02-01', '2025-02-28', 'month')),
+    ('Season 2025', ('2025-01-01', '2025-12-31', 'year')),
+    ('Mayerling 2025', ('2025-01-01', '2025-12-31', 'year'))
+])
+def test_parse_performance_dates(date_str, expected):
+    """Test the supported formats and fallbacks."""
+    result = parse_performance_dates(date_str)
+    
+    assert (result.start.isoformat(), result.end.isoformat(), result.method) == expected
+
+@pytest.mark.parametrize('date_str', ['', None, 'Spring'])
+def test_parse_performance_dates_without_dates(date_str):
+    """Test strings without usable dates."""
+    result = parse_performance_dates(date_str)
+    
+    assert (result.start, result.end, result.method, result.confidence) == (None, None, 'none', 0.0)
+
+def test_confidence():
+    """Test that fallbacks are less certain than exact patterns."""
+    exact = parse_performance_dates('23 – 25 May 2025')
+    month = parse_performance_dates('May 2025')
+    year = parse_performance_dates('2025')
+    
+    assert exact.exact and not month.exact
+    assert exact.confidence > month.confidence > year.confidence > 0
+
+def test_cache():
+    """Test that repeated strings are served from the cache."""
+    clear_cache()
+    
+    first = parse_performance_dates('from 28 Sep to 31 Oct 2025')
+    second = parse_performance_dates('from 28 Sep to 31 Oct 2025')
+    
+    assert first is second
+    assert (cache_info().hits, cache_info().misses) == (1, 1)
+
+def test_parse_date_range():
+    """Test that the scraper helper returns exact dates, or the month or year fallback."""
+    start, end = parse_date_range('23 – 25 May 2025')
+    assert (start.date(), end.date()) == (date(2025, 5, 23), date(2025, 5, 25))
+    
+    start, end = parse_date_range('May 2025')
+    assert (start.date(), end.date()) == (date(2025, 5, 1), date(2025, 5, 31))
+    assert parse_date_range('Coming soon') == (None, None)
+
+def test_benchmark():
+    """Test that the benchmark reports cold and warm timings."""
+    results = benchmark(rounds=2)
+    
+    assert set(results) == {'cold', 'warm'}
+    assert all(microseconds > 0 for microseconds in results.values())
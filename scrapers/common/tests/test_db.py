@@ -0,0 +1,273 @@
+"""
+Tests for the common database utilities.
+"""
+
+import pytest
+from unittest.mock import patch, MagicMock
+from pymongo import UpdateOne
+
+from scrapers.common import db
+from scrapers.common.db import (
+    bulk_upsert_performances,
+    store_performances,
+    update_performance,
+    compute_content_hash,
+    get_mongodb_client,
+    close_mongodb_clients,
+    iter_performances,
+    get_all_performances,
+    search_performances
+)
+
+def make_performances(count):
+    """Build a list of minimal performance dictionaries."""
+    return [{'title': f'Performance {i}', 'company': 'Test Ballet'} for i in range(count)]
+
+@pytest.fixture
+def mock_collection():
+    """Create a mock MongoDB collection whose bulk_write reports every upsert."""
+    collection = MagicMock()
+    
+    def bulk_write(operations, ordered=True):
+        result = MagicMock()
+        result.matched_count = 0
+        result.modified_count = 0
+        result.upserted_count = len(operations)
+        return result
+    
+    collection.bulk_write.side_effect = bulk_write
+    return collection
+
+def test_bulk_upsert_performances_batches(mock_collection):
+    """Test that upserts are grouped into unordered batches."""
+    results = bulk_upsert_performances(mock_collection, make_performances(5), batch_size=2)
+    
+    assert mock_collection.bulk_write.call_count == 3
+    assert [batch['size'] for batch in results] == [2, 2, 1]
+    assert [batch['upserted'] for batch in results] == [2, 2, 1]
+    for call in mock_collection.bulk_write.call_args_list:
+        assert call.kwargs['ordered'] is False
+    mock_collection.update_one.assert_not_called()
+
+def test_bulk_upsert_performances_upserts_by_title(mock_collection):
+    """Test that each operation upserts on the performance title."""
+    bulk_upsert_performances(mock_collection, make_performances(1))
+    
+    operation = mock_collection.bulk_write.call_args.args[0][0]
+    assert operation == UpdateOne(
+        {'title': 'Performance 0'},
+        {'$set': {'title': 'Performance 0', 'company': 'Test Ballet'}},
+        upsert=True
+    )
+
+def test_bulk_upsert_performances_empty(mock_collection):
+    """Test that an empty list does not touch the database."""
+    assert bulk_upsert_performances(mock_collection, []) == []
+    mock_collection.bulk_write.assert_not_called()
+
+def test_bulk_upsert_performances_invalid_batch_size(mock_collection):
+    """Test that a non-positive batch size is rejected."""
+    with pytest.raises(ValueError):
+        bulk_upsert_performances(mock_collection, make_performances(1), batch_size=0)
+
+def test_store_performances(mock_collection):
+    """Test that store_performances inserts new performances in batches."""
+    summary = store_performances(mock_collection, make_performances(3), batch_size=2)
+    
+    assert summary['inserted'] == 3
+    assert summary['changed'] == 0
+    assert summary['unchanged'] == 0
+    assert mock_collection.bulk_write.call_count == 2
+
+def test_store_performances_skips_unchanged(mock_collection):
+    """Test that unchanged performances are not written again."""
+    performances = make_performances(3)
+    performances[1]['description'] = 'Updated description'
+    stored = make_performances(3)
+    mock_collection.find.return_value = [
+        {'title': performance['title'], 'content_hash': compute_content_hash(performance)}
+        for performance in stored[:2]
+    ]
+    
+    summary = store_performances(mock_collection, performances)
+    
+    assert summary['inserted'] == 1
+    assert summary['changed'] == 1
+    assert summary['unchanged'] == 1
+    operations = mock_collection.bulk_write.call_args.args[0]
+    assert operations == [
+        UpdateOne(
+            {'title': performance['title']},
+            {'$set': dict(performance, content_hash=compute_content_hash(performance))},
+            upsert=True
+        )
+        for performance in performances[1:]
+    ]
+
+def test_store_performances_bumps_data_version(mock_collection):
+    """Test that the version stamp is bumped only when something was written."""
+    versions = mock_collection.database.__getitem__.return_value
+    store_performances(mock_collection, make_performances(1))
+    versions.update_one.assert_called_once()
+    assert versions.update_one.call_args.args[1]['$inc'] == {'version': 1}
+    
+    performance = make_performances(1)[0]
+    mock_collection.find.return_value = [{'title': performance['title'], 'content_hash': compute_content_hash(performance)}]
+    versions.update_one.reset_mock()
+    store_performances(mock_collection, [performance])
+    versions.update_one.assert_not_called()
+
+def test_store_performances_stores_content_hash(mock_collection):
+    """Test that the content hash is written with the performance."""
+    performance = make_performances(1)[0]
+    store_performances(mock_collection, [performance])
+    
+    operation = mock_collection.bulk_write.call_args.args[0][0]
+    assert operation == UpdateOne(
+        {'title': 'Performance 0'},
+        {'$set': dict(performance, content_hash=compute_content_hash(performance))},
+        upsert=True
+    )
+    assert 'content_hash' not in performance
+
+def test_compute_content_hash_ignores_volatile_fields():
+    """Test that the hash ignores field order and last_updated."""
+    first = {'title': 'Giselle', 'venue': 'Palais Garnier', 'last_updated': '2025-01-01 10:00:00'}
+    second = {'venue': 'Palais Garnier', 'title': 'Giselle', 'last_updated': '2025-02-01 10:00:00'}
+    changed = {'title': 'Giselle', 'venue': 'Opera Bastille'}
+    
+    assert compute_content_hash(first) == compute_content_hash(second)
+    assert compute_content_hash(first) != compute_content_hash(changed)
+
+def test_store_performances_failure(mock_collection):
+    """Test that store_performances reports failure when the bulk write fails."""
+    mock_collection.bulk_write.side_effect = Exception("connection lost")
+    assert store_performances(mock_collection, make_performances(1)) is None
+
+def test_store_performances_failure_bumps_data_version(mock_collection):
+    """Test that the version stamp is bumped when a later batch fails."""
+    written = mock_collection.bulk_write.side_effect
+    mock_collection.bulk_write.side_effect = [written([None]), Exception("connection lost")]
+    versions = mock_collection.database.__getitem__.return_value
+    
+    assert store_performances(mock_collection, make_performances(2), batch_size=1) is None
+    assert mock_collection.bulk_write.call_count == 2
+    versions.update_one.assert_called_once()
+    assert versions.update_one.call_args.args[1]['$inc'] == {'version': 1}
+
+def test_update_performance_bumps_data_version(mock_collection):
+    """Test that updating a performance bumps the version stamp only when it changed."""
+    versions = mock_collection.database.__getitem__.return_value
+    mock_collection.update_one.return_value.modified_count = 1
+    update_performance(mock_collection, {'url': 'https://example.com'}, {'description': 'New'})
+    
+    mock_collection.update_one.assert_called_once_with({'url': 'https://example.com'}, {'$set': {'description': 'New'}})
+    versions.update_one.assert_called_once()
+    
+    mock_collection.update_one.return_value.modified_count = 0
+    versions.update_one.reset_mock()
+    update_performance(mock_collection, {'url': 'https://example.com'}, {'description': 'New'})
+    versions.update_one.assert_not_called()
+
+@pytest.fixture
+def mock_mongo_client():
+    """Patch MongoClient and start every test with an empty client registry."""
+    close_mongodb_clients()
+    with patch('scrapers.common.db.MongoClient') as mock_client_class:
+        mock_client_class.side_effect = lambda *args, **kwargs: MagicMock()
+        yield mock_client_class
+    close_mongodb_clients()
+
+def test_get_mongodb_client_reuses_pool(mock_mongo_client):
+    """Test that repeated lookups share one client per URI."""
+    first = get_mongodb_client('mongodb://localhost:27017/')
+    second = get_mongodb_client('mongodb://localhost:27017/')
+    other = get_mongodb_client('mongodb://otherhost:27017/')
+    
+    assert first is second
+    assert first is not other
+    assert mock_mongo_client.call_count == 2
+    first.admin.command.assert_called_once_with('ping')
+
+def test_get_mongodb_client_pool_settings(mock_mongo_client):
+    """Test that the pool size and wait-queue settings are applied."""
+    get_mongodb_client('mongodb://localhost:27017/', ping=False)
+    
+    kwargs = mock_mongo_client.call_args.kwargs
+    assert kwargs['maxPoolSize'] == db.MONGODB_MAX_POOL_SIZE
+    assert kwargs['minPoolSize'] == db.MONGODB_MIN_POOL_SIZE
+    assert kwargs['waitQueueTimeoutMS'] == db.MONGODB_WAIT_QUEUE_TIMEOUT_MS
+
+def test_get_mongodb_client_failed_ping_not_cached(mock_mongo_client):
+    """Test that a client whose ping fails is not kept in the registry."""
+    failing = MagicMock()
+    failing.admin.command.side_effect = Exception("server unavailable")
+    mock_mongo_client.side_effect = [failing, MagicMock()]
+    
+    with pytest.raises(Exception):
+        get_mongodb_client('mongodb://localhost:27017/')
+    assert get_mongodb_client('mongodb://localhost:27017/') is not failing
+
+def test_close_mongodb_clients(mock_mongo_client):
+    """Test that closing the registry closes every client."""
+    client = get_mongodb_client('mongodb://localhost:27017/')
+    close_mongodb_clients()
+    
+    client.close.assert_called_once()
+    assert get_mongodb_client('mongodb://localhost:27017/') is not client
+
+def test_reset_clients_after_fork(mock_mongo_client):
+    """Test that a forked child does not reuse the parent's clients."""
+    client = get_mongodb_client('mongodb://localhost:27017/')
+    db._reset_clients_after_fork()
+    
+    assert get_mongodb_client('mongodb://localhost:27017/') is not client
+    client.close.assert_not_called()
+
+@pytest.fixture
+def mock_get_collection():
+    """Patch get_collection with a collection whose cursor yields two documents."""
+    with patch('scrapers.common.db.get_collection') as mock_get:
+        cursor = MagicMock()
+        cursor.sort.return_value = cursor
+        cursor.max_time_ms.return_value = cursor
+        cursor.__iter__.return_value = iter([{'title': 'Swan Lake'}, {'title': 'Giselle'}])
+        mock_get.return_value.find.return_value = cursor
+        yield mock_get
+
+def test_iter_performances_is_lazy(mock_get_collection):
+    """Test that no query is issued until the generator is consumed."""
+    performances = iter_performances('paris_opera_ballet')
+    mock_get_collection.assert_not_called()
+    
+    assert next(performances) == {'title': 'Swan Lake'}
+    assert list(performances) == [{'title': 'Giselle'}]
+    mock_get_collection.return_value.find.return_value.close.assert_called_once()
+
+def test_iter_performances_cursor_options(mock_get_collection):
+    """Test that projection, batch size, sort and time budget reach the cursor."""
+    list(iter_performances(
+        'paris_opera_ballet',
+        {'venue': 'Palais Garnier'},
+        projection={'_id': 0, 'title': 1},
+        sort=[('startDate', 1)],
+        batch_size=25,
+        max_time_ms=500
+    ))
+    
+    collection = mock_get_collection.return_value
+    collection.find.assert_called_once_with(
+        {'venue': 'Palais Garnier'}, {'_id': 0, 'title': 1}, batch_size=25
+    )
+    collection.find.return_value.sort.assert_called_once_with([('startDate', 1)])
+    collection.find.return_value.max_time_ms.assert_called_once_with(500)
+
+def test_get_all_performances_wraps_iterator(mock_get_collection):
+    """Test that get_all_performances materializes the streamed results."""
+    assert get_all_performances('paris_opera_ballet') == [{'title': 'Swan Lake'}, {'title': 'Giselle'}]
+    mock_get_collection.return_value.find.assert_called_once_with({}, {'_id': 0}, batch_size=db.CURSOR_BATCH_SIZE)
+
+def test_search_performances_error(mock_get_collection):
+    """Test that search_performances returns an empty list on failure."""
+    mock_get_collection.return_value.find.side_effect = Exception("query failed")
+    assert search_performances('paris_opera_ballet', {'title': 'Giselle'}) == []
@@ -0,0 +1,62 @@
+"""
+Tests for the index manifest utilities.
+"""
+
+from unittest.mock import MagicMock
+
+from scrapers.common.indexes import (
+    PERFORMANCE_INDEXES,
+    ensure_indexes,
+    apply_index_manifest,
+    format_index_report
+)
+
+def make_collection(name, existing=None):
+    """Create a mock collection with the given existing index names."""
+    collection = MagicMock()
+    collection.name = name
+    collection.index_information.return_value = {index: {} for index in (existing or ['_id_'])}
+    return collection
+
+def test_ensure_indexes_creates_missing():
+    """Test that every missing index is created."""
+    collection = make_collection('paris_opera_ballet')
+    reports = ensure_indexes(collection)
+    
+    assert collection.create_index.call_count == len(PERFORMANCE_INDEXES)
+    assert all(report['status'] == 'created' for report in reports)
+    
+    unique_call = collection.create_index.call_args_list[0]
+    assert unique_call.kwargs['name'] == 'company_title_unique'
+    assert unique_call.kwargs['unique'] is True
+
+def test_ensure_indexes_is_idempotent():
+    """Test that existing indexes are not rebuilt."""
+    existing = ['_id_'] + [index['name'] for index in PERFORMANCE_INDEXES]
+    collection = make_collection('paris_opera_ballet', existing)
+    reports = ensure_indexes(collection)
+    
+    collection.create_index.assert_not_called()
+    assert all(report['status'] == 'exists' for report in reports)
+
+def test_ensure_indexes_reports_failures():
+    """Test that a failing index is reported without stopping the others."""
+    collection = make_collection('bolshoi_ballet')
+    collection.create_index.side_effect = [Exception("duplicate key")] + [None] * (len(PERFORMANCE_INDEXES) - 1)
+    reports = ensure_indexes(collection)
+    
+    assert reports[0]['status'] == 'failed'
+    assert 'duplicate key' in reports[0]['error']
+    assert [report['status'] for report in reports[1:]] == ['created'] * (len(PERFORMANCE_INDEXES) - 1)
+
+def test_apply_index_manifest_filters_collections():
+    """Test that the manifest can be restricted to specific collections."""
+    db = MagicMock()
+    db.__getitem__.side_effect = lambda name: make_collection(name)
+    manifest = {'a': PERFORMANCE_INDEXES[:1], 'b': PERFORMANCE_INDEXES[:2]}
+    
+    reports = apply_index_manifest(db, manifest, collection_names=['b'])
+    assert [report['collection'] for report in reports] == ['b', 'b']
+    
+    text = format_index_report(reports)
+    assert 'company_title_unique' in text and 'created' in text
@@ -0,0 +1,83 @@
+"""
+Tests for MongoDB command timing instrumentation.
+"""
+
+import logging
+from types import SimpleNamespace
+
+from scrapers.common.instrumentation import (
+    CommandTimer,
+    LatencyHistogram,
+    format_command_stats
+)
+
+def run_command(timer, command_name, command, duration_ms, request_id=1, failed=False):
+    """Feed a started event and its completion to the listener."""
+    timer.started(SimpleNamespace(
+        command_name=command_name, command=command, connection_id=('localhost', 27017), request_id=request_id
+    ))
+    finished = SimpleNamespace(
+        command_name=command_name, connection_id=('localhost', 27017), request_id=request_id,
+        duration_micros=int(duration_ms * 1000)
+    )
+    if failed:
+        timer.failed(finished)
+    else:
+        timer.succeeded(finished)
+
+def test_command_timer_groups_by_collection_and_command():
+    """Test that latencies are grouped per collection and command."""
+    timer = CommandTimer(slow_command_ms=1000)
+    run_command(timer, 'find', {'find': 'bolshoi_ballet'}, 3)
+    run_command(timer, 'find', {'find': 'bolshoi_ballet'}, 7, request_id=2)
+    run_command(timer, 'getMore', {'getMore': 123, 'collection': 'bolshoi_ballet'}, 1)
+    run_command(timer, 'ping', {'ping': 1}, 0.5, failed=True)
+    
+    stats = timer.snapshot()
+    
+    assert sorted(stats) == ['-.ping', 'bolshoi_ballet.find', 'bolshoi_ballet.getMore']
+    find = stats['bolshoi_ballet.find']
+    assert find['count'] == 2
+    assert find['total_ms'] == 10
+    assert find['max_ms'] == 7
+    assert find['buckets'] == {'<=5ms': 1, '<=10ms': 1}
+    assert stats['-.ping']['failed'] == 1
+
+def test_command_timer_logs_slow_commands(caplog):
+    """Test that commands above the threshold are logged."""
+    timer = CommandTimer(slow_command_ms=50)
+    
+    with caplog.at_level(logging.WARNING, logger='scrapers.common.instrumentation'):
+        run_command(timer, 'update', {'update': 'boston_ballet'}, 10)
+        run_command(timer, 'update', {'update': 'boston_ballet'}, 80, request_id=2)
+    
+    assert len(caplog.records) == 1
+    assert 'update on boston_ballet' in caplog.records[0].getMessage()
+
+def test_command_timer_reset():
+    """Test that reset clears recorded statistics."""
+    timer = CommandTimer()
+    run_command(timer, 'find', {'find': 'performances'}, 1)
+    timer.reset()
+    assert timer.snapshot() == {}
+
+def test_latency_histogram_percentiles():
+    """Test that percentiles resolve to bucket upper bounds."""
+    histogram = LatencyHistogram()
+    for duration_ms in [0.5] * 90 + [30] * 9 + [9000]:
+        histogram.record(duration_ms)
+    
+    assert histogram.percentile(0.5) == 1
+    assert histogram.percentile(0.95) == 50
+    assert histogram.percentile(1.0) == 9000
+
+def test_format_command_stats_orders_by_total_time():
+    """Test that the summary line lists the most expensive commands first."""
+    timer = CommandTimer()
+    run_command(timer, 'find', {'find': 'performances'}, 2)
+    run_command(timer, 'update', {'update': 'performances'}, 40, request_id=2)
+    
+    line = format_command_stats(timer.snapshot())
+    
+    assert line.index('performances.update') < line.index('performances.find')
+    assert format_command_stats({}) == "MongoDB commands: none recorded"
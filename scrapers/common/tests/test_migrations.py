@@ -0,0 +1,91 @@
+"""
+Tests for the unified collection migration.
+"""
+
+from unittest.mock import MagicMock
+from pymongo import UpdateOne
+
+from scrapers.common.db import compute_content_hash
+from scrapers.common.migrations import migrate_to_unified_collection, backfill_normalized_fields
+from scrapers.common.storage import MemoryBackend, MongoBackend
+
+def make_db(documents_by_collection):
+    """Create a mock database whose collections hold the given documents."""
+    collections = {}
+    
+    def get_collection(name):
+        if name not in collections:
+            collection = MagicMock()
+            collection.name = name
+            collection.index_information.return_value = {'_id_': {}}
+            collection.find.return_value.__iter__.return_value = iter(documents_by_collection.get(name, []))
+            collection.bulk_write.return_value = MagicMock(matched_count=0, modified_count=0, upserted_count=1)
+            collections[name] = collection
+        return collections[name]
+    
+    db = MagicMock()
+    db.__getitem__.side_effect = get_collection
+    db.collections = collections
+    return db
+
+def test_migrate_to_unified_collection():
+    """Test that documents are copied with a company_id and their original _id."""
+    giselle = {'_id': 'abc123', 'title': 'Giselle', 'company': 'Paris Opera Ballet'}
+    db = make_db({'paris_opera_ballet': [giselle]})
+    
+    results = migrate_to_unified_collection(MongoBackend(db), company_ids=['paris_opera_ballet'])
+    
+    assert list(results) == ['paris_opera_ballet']
+    assert results['paris_opera_ballet']['inserted'] == 1
+    
+    unified = db.collections['performances']
+    unified.create_index.assert_called()
+    operation = unified.bulk_write.call_args.args[0][0]
+    document = {
+        'title': 'Giselle',
+        'company': 'Paris Opera Ballet',
+        'company_id': 'paris_opera_ballet',
+        'content_hash': compute_content_hash(giselle)
+    }
+    assert operation == UpdateOne(
+        {'company_id': 'paris_opera_ballet', 'title': 'Giselle'},
+        {'$set': document, '$setOnInsert': {'_id': 'abc123'}},
+        upsert=True
+    )
+
+def test_migrate_to_unified_collection_all_companies():
+    """Test that every company collection is migrated by default."""
+    results = migrate_to_unified_collection(MemoryBackend())
+    
+    assert sorted(results) == ['bolshoi_ballet', 'boston_ballet', 'paris_opera_ballet']
+    assert all(summary['inserted'] == 0 for summary in results.values())
+
+def test_migrate_to_unified_collection_is_idempotent():
+    """Test that re-running the migration leaves unchanged documents alone."""
+    storage = MemoryBackend()
+    storage.store_performances('bolshoi_ballet', [{'title': 'Spartacus'}, {'title': 'Giselle'}])
+    
+    first = migrate_to_unified_collection(storage, company_ids=['bolshoi_ballet'])
+    second = migrate_to_unified_collection(storage, company_ids=['bolshoi_ballet'])
+    
+    assert first['bolshoi_ballet']['inserted'] == 2
+    assert second['bolshoi_ballet'] == {'inserted': 0, 'changed': 0, 'unchanged': 2}
+    assert storage.count('performances', {'company_id': 'bolshoi_ballet'}) == 2
+
+def test_backfill_normalized_fields():
+    """Test that only documents stored before normalization are normalized, once."""
+    storage = MemoryBackend()
+    storage.store_performances('bolshoi_ballet', [{'title': 'Spartacus', 'date': '23 – 25 May 2025'}])
+    storage.store_performances('performances', [{'title': 'Giselle', 'date': 'from 28 Sep to 31 Oct 2025'}],
+                               scope={'company_id': 'paris_opera_ballet'})
+    
+    first = backfill_normalized_fields(storage)
+    second = backfill_normalized_fields(storage)
+    
+    assert first['bolshoi_ballet']['bolshoi_ballet']['changed'] == 1
+    assert first['performances']['paris_opera_ballet']['changed'] == 1
+    assert second == {}
+    spartacus = storage.find_one('bolshoi_ballet', {'title': 'Spartacus'})
+    assert (spartacus['startDate'], spartacus['endDate'], spartacus['venue']) == ('2025-05-23', '2025-05-25', 'Bolshoi Theatre')
+    giselle = storage.find_one('performances', {'title': 'Giselle'})
+    assert giselle['date_parse_method'] == 'from_to'
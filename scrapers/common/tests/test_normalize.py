@@ -0,0 +1,43 @@
+"""
+Tests for ingest-time normalization.
+"""
+
+from scrapers.common.normalize import normalize_performance, epoch_day
+
+def test_normalize_performance():
+    """Test that dates, day numbers and defaults are filled in."""
+    performance = {'title': 'Spartacus', 'date': '23 – 25 May 2025', 'thumbnail': 'spartacus.jpg'}
+    
+    normalized = normalize_performance(performance, 'bolshoi_ballet')
+    
+    assert normalized['startDate'] == '2025-05-23'
+    assert normalized['endDay'] - normalized['startDay'] == 2
+    assert normalized['startDay'] == epoch_day('2025-05-23')
+    assert normalized['image'] == 'spartacus.jpg'
+    assert normalized['venue'] == 'Bolshoi Theatre'
+    assert normalized['date_parse_method'] == 'day_range'
+    assert 'startDate' not in performance
+
+def test_normalize_performance_keeps_scraped_dates():
+    """Test that scraped dates win over a month or year fallback."""
+    performance = {'title': 'Giselle', 'date': 'Spring 2025', 'startDate': '2025-03-01', 'endDate': '2025-03-09'}
+    
+    normalized = normalize_performance(performance, 'paris_opera_ballet')
+    
+    assert (normalized['startDate'], normalized['endDate']) == ('2025-03-01', '2025-03-09')
+    assert normalized['date_parse_method'] == 'scraped'
+    assert normalized['image'] == 'placeholder.jpg'
+
+def test_epoch_day():
+    """Test day numbers and invalid dates."""
+    assert epoch_day('1970-01-02') == 1
+    assert epoch_day('not a date') is None
+    assert epoch_day(None) is None
+
+def test_normalize_performance_without_dates():
+    """Test that performances without usable dates get no date range."""
+    normalized = normalize_performance({'title': 'Gala', 'date': 'Spring'}, 'boston_ballet')
+    
+    assert 'startDate' not in normalized
+    assert (normalized['startDay'], normalized['endDay']) == (None, None)
+    assert normalized['date_parse_method'] == 'none'
@@ -0,0 +1,197 @@
+"""
+Tests for the pluggable storage backends.
+"""
+
+import os
+import pytest
+
+from scrapers.common.storage import (
+    MemoryBackend,
+    SQLiteBackend,
+    get_storage_backend
+)
+from scrapers.common.storage.base import StorageBackend
+from scrapers.common.storage.mongo import MongoBackend
+
+# MongoDB server for the tests comparing every backend; they skip the
+# MongoDB backend when it is not set
+MONGODB_TEST_URI = os.getenv('MONGODB_TEST_URI')
+
+PERFORMANCES = [
+    {'title': 'Swan Lake', 'company': 'Bolshoi Ballet', 'startDate': '2025-12-10', 'details_scraped': True},
+    {'title': 'Giselle', 'company': 'Bolshoi Ballet', 'startDate': '2025-11-02', 'details_scraped': False},
+    {'title': 'Spartacus', 'company': 'Bolshoi Ballet', 'startDate': None, 'details_scraped': True}
+]
+
+@pytest.fixture(params=['memory', 'sqlite'])
+def storage(request, tmp_path):
+    """Create an empty backend of each embedded engine."""
+    if request.param == 'memory':
+        backend = MemoryBackend()
+    else:
+        backend = SQLiteBackend(str(tmp_path / 'ballet.db'))
+    backend.ensure_indexes('bolshoi_ballet')
+    yield backend
+    backend.close()
+
+def titles(documents):
+    return [document['title'] for document in documents]
+
+def test_store_performances_summary(storage):
+    """Test that unchanged performances are skipped and changed ones merged."""
+    assert storage.store_performances('bolshoi_ballet', PERFORMANCES) == {'inserted': 3, 'changed': 0, 'unchanged': 0}
+    
+    updated = [dict(PERFORMANCES[0], venue='New Stage')] + PERFORMANCES[1:]
+    assert storage.store_performances('bolshoi_ballet', updated) == {'inserted': 0, 'changed': 1, 'unchanged': 2}
+    
+    swan_lake = storage.find_one('bolshoi_ballet', {'title': 'Swan Lake'})
+    assert swan_lake['venue'] == 'New Stage'
+    assert swan_lake['company'] == 'Bolshoi Ballet'
+    assert storage.count('bolshoi_ballet') == 3
+
+def test_data_version(storage):
+    """Test that the version stamp moves only when a performance is written."""
+    assert storage.get_data_version('bolshoi_ballet') == 0
+    
+    storage.store_performances('bolshoi_ballet', PERFORMANCES)
+    storage.store_performances('bolshoi_ballet', PERFORMANCES)
+    assert storage.get_data_version('bolshoi_ballet') == 1
+    
+    storage.store_performances('bolshoi_ballet', [dict(PERFORMANCES[0], venue='New Stage')])
+    assert storage.get_data_version('bolshoi_ballet') == 2
+    assert storage.get_data_version('boston_ballet') == 0
+
+def test_store_performances_keeps_id(storage):
+    """Test that a document keeps its _id across updates."""
+    storage.store_performances('bolshoi_ballet', [{'_id': 'abc123', 'title': 'Giselle'}])
+    storage.store_performances('bolshoi_ballet', [{'title': 'Giselle', 'venue': 'Historic Stage'}])
+    
+    assert storage.find_one('bolshoi_ballet', {'_id': 'abc123'})['venue'] == 'Historic Stage'
+
+def test_store_performances_scope(storage):
+    """Test that the same title is stored once per scope."""
+    storage.store_performances('performances', [{'title': 'Giselle'}], scope={'company_id': 'bolshoi_ballet'})
+    storage.store_performances('performances', [{'title': 'Giselle'}], scope={'company_id': 'boston_ballet'})
+    
+    assert storage.count('performances') == 2
+    assert storage.count('performances', {'company_id': 'boston_ballet'}) == 1
+
+def test_find_sort_skip_limit_projection(storage):
+    """Test sorting (missing values first), pagination and projection."""
+    storage.store_performances('bolshoi_ballet', PERFORMANCES)
+    
+    documents = list(storage.find('bolshoi_ballet', {}, {'_id': 0, 'title': 1}, sort=[('startDate', 1)]))
+    assert documents == [{'title': 'Spartacus'}, {'title': 'Giselle'}, {'title': 'Swan Lake'}]
+    
+    page = storage.find('bolshoi_ballet', sort=[('title', -1)], skip=1, limit=1)
+    assert titles(page) == ['Spartacus']
+
+@pytest.mark.parametrize('query, expected', [
+    ({'startDate': {'$gte': '2025-12-01'}}, ['Swan Lake']),
+    ({'startDate': {'$lt': '2025-12-01'}}, ['Giselle']),
+    ({'title': {'$in': ['Giselle', 'Spartacus']}}, ['Giselle', 'Spartacus']),
+    ({'title': {'$nin': ['Giselle']}}, ['Spartacus', 'Swan Lake']),
+    ({'title': {'$ne': 'Giselle'}}, ['Spartacus', 'Swan Lake']),
+    ({'details_scraped': True}, ['Spartacus', 'Swan Lake']),
+    ({'venue': {'$exists': False}}, ['Giselle', 'Spartacus', 'Swan Lake']),
+    ({'$or': [{'title': {'$regex': 'swan', '$options': 'i'}}, {'title': 'Giselle'}]}, ['Giselle', 'Swan Lake'])
+])
+def test_find_query_operators(storage, query, expected):
+    """Test that both engines evaluate the supported query operators alike."""
+    storage.store_performances('bolshoi_ballet', PERFORMANCES)
+    
+    assert titles(storage.find('bolshoi_ballet', query, sort=[('title', 1)])) == expected
+    assert storage.count('bolshoi_ballet', query) == len(expected)
+
+@pytest.fixture(params=['memory', 'sqlite', 'mongo'])
+def any_storage(request, tmp_path):
+    """Create an empty backend of each engine, MongoDB included when MONGODB_TEST_URI is set."""
+    if request.param == 'memory':
+        backend = MemoryBackend()
+    elif request.param == 'sqlite':
+        backend = SQLiteBackend(str(tmp_path / 'ballet.db'))
+    else:
+        if not MONGODB_TEST_URI:
+            pytest.skip('MONGODB_TEST_URI is not set')
+        from pymongo import MongoClient
+        client = MongoClient(MONGODB_TEST_URI, serverSelectionTimeoutMS=2000)
+        client.drop_database('ballet_storage_test')
+        backend = MongoBackend(client['ballet_storage_test'])
+    yield backend
+    if request.param == 'mongo':
+        client.drop_database('ballet_storage_test')
+        client.close()
+    else:
+        backend.close()
+
+@pytest.mark.parametrize('query, expected', [
+    ({'venue': {'$nin': ['Historic Stage']}}, ['Giselle', 'Spartacus']),
+    ({'venue': {'$nin': ['Historic Stage', None]}}, ['Spartacus'])
+])
+def test_nin_matches_missing_fields(any_storage, query, expected):
+    """Test that every backend matches documents missing the field for $nin, unless null is listed."""
+    any_storage.store_performances('bolshoi_ballet', [
+        {'title': 'Swan Lake', 'venue': 'Historic Stage'},
+        {'title': 'Giselle'},
+        {'title': 'Spartacus', 'venue': 'New Stage'}
+    ])
+    
+    assert titles(any_storage.find('bolshoi_ballet', query, sort=[('title', 1)])) == expected
+    assert any_storage.count('bolshoi_ballet', query) == len(expected)
+
+def test_text_search(storage):
+    """Test that text search stems words, ignores stop words and ranks title matches first."""
+    storage.store_performances('bolshoi_ballet', [
+        {'title': 'Swan Lake', 'startDate': '2025-12-10'},
+        {'title': 'Giselle', 'description': 'The story of the swans', 'startDate': '2025-11-02'},
+        {'title': 'Spartacus', 'description': 'A gladiator', 'startDate': None}
+    ])
+    
+    results = list(storage.text_search('bolshoi_ballet', 'the swans', sort=[('startDate', 1)]))
+    assert titles(results) == ['Swan Lake', 'Giselle']
+    assert results[0]['score'] > results[1]['score']
+    assert storage.count('bolshoi_ballet', {'$text': {'$search': 'swan'}}) == 2
+    assert titles(storage.text_search('bolshoi_ballet', 'swan', {'startDate': {'$lt': '2025-12-01'}})) == ['Giselle']
+
+def test_find_unsupported_operator(storage):
+    """Test that unsupported operators are rejected."""
+    storage.store_performances('bolshoi_ballet', PERFORMANCES)
+    with pytest.raises(ValueError):
+        list(storage.find('bolshoi_ballet', {'title': {'$where': 'true'}}))
+
+def test_incomplete_backend_fails_on_creation():
+    """Test that a backend missing an abstract method cannot be created."""
+    class IncompleteBackend(StorageBackend):
+        name = 'incomplete'
+        
+        def find(self, collection_name, query=None, projection=None, sort=None, skip=0, limit=0):
+            return iter([])
+    
+    with pytest.raises(TypeError, match='count'):
+        IncompleteBackend()
+
+def test_sqlite_rejects_unsafe_names(tmp_path):
+    """Test that collection and field names cannot inject SQL."""
+    storage = SQLiteBackend(str(tmp_path / 'ballet.db'))
+    with pytest.raises(ValueError):
+        storage.count('performances; DROP TABLE performances')
+    with pytest.raises(ValueError):
+        storage.count('performances', {"title') OR 1=1 --": 'x'})
+    storage.close()
+
+def test_sqlite_persists_across_connections(tmp_path):
+    """Test that stored documents survive reopening the database."""
+    path = str(tmp_path / 'ballet.db')
+    storage = SQLiteBackend(path)
+    storage.store_performances('bolshoi_ballet', PERFORMANCES)
+    storage.close()
+    
+    storage = SQLiteBackend(path)
+    assert storage.count('bolshoi_ballet') == 3
+    storage.close()
+
+def test_get_storage_backend():
+    """Test that backends are shared per engine and unknown engines are rejected."""
+    assert get_storage_backend('memory') is get_storage_backend('memory')
+    with pytest.raises(ValueError):
+        get_storage_backend('cassandra')
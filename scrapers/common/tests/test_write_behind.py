@@ -0,0 +1,115 @@
+"""
+Tests for the write-behind persistence queue.
+"""
+
+import time
+import threading
+import pytest
+from unittest.mock import patch
+
+from scrapers.common.storage import MemoryBackend
+from scrapers.common.write_behind import WriteBehindQueue, store_batch
+
+class RecordingStore:
+    """Store callable that records every batch it is given."""
+    
+    def __init__(self, result=None, delay=0):
+        self.batches = []
+        self.result = result
+        self.delay = delay
+        self.lock = threading.Lock()
+    
+    def __call__(self, batch):
+        time.sleep(self.delay)
+        with self.lock:
+            self.batches.append([performance['title'] for performance in batch])
+        if self.result is not None:
+            return self.result
+        return {'inserted': len(batch), 'changed': 0, 'unchanged': 0}
+
+def make_performance(i):
+    """Build a minimal performance dictionary."""
+    return {'title': f'Performance {i}'}
+
+def test_flushes_on_batch_size():
+    """Test that a full batch is written without waiting for close."""
+    store = RecordingStore()
+    writer = WriteBehindQueue(store, batch_size=2, flush_interval=60)
+    for i in range(2):
+        writer.put(make_performance(i))
+    
+    deadline = time.monotonic() + 2
+    while not store.batches and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert store.batches == [['Performance 0', 'Performance 1']]
+    writer.close()
+
+def test_flushes_on_interval():
+    """Test that a partial batch is written once the flush interval passes."""
+    store = RecordingStore()
+    writer = WriteBehindQueue(store, batch_size=100, flush_interval=0.05)
+    writer.put(make_performance(0))
+    
+    deadline = time.monotonic() + 2
+    while not store.batches and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert store.batches == [['Performance 0']]
+    writer.close()
+
+def test_flush_waits_for_pending_records():
+    """Test that flush returns only after every queued record is stored."""
+    store = RecordingStore(delay=0.05)
+    writer = WriteBehindQueue(store, batch_size=100, flush_interval=60)
+    for i in range(3):
+        writer.put(make_performance(i))
+    
+    writer.flush()
+    assert store.batches == [['Performance 0', 'Performance 1', 'Performance 2']]
+    writer.close()
+
+def test_close_returns_summary():
+    """Test that close writes the remainder and totals every batch."""
+    store = RecordingStore()
+    with WriteBehindQueue(store, batch_size=2, flush_interval=60) as writer:
+        for i in range(5):
+            writer.put(make_performance(i))
+    
+    assert [len(batch) for batch in store.batches] == [2, 2, 1]
+    assert writer.summary['inserted'] == 5
+    assert writer.summary['batches'] == 3
+    assert writer.summary['failed'] == 0
+
+def test_failed_batches_are_counted():
+    """Test that a store failure is reported instead of stopping the writer."""
+    def failing_store(batch):
+        raise Exception("connection lost")
+    
+    writer = WriteBehindQueue(failing_store, batch_size=1, flush_interval=60)
+    writer.put(make_performance(0))
+    writer.put(make_performance(1))
+    summary = writer.close()
+    
+    assert summary['failed'] == 2
+    assert summary['inserted'] == 0
+
+def test_put_after_close_raises():
+    """Test that a closed queue rejects new records."""
+    writer = WriteBehindQueue(RecordingStore())
+    writer.close()
+    with pytest.raises(RuntimeError):
+        writer.put(make_performance(0))
+
+
+def test_store_batch():
+    """Test that batches are normalized and mirrored into the unified collection."""
+    storage = MemoryBackend()
+    performances = [{'title': 'Spartacus', 'date': '23 – 25 May 2025'}]
+    
+    with patch('scrapers.common.write_behind.UNIFIED_COLLECTION_ENABLED', True):
+        summary = store_batch(storage, performances, 'bolshoi_ballet', 'bolshoi_ballet')
+    
+    assert summary['inserted'] == 1
+    stored = next(storage.find('bolshoi_ballet'))
+    assert stored['startDate'] == '2025-05-23'
+    assert stored['venue'] == 'Bolshoi Theatre'
+    assert next(storage.find('performances'))['company_id'] == 'bolshoi_ballet'
@@ -18,6 +18,8 @@ from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 
+from scrapers.common.dates import parse_performance_dates
+
 # Configure logging
 logger = logging.getLogger(__name__)
 
@@ -140,6 +142,10 @@ def parse_date_range(date_str):
     """
     Parse a date range string into start and end dates.
     
+    When no exact pattern matches, the month or year named in the string is
+    spanned instead (see scrapers.common.dates.parse_performance_dates);
+    normalization records such ranges with their date_parse_method.
+    
     Args:
         date_str (str): Date range string
         
@@ -149,106 +155,13 @@ def parse_date_range(date_str):
     if not date_str:
         return None, None
     
-    # Try different date range patterns
-    
-    # Pattern: "from 28 Sep to 31 Oct 2025"
-    pattern1 = r'from\s+(\d+\s+[A-Za-z]+)\s+to\s+(\d+\s+[A-Za-z]+\s+\d{4})'
-    match1 = re.search(pattern1, date_str)
-    if match1:
-        start_date_str = match1.group(1)
-        end_date_str = match1.group(2)
-        
-        # Extract year from end date
-        year_match = re.search(r'\d{4}', end_date_str)
-        if year_match:
-            year = year_match.group(0)
-            # Add year to start date if missing
-            if not re.search(r'\d{4}', start_date_str):
-                start_date_str = f"{start_date_str} {year}"
-        
-        try:
-            # Try different date formats
-            for fmt in ["%d %B %Y", "%d %b %Y"]:
-                try:
-                    start_date = datetime.strptime(start_date_str, fmt)
-                    end_date = datetime.strptime(end_date_str, fmt)
-                    return start_date, end_date
-                except ValueError:
-                    continue
-        except Exception as e:
-            logger.error(f"Error parsing date range '{date_str}': {str(e)}")
-    
-    # Pattern: "from 01 to 31 Dec 2025"
-    pattern2 = r'from\s+(\d+)\s+to\s+(\d+\s+[A-Za-z]+\s+\d{4})'
-    match2 = re.search(pattern2, date_str)
-    if match2:
-        end_date_str = match2.group(2)
-        month_match = re.search(r'([A-Za-z]+)', end_date_str)
-        if month_match:
-            month = month_match.group(1)
-            start_date_str = f"{match2.group(1)} {month}"
-            # Extract year and add to start date
-            year_match = re.search(r'(\d{4})', end_date_str)
-            if year_match:
-                year = year_match.group(1)
-                start_date_str = f"{start_date_str} {year}"
-                
-                try:
-                    # Try different date formats
-                    for fmt in ["%d %B %Y", "%d %b %Y"]:
-                        try:
-                            start_date = datetime.strptime(start_date_str, fmt)
-                            end_date = datetime.strptime(end_date_str, fmt)
-                            return start_date, end_date
-                        except ValueError:
-                            continue
-                except Exception as e:
-                    logger.error(f"Error parsing date range '{date_str}': {str(e)}")
-    
-    # Pattern: "23 – 25 May 2025" (Bolshoi format)
-    pattern3 = r'(\d+)\s*[–-]\s*(\d+)\s+([A-Za-z]+)\s+(\d{4})'
-    match3 = re.search(pattern3, date_str)
-    if match3:
-        day_start = match3.group(1)
-        day_end = match3.group(2)
-        month = match3.group(3)
-        year = match3.group(4)
-        
-        try:
-            start_date_str = f"{day_start} {month} {year}"
-            end_date_str = f"{day_end} {month} {year}"
-            
-            for fmt in ["%d %B %Y", "%d %b %Y"]:
-                try:
-                    start_date = datetime.strptime(start_date_str, fmt)
-                    end_date = datetime.strptime(end_date_str, fmt)
-                    return start_date, end_date
-                except ValueError:
-                    continue
-        except Exception as e:
-            logger.error(f"Error parsing Bolshoi date range '{date_str}': {str(e)}")
-    
-    # Pattern: "19 September 2024 – 23 March 2025" (full date range)
-    pattern4 = r'(\d+\s+[A-Za-z]+\s+\d{4})\s*[–-]\s*(\d+\s+[A-Za-z]+\s+\d{4})'
-    match4 = re.search(pattern4, date_str)
-    if match4:
-        start_date_str = match4.group(1)
-        end_date_str = match4.group(2)
-        
-        try:
-            for fmt in ["%d %B %Y", "%d %b %Y"]:
-                try:
-                    start_date = datetime.strptime(start_date_str, fmt)
-                    end_date = datetime.strptime(end_date_str, fmt)
-                    return start_date, end_date
-                except ValueError:
-                    continue
-        except Exception as e:
-            logger.error(f"Error parsing full date range '{date_str}': {str(e)}")
-    
-    # If all patterns fail, return None
-    logger.warning(f"Could not parse date range: {date_str}")
-    return None, None
+    result = parse_performance_dates(date_str)
+    if result.start is None:
+        logger.warning(f"Could not parse date range: {date_str}")
+        return None, None
+    if not result.exact:
+        logger.warning(f"Approximate date range ({result.method}) for: {date_str}")
+    return datetime.combine(result.start, datetime.min.time()), datetime.combine(result.end, datetime.min.time())
 
 def clean_html(text):
     """
@@ -0,0 +1,201 @@
+"""
+Write-behind persistence for ballet scrapers.
+
+Scrapers push each performance to a WriteBehindQueue as soon as it is
+scraped. A background thread groups the records into batches and writes
+them when a size or time threshold is reached, so fetching pages and
+writing to the database overlap instead of running one after the other.
+"""
+
+import os
+import time
+import queue
+import logging
+import threading
+from dotenv import load_dotenv
+
+from scrapers.common.db import PERFORMANCES_COLLECTION, UNIFIED_COLLECTION_ENABLED, BULK_WRITE_BATCH_SIZE
+from scrapers.common.normalize import normalize_performances
+
+# Load environment variables
+load_dotenv()
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+# Flush thresholds for the background writer
+WRITE_BEHIND_BATCH_SIZE = int(os.getenv('WRITE_BEHIND_BATCH_SIZE', 20))
+WRITE_BEHIND_FLUSH_INTERVAL = float(os.getenv('WRITE_BEHIND_FLUSH_INTERVAL', 5))
+
+# Maximum number of records waiting to be written before put() blocks
+WRITE_BEHIND_MAX_PENDING = int(os.getenv('WRITE_BEHIND_MAX_PENDING', 200))
+
+# Control messages placed on the queue alongside performances
+_FLUSH = object()
+_STOP = object()
+
+class WriteBehindQueue:
+    """
+    Buffer performances and write them in batches from a background thread.
+    
+    The store callable is called as store(batch) and must return a summary
+    dictionary like store_performances does ('inserted', 'changed',
+    'unchanged'), or None if the batch could not be written.
+    
+    Usage:
+        with WriteBehindQueue(lambda batch: store_performances(collection, batch)) as writer:
+            for performance in scrape():
+                writer.put(performance)
+        summary = writer.summary
+    """
+    
+    def __init__(self, store, batch_size=WRITE_BEHIND_BATCH_SIZE,
+                 flush_interval=WRITE_BEHIND_FLUSH_INTERVAL, max_pending=WRITE_BEHIND_MAX_PENDING):
+        """
+        Start the background writer.
+        
+        Args:
+            store (callable): Function that writes a list of performances
+            batch_size (int, optional): Write as soon as this many records are buffered
+            flush_interval (float, optional): Write buffered records after this many seconds
+            max_pending (int, optional): Maximum queued records before put() blocks
+        """
+        self.store = store
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.summary = {'inserted': 0, 'changed': 0, 'unchanged': 0, 'failed': 0, 'batches': 0}
+        
+        self._queue = queue.Queue(maxsize=max_pending)
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, name="WriteBehind", daemon=True)
+        self._thread.start()
+    
+    def put(self, performance):
+        """
+        Queue a performance for writing.
+        
+        Blocks while max_pending records are already waiting, which slows the
+        scraper down to the speed of the database.
+        
+        Args:
+            performance (dict): Performance dictionary
+        
+        Raises:
+            RuntimeError: If the queue has been closed
+        """
+        if self._closed:
+            raise RuntimeError("Cannot put to a closed write-behind queue")
+        self._queue.put(performance)
+    
+    def flush(self):
+        """
+        Write every queued record and wait until they are stored.
+        """
+        self._queue.put(_FLUSH)
+        self._queue.join()
+    
+    def close(self):
+        """
+        Flush remaining records and stop the background thread.
+        
+        Returns:
+            dict: Totals of 'inserted', 'changed', 'unchanged' and 'failed'
+                  records and the number of 'batches' written
+        """
+        if not self._closed:
+            self._closed = True
+            self._queue.put(_STOP)
+            self._thread.join()
+        return self.summary
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+        return False
+    
+    def _run(self):
+        """
+        Background loop: collect records and write them on size, time or request.
+        """
+        batch = []
+        deadline = None
+        
+        while True:
+            timeout = None if deadline is None else max(0, deadline - time.monotonic())
+            try:
+                item = self._queue.get(timeout=timeout)
+            except queue.Empty:
+                item = None
+            
+            if item is _FLUSH or item is _STOP:
+                self._write(batch)
+                batch, deadline = [], None
+                self._queue.task_done()
+                if item is _STOP:
+                    return
+                continue
+            
+            if item is not None:
+                batch.append(item)
+                if deadline is None:
+                    deadline = time.monotonic() + self.flush_interval
+            
+            if len(batch) >= self.batch_size or (deadline is not None and time.monotonic() >= deadline):
+                self._write(batch)
+                batch, deadline = [], None
+    
+    def _write(self, batch):
+        """
+        Write one batch and mark its records as done.
+        """
+        if not batch:
+            return
+        
+        self.summary['batches'] += 1
+        try:
+            summary = self.store(batch)
+            if summary is None:
+                self.summary['failed'] += len(batch)
+            else:
+                for key in ('inserted', 'changed', 'unchanged'):
+                    self.summary[key] += summary.get(key, 0)
+        except Exception as e:
+            logger.error(f"Write-behind batch failed: {str(e)}")
+            self.summary['failed'] += len(batch)
+        logger.info(f"Write-behind flushed {len(batch)} performances")
+        
+        for _ in batch:
+            self._queue.task_done()
+
+def store_batch(storage, performances, company_id, collection_name, batch_size=BULK_WRITE_BATCH_SIZE):
+    """
+    Store a batch of performances, mirroring it into the unified collection when enabled.
+    
+    Scrapers pass this to their WriteBehindQueue as the store callable.
+    
+    Args:
+        storage (StorageBackend): Storage backend
+        performances (list): List of performance dictionaries
+        company_id (str): Company ID, e.g. 'paris_opera_ballet'
+        collection_name (str): Name of the company's collection
+        batch_size (int, optional): Number of operations per bulk write
+    
+    Returns:
+        dict: Summary from store_performances, or None if storing failed
+    """
+    # Parse dates and fill in defaults once, before storing
+    performances = normalize_performances(performances, company_id)
+    
+    # Store performances, skipping unchanged records
+    summary = storage.store_performances(collection_name, performances, batch_size=batch_size)
+    
+    # Mirror into the unified collection when it is enabled
+    if summary is not None and UNIFIED_COLLECTION_ENABLED:
+        summary = storage.store_performances(
+            PERFORMANCES_COLLECTION, performances, batch_size=batch_size,
+            scope={'company_id': company_id}
+        )
+    
+    return summary
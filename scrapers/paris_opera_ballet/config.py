@@ -14,10 +14,14 @@ load_dotenv()
 # Base URL for the Paris Opera Ballet website
 BASE_URL = "https://www.operadeparis.fr/en/season-and-tickets/ballet"
 
+# Company ID, used as the discriminator in the unified performances collection
+COMPANY_ID = 'paris_opera_ballet'
+
 # MongoDB settings
 MONGO_URI = os.getenv('MONGODB_URI')
 DATABASE_NAME = os.getenv('DATABASE_NAME')
 COLLECTION_NAME = os.getenv('COLLECTION_NAME', 'paris_opera_ballet')
+BULK_WRITE_BATCH_SIZE = int(os.getenv('BULK_WRITE_BATCH_SIZE', 500))
 
 # Scraping settings
 IMPLICIT_WAIT = 10  # seconds
@@ -62,13 +62,6 @@ def mock_detail_driver():
     driver.page_source = SAMPLE_DETAIL_HTML
     return driver
 
-@pytest.fixture
-def mock_collection():
-    """Create a mock MongoDB collection."""
-    collection = MagicMock()
-    collection.update_one.return_value = MagicMock()
-    return collection
-
 def test_scrape_main_page(mock_driver):
     """Test scraping the main page."""
     performances = scrape_main_page(mock_driver)
@@ -116,14 +109,13 @@ def test_add_default_descriptions():
     assert updated_performances[2]['description'] == ''  # No default available
 
 @patch('scrapers.paris_opera_ballet.scraper.setup_selenium_driver')
-@patch('scrapers.paris_opera_ballet.scraper.get_collection')
-@patch('scrapers.paris_opera_ballet.scraper.store_performances')
-def test_main_scrape(mock_store, mock_get_collection, mock_setup_driver, mock_driver, mock_collection):
+@patch('scrapers.paris_opera_ballet.scraper.get_storage_backend')
+def test_main_scrape(mock_get_storage_backend, mock_setup_driver, mock_driver):
     """Test the main scraping function."""
     # Set up mocks
     mock_setup_driver.return_value = mock_driver
-    mock_get_collection.return_value = mock_collection
-    mock_store.return_value = True
+    mock_storage = mock_get_storage_backend.return_value
+    mock_storage.store_performances.return_value = {'inserted': 2, 'changed': 0, 'unchanged': 0}
     
     # Mock the individual page scraping
     with patch('scrapers.paris_opera_ballet.scraper.scrape_individual_page') as mock_scrape_individual:
@@ -140,11 +132,11 @@ def test_main_scrape(mock_store, mock_get_collection, mock_setup_driver, mock_dr
         # Check that the function returned success
         assert result is True
         
-        # Check that the collection was retrieved
-        mock_get_collection.assert_called_once()
+        # Check that the storage backend was retrieved
+        mock_get_storage_backend.assert_called_once()
         
         # Check that performances were stored
-        mock_store.assert_called_once()
+        mock_storage.store_performances.assert_called_once()
         
         # Check that individual pages were scraped
         assert mock_scrape_individual.call_count == 2
@@ -8,9 +8,10 @@ from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from bs4 import BeautifulSoup
-from pymongo import MongoClient
 from dotenv import load_dotenv
 
+from scrapers.common.db import get_collection, update_performance
+
 # Setup logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
@@ -18,9 +19,7 @@ logger = logging.getLogger(__name__)
 # Load environment variables
 load_dotenv()
 
-# MongoDB connection settings
-MONGODB_URI = os.getenv('MONGODB_URI')
-DATABASE_NAME = os.getenv('DATABASE_NAME')
+# MongoDB collection settings
 COLLECTION_NAME = os.getenv('COLLECTION_NAME')
 
 # List of ballet URLs to update
@@ -236,10 +235,8 @@ def update_database(url, description):
         return False
     
     try:
-        # Connect to MongoDB
-        client = MongoClient(MONGODB_URI)
-        db = client[DATABASE_NAME]
-        collection = db[COLLECTION_NAME]
+        # Reuse the pooled MongoDB connection
+        collection = get_collection(COLLECTION_NAME)
         
         # Find the performance by URL
         performance = collection.find_one({'url': url})
@@ -249,13 +246,10 @@ def update_database(url, description):
             return False
         
         # Update the description
-        result = collection.update_one(
-            {'url': url},
-            {'$set': {
-                'description': description,
-                'last_updated': time.strftime('%Y-%m-%d %H:%M:%S')
-            }}
-        )
+        result = update_performance(collection, {'url': url}, {
+            'description': description,
+            'last_updated': time.strftime('%Y-%m-%d %H:%M:%S')
+        })
         
         if result.modified_count > 0:
             logger.info("Database updated successfully")
@@ -271,10 +265,8 @@ def update_database(url, description):
 def verify_database_update(url):
     """Verify that the database was updated with the new description"""
     try:
-        # Connect to MongoDB
-        client = MongoClient(MONGODB_URI)
-        db = client[DATABASE_NAME]
-        collection = db[COLLECTION_NAME]
+        # Reuse the pooled MongoDB connection
+        collection = get_collection(COLLECTION_NAME)
         
         # Find the performance by URL
         performance = collection.find_one({'url': url})